@@ -0,0 +1,381 @@
+"""Quiz motorunun önünde hafif, asenkron HTTP JSON API'si (yalnızca standart kütüphane)
+
+    python api_server.py --host 127.0.0.1 --port 8080
+
+    GET  /question?test=en_tr&hard=1     → soru (id, metin, seçenekler)
+    POST /answer   {"id": ..., "choice": ...}
+    POST /words    {"en": ..., "tr": ...}
+    GET  /words?filter=Tümü&sort=En Yeni&q=...&offset=0&limit=20
+    GET  /stats
+
+Streamlit arayüzüyle aynı veri dosyalarını ve ortam değişkenlerini kullanır
+(data_files.py). Çok kullanıcılı modda (AKADEMI_USERS_DIR) her istekte
+?user=<kimlik> verilmelidir; kimlik bir kimlik doğrulama değildir.
+
+Sunucu varsayılan olarak yalnızca 127.0.0.1'i dinler. --token (veya
+AKADEMI_API_TOKEN) verilirse her istek "Authorization: Bearer <token>" başlığı
+taşımalıdır; yerel olmayan bir adreste token olmadan başlatılmaz.
+"""
+import argparse
+import asyncio
+import ipaddress
+import json
+import os
+import secrets
+import sys
+from collections import OrderedDict
+from datetime import datetime
+from urllib.parse import parse_qsl, urlsplit
+
+from base_vocabulary import BaseVocabulary
+from clock import ClockService, world_time_source
+from data_files import (BASE_VOCABULARY_FILE, MAX_ACTIVE_USERS, QUIZ_SEED, SHEETS_DIRTY_FILE, SHEETS_STATE_FILE,
+                        USER_ID_PATTERN, USERS_DIR, load_data, open_storage)
+from quiz import QuestionGenerator
+from quiz_engine import QuizEngine
+from scoring import DAILY_TEST_GOAL, GOAL_TEST_TYPES, can_earn_points
+from sheets_sync import SheetChangeTracker
+from shared_data import SharedDataCache, UserDataRegistry
+from stats import ROLLING_WINDOWS, DailyStats
+from word_list import WORD_FILTERS, WORD_SORTS, WordQueryEngine
+
+TEST_TYPES = ("en_tr", "tr_en", "tekrar", "yanlis")
+MAX_PENDING_QUESTIONS = 1000
+MAX_HEADER_BYTES = 16 * 1024
+MAX_BODY_BYTES = 1024 * 1024
+MAX_PAGE_SIZE = 500
+KEEPALIVE_TIMEOUT = 30
+REASONS = {200: "OK", 201: "Created", 400: "Bad Request", 401: "Unauthorized", 404: "Not Found",
+           405: "Method Not Allowed", 409: "Conflict", 413: "Payload Too Large", 500: "Internal Server Error"}
+
+
+class ApiError(Exception):
+    """İstemciye durum koduyla dönecek hata"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class Learner:
+    """Bir öğrencinin bellekteki verisi, quiz motoru ve cevap bekleyen soruları
+
+    sheet_tracker verilirse eklenen ve yanlış cevaplanan kelimeler, Streamlit
+    arayüzündeki gibi bir sonraki Google Sheets senkronizasyonu için işaretlenir.
+    """
+
+    def __init__(self, storage, base=None, clock=None, json_storage=None, sheet_tracker=None):
+        self.storage = storage
+        self.sheet_tracker = sheet_tracker
+        self.json_storage = json_storage
+        self.base = base
+        self.clock = clock
+        self.shared_data = SharedDataCache(storage)
+        self.generator = QuestionGenerator(int(QUIZ_SEED) if QUIZ_SEED else None)
+        self.engine = None
+        self.pending = OrderedDict()
+        self.word_query = WordQueryEngine()
+        self.daily_stats = None
+
+    def now(self):
+        return self.clock.now() if self.clock is not None else datetime.now()
+
+    def current(self):
+        """Güncel motor: başka süreç dosyaları değiştirdiyse yeniden yüklenir, gün değiştiyse devredilir"""
+        today = self.now().date()
+        with self.shared_data.lock:
+            kelimeler, score_data, reloaded = self.shared_data.get(
+                lambda: load_data(self.storage, self.json_storage, self.base, today.strftime("%Y-%m-%d")))
+            if reloaded or self.engine is None:
+                self.engine = QuizEngine(kelimeler, score_data, today, generator=self.generator,
+                                         lock=self.shared_data.lock, save=self.save, now=self.now)
+                self.pending.clear()
+            if self.engine.today != today or score_data.get("last_check_date") != self.engine.today_str:
+                self.engine.start_day(today)
+            return self.engine
+
+    def save(self, record):
+        """Motorun ürettiği kaydı depoya yaz (QuizEngine kilit altında çağırır)"""
+        revision = self.shared_data.revision
+        new_revision = self.shared_data.bump()
+        if self.daily_stats is not None and self.daily_stats.revision == revision:
+            for date_str in record.get("d", {}):
+                self.daily_stats.observe(date_str, self.engine.score_data["daily"][date_str])
+            self.daily_stats.revision = new_revision
+        self.storage.save_record(record, self.engine.kelimeler, self.engine.score_data)
+
+    # --- uç noktalar (iş parçacığında çalışır) ---
+
+    def question(self, params, body):
+        test_type = params.get("test", "en_tr")
+        if test_type not in TEST_TYPES:
+            raise ApiError(400, f"Geçersiz test türü: {test_type}")
+        engine = self.current()
+        question = engine.next_question(test_type, hard=params.get("hard") in ("1", "true"))
+        if question is None:
+            raise ApiError(404, "Sorulacak kelime yok")
+        with self.shared_data.lock:
+            question_id = secrets.token_urlsafe(12)
+            self.pending[question_id] = question
+            while len(self.pending) > MAX_PENDING_QUESTIONS:
+                self.pending.popitem(last=False)
+            return 200, {"id": question_id, "test_type": test_type, "question_text": question["question_text"],
+                         "secenekler": question["secenekler"], "age_days": engine.age_days(question["soru"]),
+                         "can_earn_points": can_earn_points(engine.score_data, test_type)}
+
+    def answer(self, params, body):
+        if not isinstance(body.get("id"), str) or "choice" not in body:
+            raise ApiError(400, "'id' ve 'choice' alanları gerekli")
+        engine = self.current()
+        with self.shared_data.lock:
+            question = self.pending.pop(body["id"], None)
+            if question is None:
+                raise ApiError(404, "Soru bulunamadı veya zaten cevaplandı")
+            result = engine.answer(question, body["choice"])
+            if not result["correct"] and self.sheet_tracker is not None:
+                self.sheet_tracker.mark(question["soru"]["en"])
+            return 200, {"correct": result["correct"], "dogru": result["dogru"], "points": result["points"],
+                         "combo_penalty": result["combo_penalty"], "review": result["review"],
+                         "message": result["message"], "score": engine.score_data["score"]}
+
+    def add_word(self, params, body):
+        en, tr = body.get("en"), body.get("tr")
+        if not isinstance(en, str) or not isinstance(tr, str) or not en.strip() or not tr.strip():
+            raise ApiError(400, "'en' ve 'tr' alanları boş olamaz")
+        engine = self.current()
+        with self.shared_data.lock:
+            word = engine.add_word(en, tr)
+            if word is None:
+                raise ApiError(409, "Bu kelime zaten mevcut")
+            if self.sheet_tracker is not None:
+                self.sheet_tracker.mark(word["en"])
+            return 201, {"word": dict(word), "score": engine.score_data["score"],
+                         "yeni_kelime": engine.score_data["daily"][engine.today_str]["yeni_kelime"]}
+
+    def list_words(self, params, body):
+        filtre = params.get("filter", WORD_FILTERS[0])
+        siralama = params.get("sort", WORD_SORTS[0])
+        if filtre not in WORD_FILTERS or siralama not in WORD_SORTS:
+            raise ApiError(400, f"filter {WORD_FILTERS} ve sort {WORD_SORTS} değerlerinden biri olmalı")
+        try:
+            offset = max(0, int(params.get("offset", 0)))
+            limit = min(MAX_PAGE_SIZE, max(1, int(params.get("limit", 20))))
+        except ValueError:
+            raise ApiError(400, "offset ve limit tam sayı olmalı")
+        engine = self.current()
+        with self.shared_data.lock:
+            total, words = self.word_query.query(engine.kelimeler, self.shared_data.revision, filtre, siralama,
+                                                 params.get("q", ""), engine.today, engine.wrong_index, offset, limit)
+            return 200, {"total": total, "offset": offset, "words": [dict(word) for word in words]}
+
+    def stats(self, params, body):
+        engine = self.current()
+        with self.shared_data.lock:
+            score_data = engine.score_data
+            daily_stats = self.daily_stats
+            if daily_stats is None or daily_stats.revision != self.shared_data.revision \
+                    or daily_stats.today != engine.today:
+                daily_stats = self.daily_stats = DailyStats()
+                daily_stats.build(score_data["daily"], engine.today)
+                daily_stats.revision = self.shared_data.revision
+            return 200, {
+                "score": score_data["score"],
+                "words": len(engine.kelimeler),
+                "wrong_words": len(score_data.get("wrong_words_list", [])),
+                "today": dict(score_data["daily"].get(engine.today_str, {})),
+                "goals": {test_type: {"answered": score_data.get(f"{test_type}_answered", 0),
+                                      "target": DAILY_TEST_GOAL} for test_type in GOAL_TEST_TYPES},
+                "correct_streak": score_data.get("correct_streak", 0),
+                "wrong_streak": score_data.get("wrong_streak", 0),
+                "combo_multiplier": score_data.get("combo_multiplier", 1.0),
+                "accuracy": round(daily_stats.accuracy(), 2),
+                "daily_mean": round(daily_stats.daily_mean(), 2),
+                "rolling_mean": {str(window): round(daily_stats.rolling_mean(window), 2) for window in ROLLING_WINDOWS},
+                "active_days": daily_stats.active_days,
+            }
+
+
+ROUTES = {
+    "/question": {"GET": Learner.question},
+    "/answer": {"POST": Learner.answer},
+    "/words": {"GET": Learner.list_words, "POST": Learner.add_word},
+    "/stats": {"GET": Learner.stats},
+}
+
+
+class ApiServer:
+    """asyncio üzerinde HTTP/1.1 (keep-alive) JSON sunucusu
+
+    Bağlantılar olay döngüsünde eşzamanlı okunur; her istek varsayılan iş
+    parçacığı havuzunda çalışır, veri değişiklikleri öğrencinin veri kilidiyle
+    sıralanır. Böylece günlüğe yazma (fsync) diğer bağlantıları bekletmez.
+    """
+
+    def __init__(self, users_dir=None, data_dir=".", clock=None, token=None):
+        self.users_dir = users_dir
+        self.clock = clock
+        self.token = token
+        self.base = BaseVocabulary.load(BASE_VOCABULARY_FILE) if users_dir else None
+        self.registry = UserDataRegistry(MAX_ACTIVE_USERS)
+        self.single = None if users_dir else self._learner(data_dir, None)
+
+    def _learner(self, directory, base):
+        json_storage, storage = open_storage(directory, base)
+        path = lambda name: os.path.join(directory, name)
+        return Learner(storage, base, self.clock, json_storage,
+                       SheetChangeTracker(path(SHEETS_STATE_FILE), path(SHEETS_DIRTY_FILE)))
+
+    def authorized(self, headers):
+        """Token verilmişse isteğin Authorization başlığı eşleşmeli"""
+        if self.token is None:
+            return True
+        return secrets.compare_digest(headers.get("authorization", "").encode("utf-8"),
+                                      f"Bearer {self.token}".encode("utf-8"))
+
+    def learner(self, params):
+        if self.single is not None:
+            return self.single
+        user_id = params.get("user", "")
+        if not USER_ID_PATTERN.fullmatch(user_id):
+            raise ApiError(400, "Geçerli bir 'user' parametresi gerekli")
+        return self.registry.get(user_id, self._open_learner)
+
+    def _open_learner(self, user_id):
+        directory = os.path.join(self.users_dir, user_id)
+        os.makedirs(directory, exist_ok=True)
+        return self._learner(directory, self.base)
+
+    def dispatch(self, method, target, body):
+        """(durum, yanıt sözlüğü); iş parçacığında çalışır"""
+        url = urlsplit(target)
+        methods = ROUTES.get(url.path.rstrip("/") or "/")
+        if methods is None:
+            raise ApiError(404, f"Bilinmeyen adres: {url.path}")
+        handler = methods.get(method)
+        if handler is None:
+            raise ApiError(405, f"{url.path} için izin verilen yöntemler: {', '.join(methods)}")
+        params = dict(parse_qsl(url.query))
+        if body:
+            try:
+                body = json.loads(body)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                raise ApiError(400, "Gövde geçerli JSON değil")
+            if not isinstance(body, dict):
+                raise ApiError(400, "Gövde JSON nesnesi olmalı")
+        else:
+            body = {}
+        return handler(self.learner(params), params, body)
+
+    async def handle(self, reader, writer):
+        """Tek bağlantı: istekleri sırayla oku ve yanıtla"""
+        try:
+            while True:
+                try:
+                    request = await asyncio.wait_for(read_request(reader), KEEPALIVE_TIMEOUT)
+                except asyncio.TimeoutError:
+                    break
+                except ApiError as e:
+                    writer.write(encode_response(e.status, {"error": e.message}, False))
+                    break
+                if request is None:
+                    break
+                method, target, headers, body = request
+                try:
+                    if not self.authorized(headers):
+                        raise ApiError(401, "Geçerli bir 'Authorization: Bearer <token>' başlığı gerekli")
+                    status, payload = await asyncio.to_thread(self.dispatch, method, target, body)
+                except ApiError as e:
+                    status, payload = e.status, {"error": e.message}
+                except Exception as e:
+                    print(f"{method} {target}: {e!r}", file=sys.stderr)
+                    status, payload = 500, {"error": "Sunucu hatası"}
+                keep_alive = headers.get("connection", "").lower() != "close"
+                writer.write(encode_response(status, payload, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host, port):
+        server = await asyncio.start_server(self.handle, host, port, limit=MAX_HEADER_BYTES)
+        addresses = ", ".join(str(sock.getsockname()) for sock in server.sockets)
+        print(f"Akademi API dinleniyor: {addresses}")
+        async with server:
+            await server.serve_forever()
+
+
+async def read_request(reader):
+    """(yöntem, hedef, başlıklar, gövde); bağlantı kapandıysa None"""
+    try:
+        head = await reader.readuntil(b"\r\n\r\n")
+    except asyncio.IncompleteReadError as e:
+        if not e.partial.strip():
+            return None
+        raise ApiError(400, "Yarım istek")
+    except asyncio.LimitOverrunError:
+        raise ApiError(400, "Başlıklar çok uzun")
+    lines = head.decode("latin-1").split("\r\n")
+    parts = lines[0].split()
+    if len(parts) != 3 or not parts[2].startswith("HTTP/1."):
+        raise ApiError(400, "Geçersiz istek satırı")
+    headers = {}
+    for line in lines[1:]:
+        if line:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+    if parts[2] == "HTTP/1.0" and headers.get("connection", "").lower() != "keep-alive":
+        headers["connection"] = "close"
+    try:
+        length = int(headers.get("content-length", 0))
+    except ValueError:
+        raise ApiError(400, "Geçersiz Content-Length")
+    if length > MAX_BODY_BYTES:
+        raise ApiError(413, "Gövde çok büyük")
+    body = await reader.readexactly(length) if length > 0 else b""
+    return parts[0].upper(), parts[1], headers, body
+
+
+def encode_response(status, payload, keep_alive):
+    body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    head = (f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+            "Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+    return head.encode("latin-1") + body
+
+
+def is_loopback(host):
+    """Adres yalnızca bu makineden erişilebilir mi"""
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Akademi HTTP JSON API sunucusu")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--data-dir", default=".", help="tek kullanıcılı modda veri dosyalarının dizini")
+    parser.add_argument("--system-time", action="store_true", help="internet saati yerine sistem saatini kullan")
+    parser.add_argument("--token", default=os.environ.get("AKADEMI_API_TOKEN"),
+                        help="verilirse istekler 'Authorization: Bearer <token>' başlığı taşımalı")
+    args = parser.parse_args(argv)
+    if not args.token and not is_loopback(args.host):
+        parser.error("yerel olmayan bir adreste dinlemek için --token (veya AKADEMI_API_TOKEN) gerekli")
+    clock = None if args.system_time else ClockService(world_time_source())
+    server = ApiServer(USERS_DIR, args.data_dir, clock, args.token or None)
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
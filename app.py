@@ -2,12 +2,36 @@ import streamlit as st
 import json
 import os
 import random
-import shutil
-from datetime import datetime, timedelta
+from datetime import datetime
+from types import SimpleNamespace
 import pandas as pd
-import requests
 import zipfile
-import io
+import tempfile
+from clock import ClockService, world_time_source
+from journal import word_record, score_patch
+from data_files import (BASE_VOCABULARY_FILE, MAX_ACTIVE_USERS, QUIZ_SEED, SHEETS_DIRTY_FILE, SHEETS_STATE_FILE,
+                        USER_ID_PATTERN, USERS_DIR, WORD_STORE, load_data, open_storage, user_directory)
+from word_index import AgeBucketIndex, WrongWordsIndex, age_category_for_days
+from distractors import DistractorSampler
+from quiz import QuestionGenerator, QuestionQueue
+from scheduler import WRONG_LIST_STEPS, ReviewScheduler
+from scoring import can_earn_points as score_can_earn_points, is_daily_test_goal_complete as score_goal_complete, roll_over_day
+from quiz_engine import QuizEngine, make_question
+from replay import QuestionRecorder
+from word_list import WORD_FILTERS, WORD_SORTS, WordQueryEngine
+from word_store import ColumnarWordStore, plain_words
+from search_index import SearchIndex
+from backup_store import ChunkedBackupStore
+from shared_data import SharedDataCache, UserDataRegistry
+from base_vocabulary import BaseVocabulary
+from backup_archive import (ImportReport, backup_entries, compile_word_validator, import_words, iter_json_items,
+                            validate_score_data, word_defaults, write_backup_zip)
+from stats import DailyStats
+from sheets_sync import (SHEET_HEADER, SheetChangeTracker, SheetConnection, bulk_sync_words,
+                         incremental_sync_words, pull_changed_words, row_to_word, sheet_row_map, word_to_row)
+
+# Streamlit Sayfa Ayarları (ilk Streamlit çağrısı olmalı: uyarılar ve giriş kutusu bundan sonra çizilir)
+st.set_page_config(page_title="İngilizce Akademi", page_icon="📘", layout="wide")
 
 # Google Sheets için gerekli kütüphaneler
 try:
@@ -18,62 +42,194 @@ except ImportError:
     SHEETS_AVAILABLE = False
     st.warning("⚠️ Google Sheets kullanımı için gspread ve oauth2client kütüphanelerini yükleyin:\npip install gspread oauth2client")
 
-DATA_FILE = "kelimeler.json"
-SCORE_FILE = "puan.json"
-BACKUP_DATA_FILE = "kelimeler_backup.json"
-BACKUP_SCORE_FILE = "puan_backup.json"
+# Veri dosyaları ve ortam değişkenleri (AKADEMI_STORAGE, AKADEMI_USERS_DIR ...) data_files.py'de
+SNAPSHOT_DIR = "yedekler"
+SNAPSHOT_KEEP = 50
+SHEETS_CHUNK_SIZE = 500
+# Verilirse her oturumun soru akışı bu dizine JSONL olarak kaydedilir (replay.py ile oynatılır)
+RECORD_DIR = os.environ.get("AKADEMI_RECORD_DIR")
+
+if USERS_DIR:
+    # Tek Google Sheets tablosu tek öğrenciye ait olduğundan çok kullanıcılı modda kapalı
+    SHEETS_AVAILABLE = False
+
+
+@st.cache_resource
+def get_base_vocabulary():
+    """Tüm kullanıcıların paylaştığı salt okunur temel kelime listesi (süreçte bir kez yüklenir)"""
+    return BaseVocabulary.load(BASE_VOCABULARY_FILE) if USERS_DIR else None
+
+
+@st.cache_resource
+def get_user_registry():
+    """Bellekteki kullanıcı verileri; en uzun süre kullanılmayanlar atılır"""
+    return UserDataRegistry(MAX_ACTIVE_USERS)
+
+
+def user_path(user_id, name):
+    """Kullanıcının dosya yolu (tek kullanıcılı modda çalışma dizini)"""
+    return os.path.join(user_directory(user_id), name)
+
+
+class UserData(SimpleNamespace):
+    """Kullanıcının bellekteki verisi (kayıt defteri zayıf referans tutabilsin diye alt sınıf)"""
+
+
+def open_user_data(user_id):
+    """Kullanıcının depoları, paylaşılan veri kopyası, indeksleri ve yedek deposu"""
+    if user_id is not None:
+        os.makedirs(user_directory(user_id), exist_ok=True)
+    json_storage, storage = open_storage(user_directory(user_id), get_base_vocabulary())
+    wrong_index = WrongWordsIndex()
+    return UserData(
+        json_storage=json_storage,
+        shared_data=SharedDataCache(storage),
+        indexes=(AgeBucketIndex(), DistractorSampler(), wrong_index, ReviewScheduler(wrong_index)),
+        sheet_tracker=SheetChangeTracker(user_path(user_id, SHEETS_STATE_FILE), user_path(user_id, SHEETS_DIRTY_FILE)),
+        backup_store=ChunkedBackupStore(user_path(user_id, SNAPSHOT_DIR)),
+    )
+
+
+def get_user_id():
+    """Oturumun kullanıcısı (?user=... veya giriş kutusu); tek kullanıcılı modda None
+
+    Kimlik doğrulama yapılmaz: çok kullanıcılı mod yalnızca güvenilen bir ağda veya
+    kimlik doğrulayan bir ters vekil (reverse proxy) arkasında çalıştırılmalıdır.
+    """
+    if not USERS_DIR:
+        return None
+    user_id = st.session_state.get("user_id") or st.experimental_get_query_params().get("user", [""])[0]
+    if not USER_ID_PATTERN.fullmatch(user_id):
+        user_id = st.text_input("👤 Kullanıcı adı (harf, rakam, _ . -):", key="user_login").strip()
+        if not USER_ID_PATTERN.fullmatch(user_id):
+            st.stop()
+    st.session_state.user_id = user_id
+    return user_id
+
+
+user_id = get_user_id()
+user_data = get_user_registry().get(user_id, open_user_data)
+# Oturum açık kaldıkça girdi canlı kalır: bellekten atılsa bile aynı depo yeniden kullanılır
+st.session_state.user_data = user_data
+json_storage, shared_data = user_data.json_storage, user_data.shared_data
+storage = shared_data.storage
+age_index, distractor_sampler, wrong_index, review_scheduler = user_data.indexes
+sheet_tracker = user_data.sheet_tracker
+backup_store = user_data.backup_store
 
 
 # -------------------- Yardımcı Fonksiyonlar --------------------
 
+@st.cache_resource
+def get_clock_service():
+    """Tüm oturumlar arasında paylaşılan, internet saati farkını önbellekleyen saat"""
+    return ClockService(world_time_source())
+
+
 def get_internet_time():
-    """İnternet üzerinden güncel zamanı al, başarısız olursa sistem zamanını kullan"""
-    try:
-        response = requests.get("http://worldtimeapi.org/api/timezone/Europe/Istanbul", timeout=5)
-        if response.status_code == 200:
-            data = response.json()
-            return datetime.fromisoformat(data['datetime'].replace('Z', '+00:00')).replace(tzinfo=None)
-    except:
-        pass
-    return datetime.now()
+    """İnternet saatine göre güncel zaman; fark arka planda alınır, istek beklenmez"""
+    return get_clock_service().now()
 
 
 def create_backup():
     """Veri dosyalarının backup'ını oluştur"""
     try:
-        if os.path.exists(DATA_FILE):
-            shutil.copy2(DATA_FILE, BACKUP_DATA_FILE)
-        if os.path.exists(SCORE_FILE):
-            shutil.copy2(SCORE_FILE, BACKUP_SCORE_FILE)
+        storage.create_backup()
         return True
     except Exception as e:
         st.error(f"Backup oluşturulamadı: {e}")
         return False
 
 
+def create_snapshot(label=None):
+    """Artımlı yedek al (yalnızca değişen parçalar yazılır); eski yedekler budanır"""
+    try:
+        manifest, _ = backup_store.backup(kelimeler, score_data, label=label)
+        backup_store.prune(SNAPSHOT_KEEP)
+        return manifest
+    except Exception as e:
+        st.error(f"Artımlı yedek alınamadı: {e}")
+        return None
+
+
 def restore_from_backup():
     """Backup dosyalarından verileri geri yükle"""
     try:
-        if os.path.exists(BACKUP_DATA_FILE):
-            shutil.copy2(BACKUP_DATA_FILE, DATA_FILE)
-        if os.path.exists(BACKUP_SCORE_FILE):
-            shutil.copy2(BACKUP_SCORE_FILE, SCORE_FILE)
+        storage.restore_from_backup()
         return True
     except Exception as e:
         st.error(f"Backup'tan geri yükleme başarısız: {e}")
         return False
 
 
+INCREMENTAL_CACHES = ("search_index", "daily_stats")
+
+
+def bump_data_revision(incremental=False):
+    """Veri değişti: revizyona bağlı önbellekleri (Kelime Listesi sorguları) geçersiz kıl
+
+    incremental=True ise arama indeksi ve istatistik toplamları değişikliği zaten
+    artımlı olarak işlemiştir (update_search_index / safe_save_record) ve yeni
+    revizyona taşınır; aksi halde ilk kullanımda yeniden kurulur.
+    """
+    with shared_data.lock:
+        revision = shared_data.revision
+        new_revision = shared_data.bump()
+        if incremental:
+            for name in INCREMENTAL_CACHES:
+                cache = st.session_state.get(name)
+                if cache is not None and cache.revision == revision:
+                    cache.revision = new_revision
+
+
+def get_search_index():
+    """Oturum boyunca korunan arama indeksi; veri toplu değiştiyse yeniden kurulur"""
+    revision = shared_data.revision
+    search_index = st.session_state.get("search_index")
+    if search_index is None or search_index.revision != revision:
+        search_index = SearchIndex()
+        search_index.build(kelimeler)
+        search_index.revision = revision
+        st.session_state.search_index = search_index
+    return search_index
+
+
+def get_daily_stats():
+    """Oturum boyunca korunan günlük istatistik toplamları (gün değişince yeniden kurulur)"""
+    revision = shared_data.revision
+    daily_stats = st.session_state.get("daily_stats")
+    if daily_stats is None or daily_stats.revision != revision or daily_stats.today != today:
+        daily_stats = DailyStats()
+        daily_stats.build(score_data["daily"], today)
+        daily_stats.revision = revision
+        st.session_state.daily_stats = daily_stats
+    return daily_stats
+
+
+def update_search_index(word=None, old_en=None):
+    """Eklenen/düzenlenen/silinen kelimeyi arama indeksine artımlı olarak işle"""
+    search_index = st.session_state.get("search_index")
+    if search_index is None or search_index.revision != shared_data.revision:
+        return
+    if old_en is not None:
+        search_index.remove(old_en)
+    if word is not None:
+        search_index.add(word)
+
+
+def get_word_query():
+    """Oturum boyunca korunan Kelime Listesi sorgu motoru"""
+    if "word_query" not in st.session_state:
+        st.session_state.word_query = WordQueryEngine()
+    return st.session_state.word_query
+
+
 def safe_save_data():
-    """Verileri güvenli bir şekilde kaydet"""
+    """Verileri güvenli bir şekilde kaydet (tam snapshot, günlük sıfırlanır)"""
     try:
-        create_backup()
-        if kelimeler is not None:
-            with open(DATA_FILE, "w", encoding="utf-8") as f:
-                json.dump(kelimeler, f, ensure_ascii=False, indent=2)
-        if score_data is not None:
-            with open(SCORE_FILE, "w", encoding="utf-8") as f:
-                json.dump(score_data, f, ensure_ascii=False, indent=2)
+        with shared_data.lock:
+            bump_data_revision()
+            storage.save_all(kelimeler, score_data)
         return True
     except Exception as e:
         st.error(f"Veri kaydedilirken hata: {e}")
@@ -82,130 +238,109 @@ def safe_save_data():
         return False
 
 
+def safe_save_record(record):
+    """Tek bir değişikliği kaydet (JSON: günlüğe ekle, SQLite: tek satırlık işlem)"""
+    try:
+        with shared_data.lock:
+            daily_stats = st.session_state.get("daily_stats")
+            if daily_stats is not None and daily_stats.revision == shared_data.revision:
+                for date_str in record.get("d", {}):
+                    daily_stats.observe(date_str, score_data["daily"][date_str])
+            bump_data_revision(incremental=True)
+            storage.save_record(record, kelimeler, score_data)
+        return True
+    except Exception as e:
+        st.error(f"Değişiklik kaydedilirken hata: {e}")
+        return safe_save_data()
+
+
 def create_complete_backup_zip():
-    """Tam yedekleme ZIP dosyası oluştur"""
+    """Tam yedekleme ZIP dosyası oluştur (diskteki geçici dosyaya akış halinde yazılır)"""
     try:
-        backup_data = {
-            'kelimeler': kelimeler,
-            'score_data': score_data,
+        backup_info = {
             'backup_date': datetime.now().isoformat(),
             'app_version': '2.4',
             'total_words': len(kelimeler),
             'total_score': score_data.get('score', 0)
         }
-        zip_buffer = io.BytesIO()
-        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-            zip_file.writestr("kelimeler.json", json.dumps(kelimeler, ensure_ascii=False, indent=2))
-            zip_file.writestr("puan.json", json.dumps(score_data, ensure_ascii=False, indent=2))
-            zip_file.writestr("backup_info.json", json.dumps(backup_data, ensure_ascii=False, indent=2))
-        return zip_buffer.getvalue()
+        zip_file = tempfile.TemporaryFile(buffering=0)
+        write_backup_zip(zip_file, backup_entries(kelimeler, score_data, backup_info))
+        zip_file.seek(0)
+        return zip_file
     except Exception as e:
         st.error(f"ZIP oluşturma hatası: {e}")
         return None
 
 
-def validate_backup_data(kelimeler_data, score_data_backup):
-    """Yedekleme verilerini doğrula"""
-    errors = []
-    warnings = []
-    if not isinstance(kelimeler_data, list):
-        errors.append("Kelimeler verisi liste formatında değil")
-    else:
-        for i, kelime in enumerate(kelimeler_data):
-            if not isinstance(kelime, dict):
-                errors.append(f"Kelime {i + 1}: Dict formatında değil")
-            elif not all(key in kelime for key in ['en', 'tr']):
-                errors.append(f"Kelime {i + 1}: 'en' veya 'tr' alanı eksik")
-            else:
-                if 'wrong_count' not in kelime:
-                    kelime['wrong_count'] = 0
-                    warnings.append(f"Kelime '{kelime.get('en', 'bilinmiyor')}': wrong_count eklendi")
-                if 'added_date' not in kelime:
-                    kelime['added_date'] = datetime.now().strftime("%Y-%m-%d")
-                    warnings.append(f"Kelime '{kelime.get('en', 'bilinmiyor')}': added_date eklendi")
-                if 'wrong_test_count' not in kelime:
-                    kelime['wrong_test_count'] = 0
-                    warnings.append(f"Kelime '{kelime.get('en', 'bilinmiyor')}': wrong_test_count eklendi")
-    if not isinstance(score_data_backup, dict):
-        errors.append("Puan verisi dict formatında değil")
-    else:
-        required_fields = {
-            'score': 0, 'daily': {}, 'last_check_date': None, 'answered_today': 0,
-            'correct_streak': 0, 'wrong_streak': 0, 'combo_multiplier': 1.0,
-            'en_tr_answered': 0, 'tr_en_answered': 0, 'tekrar_answered': 0, 'wrong_words_list': []
-        }
-        for field, default_value in required_fields.items():
-            if field not in score_data_backup:
-                score_data_backup[field] = default_value
-                warnings.append(f"Puan verisi: '{field}' alanı eklendi")
-        if 'daily' in score_data_backup and isinstance(score_data_backup['daily'], dict):
-            for date_str, day_data in score_data_backup['daily'].items():
-                if not isinstance(day_data, dict):
-                    errors.append(f"Günlük veri {date_str}: Dict formatında değil")
-                else:
-                    daily_required = {
-                        'puan': 0, 'yeni_kelime': 0, 'dogru': 0, 'yanlis': 0,
-                        'en_tr_answered': 0, 'tr_en_answered': 0, 'tekrar_answered': 0
-                    }
-                    for field, default_value in daily_required.items():
-                        if field not in day_data:
-                            day_data[field] = default_value
-    return errors, warnings
+def new_word_list():
+    """İçe aktarılan kelimelerin toplanacağı, seçili depo türünde boş liste"""
+    return ColumnarWordStore() if WORD_STORE == "columnar" else []
+
 
+def import_word_items(kelimeler_items, report):
+    """Akış halinde gelen kelimeleri doğrula ve yeni listeye topla"""
+    new_words = new_word_list()
+    validate = compile_word_validator(word_defaults(today_str))
+    import_words(kelimeler_items, new_words, validate, report)
+    return new_words
 
-def restore_from_complete_backup(kelimeler_data, score_data_backup, preserve_daily_progress=True):
-    """Tam yedeklemeden geri yükle"""
+
+def restore_from_complete_backup(kelimeler_items, score_data_backup, preserve_daily_progress=True):
+    """Tam yedeklemeden geri yükle (kelimeler dosyadan/artımlı yedekten akış halinde okunur)"""
     try:
         global kelimeler, score_data
-        errors, warnings = validate_backup_data(kelimeler_data, score_data_backup)
-        if errors:
-            return False, f"Doğrulama hataları: {'; '.join(errors)}"
-        if preserve_daily_progress and today_str in score_data.get('daily', {}):
-            current_daily = score_data['daily'][today_str].copy()
-            current_counters = {
-                'en_tr_answered': score_data.get('en_tr_answered', 0),
-                'tr_en_answered': score_data.get('tr_en_answered', 0),
-                'tekrar_answered': score_data.get('tekrar_answered', 0),
-                'answered_today': score_data.get('answered_today', 0),
-                'correct_streak': score_data.get('correct_streak', 0),
-                'wrong_streak': score_data.get('wrong_streak', 0),
-                'combo_multiplier': score_data.get('combo_multiplier', 1.0),
-                'wrong_words_list': score_data.get('wrong_words_list', [])
-            }
-        else:
-            current_daily = None
-            current_counters = None
-        word_dates = {}
-        for kelime in kelimeler_data:
-            added_date = kelime.get('added_date')
-            if added_date:
-                if added_date not in word_dates:
-                    word_dates[added_date] = 0
-                word_dates[added_date] += 1
-        kelimeler.clear()
-        kelimeler.extend(kelimeler_data)
-        score_data.clear()
-        score_data.update(score_data_backup)
-        for date_str, word_count in word_dates.items():
-            if date_str not in score_data['daily']:
-                score_data['daily'][date_str] = {
-                    'puan': word_count, 'yeni_kelime': word_count, 'dogru': 0, 'yanlis': 0,
-                    'en_tr_answered': 0, 'tr_en_answered': 0, 'tekrar_answered': 0
+        report = ImportReport()
+        validate_score_data(score_data_backup, report)
+        if report.error_count:
+            return False, f"Doğrulama hataları: {report.error_text()}"
+        kelimeler_data = import_word_items(kelimeler_items, report)
+        if report.error_count:
+            return False, f"Doğrulama hataları: {report.error_text()}"
+        with shared_data.lock:
+            create_snapshot("Geri yükleme öncesi")
+            if preserve_daily_progress and today_str in score_data.get('daily', {}):
+                current_daily = score_data['daily'][today_str].copy()
+                current_counters = {
+                    'en_tr_answered': score_data.get('en_tr_answered', 0),
+                    'tr_en_answered': score_data.get('tr_en_answered', 0),
+                    'tekrar_answered': score_data.get('tekrar_answered', 0),
+                    'answered_today': score_data.get('answered_today', 0),
+                    'correct_streak': score_data.get('correct_streak', 0),
+                    'wrong_streak': score_data.get('wrong_streak', 0),
+                    'combo_multiplier': score_data.get('combo_multiplier', 1.0),
+                    'wrong_words_list': score_data.get('wrong_words_list', [])
                 }
             else:
-                if score_data['daily'][date_str]['yeni_kelime'] < word_count:
-                    diff = word_count - score_data['daily'][date_str]['yeni_kelime']
-                    score_data['daily'][date_str]['yeni_kelime'] = word_count
-                    score_data['daily'][date_str]['puan'] += diff
-        if current_daily and preserve_daily_progress:
-            score_data['daily'][today_str] = current_daily
-            score_data.update(current_counters)
-            score_data['last_check_date'] = today_str
-        if safe_save_data():
-            warning_msg = f" Uyarılar: {len(warnings)} alan otomatik düzeltildi." if warnings else ""
-            return True, f"Veriler başarıyla yüklendi!{warning_msg}"
-        else:
-            return False, "Veriler yüklenirken kaydetme hatası oluştu"
+                current_daily = None
+                current_counters = None
+            word_dates = report.word_dates
+            kelimeler.clear()
+            kelimeler.extend(kelimeler_data)
+            score_data.clear()
+            score_data.update(score_data_backup)
+            for date_str, word_count in word_dates.items():
+                if date_str not in score_data['daily']:
+                    score_data['daily'][date_str] = {
+                        'puan': word_count, 'yeni_kelime': word_count, 'dogru': 0, 'yanlis': 0,
+                        'en_tr_answered': 0, 'tr_en_answered': 0, 'tekrar_answered': 0
+                    }
+                else:
+                    if score_data['daily'][date_str]['yeni_kelime'] < word_count:
+                        diff = word_count - score_data['daily'][date_str]['yeni_kelime']
+                        score_data['daily'][date_str]['yeni_kelime'] = word_count
+                        score_data['daily'][date_str]['puan'] += diff
+            if current_daily and preserve_daily_progress:
+                score_data['daily'][today_str] = current_daily
+                score_data.update(current_counters)
+                score_data['last_check_date'] = today_str
+            rebuild_word_indexes()
+            sheet_tracker.mark_changed_by_hash(kelimeler, today_str)
+            if safe_save_data():
+                warning_msg = (f" Uyarılar: {report.warning_count()} alan otomatik düzeltildi ({report.warning_text()})."
+                               if report.fixed else "")
+                return True, f"Veriler başarıyla yüklendi!{warning_msg}"
+            else:
+                return False, "Veriler yüklenirken kaydetme hatası oluştu"
     except Exception as e:
         return False, f"Geri yükleme hatası: {str(e)}"
 
@@ -232,192 +367,46 @@ def initialize_default_data():
 
 def safe_load_data():
     """Verileri güvenli bir şekilde yükle"""
-    kelimeler = []
-    score_data = {
-        "score": 0, "daily": {}, "last_check_date": None, "answered_today": 0,
-        "correct_streak": 0, "wrong_streak": 0, "combo_multiplier": 1.0,
-        "en_tr_answered": 0, "tr_en_answered": 0, "tekrar_answered": 0, "wrong_words_list": []
-    }
+    def report(level, message):
+        {"info": st.info, "warning": st.warning, "error": st.error}[level](message)
+    return load_data(storage, json_storage, get_base_vocabulary(), defaults=initialize_default_data, report=report)
 
-    try:
-        if os.path.exists(DATA_FILE):
-            with open(DATA_FILE, "r", encoding="utf-8") as f:
-                kelimeler = json.load(f)
-                if not kelimeler:
-                    st.warning("⚠️ Kelimeler dosyası boş, varsayılan veriler yükleniyor...")
-                    kelimeler, _ = initialize_default_data()
-        else:
-            st.info("📝 Henüz eklenmiş kelime yok.")
-            
-        if os.path.exists(SCORE_FILE):
-            with open(SCORE_FILE, "r", encoding="utf-8") as f:
-                loaded_score = json.load(f)
-                for key in score_data.keys():
-                    if key in loaded_score:
-                        score_data[key] = loaded_score[key]
-        else:
-            _, score_data = initialize_default_data()
-    except Exception as e:
-        st.error(f"Hata: {e}")
-        kelimeler, score_data = initialize_default_data()
-
-    # Ek güvenlik kontrolleri
-    if not isinstance(kelimeler, list):
-        kelimeler = []
-    if not isinstance(score_data, dict):
-        score_data = initialize_default_data()[1]
-
-    # Eksik anahtarları tamamlama
-    if "en_tr_answered" not in score_data:
-        score_data["en_tr_answered"] = 0
-    if "tr_en_answered" not in score_data:
-        score_data["tr_en_answered"] = 0
-    if "tekrar_answered" not in score_data:
-        score_data["tekrar_answered"] = 0
-    if "wrong_words_list" not in score_data:
-        score_data["wrong_words_list"] = []
-
-    # Her kelimeye eksik alan ekle
-    for kelime in kelimeler:
-        if "wrong_test_count" not in kelime:
-            kelime["wrong_test_count"] = 0
-        if "added_date" not in kelime:
-            kelime["added_date"] = datetime.now().strftime("%Y-%m-%d")
-
-    return kelimeler, score_data
+
+# -------------------- BURASI İLK KISIM SONU --------------------
+def rebuild_word_indexes():
+    """Kelime listesi toplu değiştiğinde indeksleri yeniden kur"""
+    age_index.build(kelimeler, today)
+    distractor_sampler.build(kelimeler)
+    wrong_index.build(kelimeler, score_data.setdefault("wrong_words_list", []))
+    review_scheduler.build(kelimeler)
+    shared_data.words_changed()
 
 
 def get_word_age_days(word):
-    """Kelimenin kaç gün önce eklendiğini hesapla"""
-    if "added_date" not in word:
-        return 0
-    try:
-        added_date = datetime.strptime(word["added_date"], "%Y-%m-%d").date()
-        return (today - added_date).days
-    except:
-        return 0
+    """Kelimenin kaç gün önce eklendiğini hesapla (yaşlar gün başında topluca hesaplanır)"""
+    age_index.ensure_day(kelimeler, today)
+    return age_index.age_of(word)
 
 
 def get_word_age_category(word):
     """Kelimenin yaş kategorisini döndür"""
-    age_days = get_word_age_days(word)
-    if age_days == 0:
-        return "bugun"
-    elif age_days <= 6:
-        return "yeni"
-    elif age_days <= 29:
-        return "orta"
-    else:
-        return "eski"
+    return age_category_for_days(get_word_age_days(word))
 
 
 def select_word_by_probability(test_type):
     """Test türüne göre kelime seç"""
-    if not kelimeler:
-        return None
-    bugun_kelimeler = [k for k in kelimeler if get_word_age_category(k) == "bugun"]
-    yeni_kelimeler = [k for k in kelimeler if get_word_age_category(k) == "yeni"]
-    orta_kelimeler = [k for k in kelimeler if get_word_age_category(k) == "orta"]
-    eski_kelimeler = [k for k in kelimeler if get_word_age_category(k) == "eski"]
-    if test_type in ["en_tr", "tr_en"]:
-        probabilities = [0.4, 0.3, 0.2, 0.1]
-    elif test_type == "tekrar":
-        probabilities = [0.0, 0.2, 0.3, 0.5]
-    else:
-        return random.choice(kelimeler)
-    categories = []
-    if bugun_kelimeler and probabilities[0] > 0:
-        categories.append(("bugun", bugun_kelimeler, probabilities[0]))
-    if yeni_kelimeler and probabilities[1] > 0:
-        categories.append(("yeni", yeni_kelimeler, probabilities[1]))
-    if orta_kelimeler and probabilities[2] > 0:
-        categories.append(("orta", orta_kelimeler, probabilities[2]))
-    if eski_kelimeler and probabilities[3] > 0:
-        categories.append(("eski", eski_kelimeler, probabilities[3]))
-    if not categories:
-        return random.choice(kelimeler)
-    total_prob = sum(cat[2] for cat in categories)
-    normalized_probs = [cat[2] / total_prob for cat in categories]
-    rand_val = random.random()
-    cumulative_prob = 0
-    for i, (category_name, category_words, _) in enumerate(categories):
-        cumulative_prob += normalized_probs[i]
-        if rand_val <= cumulative_prob:
-            return random.choice(category_words)
-    return random.choice(categories[-1][1])
-
-
-def calculate_word_points(word, is_correct):
-    """Kelime yaşına göre puan hesapla"""
-    age_days = get_word_age_days(word)
-    if is_correct:
-        if age_days >= 30:
-            return 3
-        elif age_days >= 7:
-            return 2
-        else:
-            return 1
-    else:
-        return -2
-
-
-def update_combo_system(is_correct):
-    """Combo sistemini güncelle"""
-    if is_correct:
-        score_data["correct_streak"] += 1
-        score_data["wrong_streak"] = 0
-        if score_data["correct_streak"] >= 10:
-            score_data["combo_multiplier"] = 3.0
-        elif score_data["correct_streak"] >= 5:
-            score_data["combo_multiplier"] = 2.0
-        else:
-            score_data["combo_multiplier"] = 1.0
-    else:
-        score_data["wrong_streak"] += 1
-        score_data["correct_streak"] = 0
-        score_data["combo_multiplier"] = 1.0
-        if score_data["wrong_streak"] >= 10:
-            return -10
-        elif score_data["wrong_streak"] >= 5:
-            return -5
-        else:
-            return 0
-    return 0
-
-
-def add_word_to_wrong_list(word):
-    """Kelimeyi yanlış kelimeler listesine ekle"""
-    word_id = word["en"]
-    if word_id not in score_data["wrong_words_list"]:
-        score_data["wrong_words_list"].append(word_id)
-    word["wrong_test_count"] = 0
-
-
-def remove_word_from_wrong_list(word):
-    """Kelimeyi yanlış kelimeler listesinden çıkar"""
-    word_id = word["en"]
-    if word_id in score_data["wrong_words_list"]:
-        score_data["wrong_words_list"].remove(word_id)
-    word["wrong_test_count"] = 0
+    generator = get_question_generator()
+    return generator.select(kelimeler, age_index, today, test_type, generator.rng)
 
 
 def get_wrong_words():
     """Yanlış kelimeler listesindeki kelimeleri getir"""
-    wrong_words = []
-    for word_id in score_data["wrong_words_list"]:
-        for word in kelimeler:
-            if word["en"] == word_id:
-                wrong_words.append(word)
-                break
-    return wrong_words
+    return wrong_index.wrong_words()
 
 
 def is_daily_test_goal_complete():
     """Günlük test hedeflerinin tamamlanıp tamamlanmadığını kontrol et"""
-    en_tr_complete = score_data.get("en_tr_answered", 0) >= 30
-    tr_en_complete = score_data.get("tr_en_answered", 0) >= 30
-    tekrar_complete = score_data.get("tekrar_answered", 0) >= 30
-    return en_tr_complete and tr_en_complete and tekrar_complete
+    return score_goal_complete(score_data)
 
 
 def get_test_progress_info(test_type):
@@ -441,359 +430,117 @@ def get_test_progress_info(test_type):
 
 def can_earn_points(test_type):
     """Bu test türünde puan kazanılabilir mi kontrol et"""
-    if test_type == "yanlis":
-        return True
-    return is_daily_test_goal_complete()
+    return score_can_earn_points(score_data, test_type)
 
 
-def generate_question(test_type):
-    """Test türüne göre soru üret"""
-    if test_type == "en_tr":
-        soru = select_word_by_probability("en_tr")
-        dogru = soru["tr"]
-        yanlislar = [k["tr"] for k in kelimeler if k["tr"] != dogru]
-        secenekler = random.sample(yanlislar, min(3, len(yanlislar))) + [dogru]
-        random.shuffle(secenekler)
-        question_text = f"🇺🇸 **{soru['en']}** ne demek?"
-    elif test_type == "tr_en":
-        soru = select_word_by_probability("tr_en")
-        dogru = soru["en"]
-        yanlislar = [k["en"] for k in kelimeler if k["en"] != dogru]
-        secenekler = random.sample(yanlislar, min(3, len(yanlislar))) + [dogru]
-        random.shuffle(secenekler)
-        question_text = f"🇹🇷 **{soru['tr']}** kelimesinin İngilizcesi nedir?"
-    elif test_type == "yanlis":
-        wrong_words = get_wrong_words()
-        if not wrong_words:
-            return None, None, None, None
-        soru = random.choice(wrong_words)
-        dogru = soru["tr"]
-        yanlislar = [k["tr"] for k in kelimeler if k["tr"] != dogru]
-        secenekler = random.sample(yanlislar, min(3, len(yanlislar))) + [dogru]
-        random.shuffle(secenekler)
-        question_text = f"🇺🇸 **{soru['en']}** ne demek?"
-    elif test_type == "tekrar":
-        soru = select_word_by_probability("tekrar")
-        if random.choice([True, False]):
-            dogru = soru["tr"]
-            yanlislar = [k["tr"] for k in kelimeler if k["tr"] != dogru]
-            secenekler = random.sample(yanlislar, min(3, len(yanlislar))) + [dogru]
-            random.shuffle(secenekler)
-            question_text = f"🇺🇸 **{soru['en']}** ne demek?"
-        else:
-            dogru = soru["en"]
-            yanlislar = [k["en"] for k in kelimeler if k["en"] != dogru]
-            secenekler = random.sample(yanlislar, min(3, len(yanlislar))) + [dogru]
-            random.shuffle(secenekler)
-            question_text = f"🇹🇷 **{soru['tr']}** kelimesinin İngilizcesi nedir?"
-    return soru, dogru, secenekler, question_text
+def get_question_generator():
+    """Oturum boyunca korunan tohumlanabilir soru üreteci"""
+    if "question_generator" not in st.session_state:
+        st.session_state.question_generator = QuestionGenerator(int(QUIZ_SEED) if QUIZ_SEED else None)
+    return st.session_state.question_generator
 
 
-# -------------------- Google Sheets Fonksiyonları --------------------
-import os
-st.write("Çalışma dizini:", os.getcwd())
-def init_google_sheets():
-    """Google Sheets bağlantısını başlat"""
-    if not SHEETS_AVAILABLE:
-        return None
-    try:
-        scope = ["https://spreadsheets.google.com/feeds", "https://www.googleapis.com/auth/drive"]
-        creds = ServiceAccountCredentials.from_json_keyfile_name("client_secret.json", scope)
-        client = gspread.authorize(creds)
-        sheet = client.open("Kelime Verilerim").sheet1
-        try:
-            first_row = sheet.row_values(1)
-            if not first_row or first_row[0] != "en":
-                sheet.insert_row(["en", "tr", "wrong_count", "added_date"], 1)
-        except:
-            sheet.insert_row(["en", "tr", "wrong_count", "added_date"], 1)
-        return sheet
-    except FileNotFoundError:
-        st.error("❌ client_secret.json dosyası bulunamadı! Google Cloud Console'dan indirip aynı klasöre koyun.")
-        return None
-    except Exception as e:
-        st.error(f"❌ Google Sheets bağlantı hatası: {e}")
+def get_question_recorder():
+    """Oturumun soru akışı kaydedicisi (RECORD_DIR verilmemişse None)"""
+    if not RECORD_DIR:
         return None
+    if "question_recorder" not in st.session_state:
+        generator = get_question_generator()
+        os.makedirs(RECORD_DIR, exist_ok=True)
+        path = os.path.join(RECORD_DIR, datetime.now().strftime("%Y%m%dT%H%M%S_%f") + ".jsonl")
+        st.session_state.question_recorder = QuestionRecorder(path, generator.seed, generator.strategy)
+    return st.session_state.question_recorder
 
 
-def add_word_to_sheet(sheet, en, tr, wrong_count=0, added_date=""):
-    """Kelimeyi Google Sheets'e ekle"""
-    if sheet is None:
-        return False
-    try:
-        sheet.append_row([en, tr, wrong_count, added_date])
-        return True
-    except Exception as e:
-        st.error(f"❌ Sheets'e kayıt hatası: {e}")
-        return False
-
-
-def sync_all_words_to_sheet(sheet):
-    """Tüm kelimeleri Google Sheets'e senkronize et"""
-    if sheet is None:
-        return False, "Sheets bağlantısı yok"
-    try:
-        sheet.delete_rows(2, sheet.row_count)
-        for kelime in kelimeler:
-            sheet.append_row([kelime["en"], kelime["tr"], kelime.get("wrong_count", 0), kelime.get("added_date", today_str)])
-        return True, f"✅ {len(kelimeler)} kelime Sheets'e aktarıldı"
-    except Exception as e:
-        return False, f"❌ Senkronizasyon hatası: {e}"
-
-
-def load_words_from_sheet(sheet):
-    """Google Sheets'ten kelimeleri yükle"""
-    if sheet is None:
-        return False, "Sheets bağlantısı yok", []
-    try:
-        all_rows = sheet.get_all_values()[1:]
-        loaded_words = []
-        for row in all_rows:
-            if len(row) >= 2 and row[0] and row[1]:
-                word = {
-                    "en": row[0], "tr": row[1],
-                    "wrong_count": int(row[2]) if len(row) > 2 and row[2].isdigit() else 0,
-                    "wrong_test_count": 0,
-                    "added_date": row[3] if len(row) > 3 and row[3] else today_str
-                }
-                loaded_words.append(word)
-        return True, f"✅ {len(loaded_words)} kelime Sheets'ten yüklendi", loaded_words
-    except Exception as e:
-        return False, f"❌ Yükleme hatası: {e}", []
-
-
-# -------------------- BURASI İLK KISIM SONU --------------------
-def get_word_age_days(word):
-    """Kelimenin kaç gün önce eklendiğini hesapla"""
-    if "added_date" not in word:
-        return 0
-    try:
-        added_date = datetime.strptime(word["added_date"], "%Y-%m-%d").date()
-        return (today - added_date).days
-    except:
-        return 0
-
-
-def get_word_age_category(word):
-    """Kelimenin yaş kategorisini döndür"""
-    age_days = get_word_age_days(word)
-    if age_days == 0:
-        return "bugun"
-    elif age_days <= 6:
-        return "yeni"
-    elif age_days <= 29:
-        return "orta"
-    else:
-        return "eski"
+def generate_question(test_type):
+    """Test türüne göre soru üret"""
+    return get_question_generator().generate(test_type, kelimeler, age_index, distractor_sampler, wrong_index, today,
+                                             hard=st.session_state.get("hard_distractors", False),
+                                             scheduler=review_scheduler)
 
 
-def select_word_by_probability(test_type):
-    """Test türüne göre kelime seç"""
-    if not kelimeler:
-        return None
-    bugun_kelimeler = [k for k in kelimeler if get_word_age_category(k) == "bugun"]
-    yeni_kelimeler = [k for k in kelimeler if get_word_age_category(k) == "yeni"]
-    orta_kelimeler = [k for k in kelimeler if get_word_age_category(k) == "orta"]
-    eski_kelimeler = [k for k in kelimeler if get_word_age_category(k) == "eski"]
-    
-    if test_type in ["en_tr", "tr_en"]:
-        probabilities = [0.4, 0.3, 0.2, 0.1]
-    elif test_type == "tekrar":
-        probabilities = [0.0, 0.2, 0.3, 0.5]
-    else:
-        return random.choice(kelimeler)
-    
-    categories = []
-    if bugun_kelimeler and probabilities[0] > 0:
-        categories.append(("bugun", bugun_kelimeler, probabilities[0]))
-    if yeni_kelimeler and probabilities[1] > 0:
-        categories.append(("yeni", yeni_kelimeler, probabilities[1]))
-    if orta_kelimeler and probabilities[2] > 0:
-        categories.append(("orta", orta_kelimeler, probabilities[2]))
-    if eski_kelimeler and probabilities[3] > 0:
-        categories.append(("eski", eski_kelimeler, probabilities[3]))
-    
-    if not categories:
-        return random.choice(kelimeler)
-    
-    total_prob = sum(cat[2] for cat in categories)
-    normalized_probs = [cat[2] / total_prob for cat in categories]
-    rand_val = random.random()
-    cumulative_prob = 0
-    
-    for i, (category_name, category_words, _) in enumerate(categories):
-        cumulative_prob += normalized_probs[i]
-        if rand_val <= cumulative_prob:
-            return random.choice(category_words)
-    return random.choice(categories[-1][1])
-
-
-def calculate_word_points(word, is_correct):
-    """Kelime yaşına göre puan hesapla"""
-    age_days = get_word_age_days(word)
-    if is_correct:
-        if age_days >= 30:
-            return 3
-        elif age_days >= 7:
-            return 2
-        else:
-            return 1
-    else:
-        return -2
-
-
-def update_combo_system(is_correct):
-    """Combo sistemini güncelle"""
-    if is_correct:
-        score_data["correct_streak"] += 1
-        score_data["wrong_streak"] = 0
-        if score_data["correct_streak"] >= 10:
-            score_data["combo_multiplier"] = 3.0
-        elif score_data["correct_streak"] >= 5:
-            score_data["combo_multiplier"] = 2.0
-        else:
-            score_data["combo_multiplier"] = 1.0
-    else:
-        score_data["wrong_streak"] += 1
-        score_data["correct_streak"] = 0
-        score_data["combo_multiplier"] = 1.0
-        if score_data["wrong_streak"] >= 10:
-            return -10
-        elif score_data["wrong_streak"] >= 5:
-            return -5
-        else:
-            return 0
-    return 0
+def get_question_queue():
+    """Oturum boyunca korunan önceden üretilmiş soru kuyruğu"""
+    if "question_queue" not in st.session_state:
+        st.session_state.question_queue = QuestionQueue()
+    return st.session_state.question_queue
 
 
-def add_word_to_wrong_list(word):
-    """Kelimeyi yanlış kelimeler listesine ekle"""
-    word_id = word["en"]
-    if word_id not in score_data["wrong_words_list"]:
-        score_data["wrong_words_list"].append(word_id)
-    word["wrong_test_count"] = 0
+def question_queue_key(test_type):
+    """Kuyruktaki soruların geçerli olduğu durum; değişince kuyruk boşaltılır"""
+    return test_type, st.session_state.get("hard_distractors", False), today, shared_data.word_revision
 
 
-def remove_word_from_wrong_list(word):
-    """Kelimeyi yanlış kelimeler listesinden çıkar"""
-    word_id = word["en"]
-    if word_id in score_data["wrong_words_list"]:
-        score_data["wrong_words_list"].remove(word_id)
-    word["wrong_test_count"] = 0
+def prefetch_questions(test_type):
+    """Sıradaki soruları arka planda üret"""
+    hard = st.session_state.get("hard_distractors", False)
+    data = (kelimeler, age_index, distractor_sampler, wrong_index, today)
+    generator, scheduler, lock = get_question_generator(), review_scheduler, shared_data.lock
 
+    def generate():
+        # Arka plan iş parçacığı session_state'e erişemez; gereken her şey önceden alınır
+        with lock:
+            return generator.generate(test_type, *data, hard=hard, scheduler=scheduler)
+    get_question_queue().refill(question_queue_key(test_type), generate)
 
-def get_wrong_words():
-    """Yanlış kelimeler listesindeki kelimeleri getir"""
-    wrong_words = []
-    for word_id in score_data["wrong_words_list"]:
-        for word in kelimeler:
-            if word["en"] == word_id:
-                wrong_words.append(word)
-                break
-    return wrong_words
 
+def next_question(test_type):
+    """Sıradaki soru: önceden üretildiyse kuyruktan alınır, yoksa hemen üretilir"""
+    def is_valid(question):
+        return test_type != "yanlis" or wrong_index.contains(question[0]["en"])
+    question = get_question_queue().pop(question_queue_key(test_type), is_valid)
+    if question is None:
+        # Ön üretim iş parçacığı aynı rng'yi ve indeksleri kilit altında kullanır
+        with shared_data.lock:
+            question = generate_question(test_type)
+    if question[0] is not None:
+        prefetch_questions(test_type)
+    return question
 
-def is_daily_test_goal_complete():
-    """Günlük test hedeflerinin tamamlanıp tamamlanmadığını kontrol et"""
-    en_tr_complete = score_data.get("en_tr_answered", 0) >= 30
-    tr_en_complete = score_data.get("tr_en_answered", 0) >= 30
-    tekrar_complete = score_data.get("tekrar_answered", 0) >= 30
-    return en_tr_complete and tr_en_complete and tekrar_complete
 
+# -------------------- Google Sheets Fonksiyonları --------------------
 
-def get_test_progress_info(test_type):
-    """Test türü için ilerleme bilgisini döndür"""
-    if test_type == "en_tr":
-        current = score_data.get("en_tr_answered", 0)
-        target = 30
-        test_name = "EN→TR"
-    elif test_type == "tr_en":
-        current = score_data.get("tr_en_answered", 0)
-        target = 30
-        test_name = "TR→EN"
-    elif test_type == "tekrar":
-        current = score_data.get("tekrar_answered", 0)
-        target = 30
-        test_name = "Genel Tekrar"
-    else:
-        return None, None, None
-    return current, target, test_name
+def connect_google_sheets():
+    """Yetkilendir, tabloyu aç ve başlık satırını kontrol et"""
+    scope = ["https://spreadsheets.google.com/feeds", "https://www.googleapis.com/auth/drive"]
+    creds = ServiceAccountCredentials.from_json_keyfile_name("client_secret.json", scope)
+    client = gspread.authorize(creds)
+    sheet = client.open("Kelime Verilerim").sheet1
+    try:
+        first_row = sheet.row_values(1)
+        if not first_row or first_row[0] != "en":
+            sheet.insert_row(SHEET_HEADER, 1)
+    except:
+        sheet.insert_row(SHEET_HEADER, 1)
+    return client, sheet
 
 
-def can_earn_points(test_type):
-    """Bu test türünde puan kazanılabilir mi kontrol et"""
-    if test_type == "yanlis":
+def refresh_sheets_token(client):
+    """Süresi dolan token'ı yeniden bağlanmadan yenile"""
+    if hasattr(client, "login"):
+        client.login()
         return True
-    return is_daily_test_goal_complete()
-
+    return False
 
-def generate_question(test_type):
-    """Test türüne göre soru üret"""
-    if test_type == "en_tr":
-        soru = select_word_by_probability("en_tr")
-        dogru = soru["tr"]
-        yanlislar = [k["tr"] for k in kelimeler if k["tr"] != dogru]
-        secenekler = random.sample(yanlislar, min(3, len(yanlislar))) + [dogru]
-        random.shuffle(secenekler)
-        question_text = f"🇺🇸 **{soru['en']}** ne demek?"
-    elif test_type == "tr_en":
-        soru = select_word_by_probability("tr_en")
-        dogru = soru["en"]
-        yanlislar = [k["en"] for k in kelimeler if k["en"] != dogru]
-        secenekler = random.sample(yanlislar, min(3, len(yanlislar))) + [dogru]
-        random.shuffle(secenekler)
-        question_text = f"🇹🇷 **{soru['tr']}** kelimesinin İngilizcesi nedir?"
-    elif test_type == "yanlis":
-        wrong_words = get_wrong_words()
-        if not wrong_words:
-            return None, None, None, None
-        soru = random.choice(wrong_words)
-        dogru = soru["tr"]
-        yanlislar = [k["tr"] for k in kelimeler if k["tr"] != dogru]
-        secenekler = random.sample(yanlislar, min(3, len(yanlislar))) + [dogru]
-        random.shuffle(secenekler)
-        question_text = f"🇺🇸 **{soru['en']}** ne demek?"
-    elif test_type == "tekrar":
-        soru = select_word_by_probability("tekrar")
-        if random.choice([True, False]):
-            dogru = soru["tr"]
-            yanlislar = [k["tr"] for k in kelimeler if k["tr"] != dogru]
-            secenekler = random.sample(yanlislar, min(3, len(yanlislar))) + [dogru]
-            random.shuffle(secenekler)
-            question_text = f"🇺🇸 **{soru['en']}** ne demek?"
-        else:
-            dogru = soru["en"]
-            yanlislar = [k["en"] for k in kelimeler if k["en"] != dogru]
-            secenekler = random.sample(yanlislar, min(3, len(yanlislar))) + [dogru]
-            random.shuffle(secenekler)
-            question_text = f"🇹🇷 **{soru['tr']}** kelimesinin İngilizcesi nedir?"
-    return soru, dogru, secenekler, question_text
 
+@st.cache_resource
+def get_sheets_connection():
+    """Tüm oturumlar ve rerun'lar arasında paylaşılan Sheets bağlantısı"""
+    return SheetConnection(connect_google_sheets, refresh=refresh_sheets_token)
 
-# -------------------- Google Sheets Fonksiyonları --------------------
 
 def init_google_sheets():
-    """Google Sheets bağlantısını başlat"""
+    """Önbellekteki Google Sheets bağlantısını döndür (ilk çağrıda bağlanır)"""
     if not SHEETS_AVAILABLE:
         return None
-    try:
-        scope = ["https://spreadsheets.google.com/feeds", "https://www.googleapis.com/auth/drive"]
-        creds = ServiceAccountCredentials.from_json_keyfile_name("client_secret.json", scope)
-        client = gspread.authorize(creds)
-        sheet = client.open("Kelime Verilerim").sheet1
-        try:
-            first_row = sheet.row_values(1)
-            if not first_row or first_row[0] != "en":
-                sheet.insert_row(["en", "tr", "wrong_count", "added_date"], 1)
-        except:
-            sheet.insert_row(["en", "tr", "wrong_count", "added_date"], 1)
-        return sheet
-    except FileNotFoundError:
-        st.error("❌ client_secret.json dosyası bulunamadı! Google Cloud Console'dan indirip aynı klasöre koyun.")
-        return None
-    except Exception as e:
-        st.error(f"❌ Google Sheets bağlantı hatası: {e}")
-        return None
+    connection = get_sheets_connection()
+    sheet = connection.get()
+    if sheet is None:
+        if isinstance(connection.last_error, FileNotFoundError):
+            st.error("❌ client_secret.json dosyası bulunamadı! Google Cloud Console'dan indirip aynı klasöre koyun.")
+        elif connection.last_error is not None:
+            st.error(f"❌ Google Sheets bağlantı hatası: {connection.last_error}")
+    return sheet
 
 
 def add_word_to_sheet(sheet, en, tr, wrong_count=0, added_date=""):
@@ -801,95 +548,124 @@ def add_word_to_sheet(sheet, en, tr, wrong_count=0, added_date=""):
     if sheet is None:
         return False
     try:
-        sheet.append_row([en, tr, wrong_count, added_date])
+        if sheet_tracker.synced:
+            # Satır haritası biliniyorsa kirli satırlarla birlikte tek toplu güncelleme
+            incremental_sync_words(sheet, kelimeler, sheet_tracker, today_str, words_by_id=wrong_index.words_by_id,
+                                   chunk_size=SHEETS_CHUNK_SIZE)
+        else:
+            sheet.append_row(word_to_row({"en": en, "tr": tr, "wrong_count": wrong_count, "added_date": added_date}, today_str))
         return True
     except Exception as e:
         st.error(f"❌ Sheets'e kayıt hatası: {e}")
         return False
 
 
-def sync_all_words_to_sheet(sheet):
-    """Tüm kelimeleri Google Sheets'e senkronize et"""
+def sync_all_words_to_sheet(sheet, progress=None):
+    """Tüm kelimeleri Google Sheets'e toplu güncellemelerle senkronize et"""
     if sheet is None:
         return False, "Sheets bağlantısı yok"
     try:
-        sheet.delete_rows(2, sheet.row_count)
-        for kelime in kelimeler:
-            sheet.append_row([kelime["en"], kelime["tr"], kelime.get("wrong_count", 0), kelime.get("added_date", today_str)])
-        return True, f"✅ {len(kelimeler)} kelime Sheets'e aktarıldı"
+        count = bulk_sync_words(sheet, kelimeler, today_str, chunk_size=SHEETS_CHUNK_SIZE, progress=progress,
+                                tracker=sheet_tracker)
+        return True, f"✅ {count} kelime Sheets'e aktarıldı"
     except Exception as e:
         return False, f"❌ Senkronizasyon hatası: {e}"
 
 
-def load_words_from_sheet(sheet):
-    """Google Sheets'ten kelimeleri yükle"""
+def push_sheet_changes(sheet):
+    """Son senkronizasyondan beri değişen kelimeleri Sheets'e gönder"""
     if sheet is None:
-        return False, "Sheets bağlantısı yok", []
+        return False, "Sheets bağlantısı yok"
     try:
-        all_rows = sheet.get_all_values()[1:]
+        inserted, updated, deleted = incremental_sync_words(sheet, kelimeler, sheet_tracker, today_str,
+                                                            words_by_id=wrong_index.words_by_id,
+                                                            chunk_size=SHEETS_CHUNK_SIZE)
+        return True, f"✅ Sheets güncellendi: {inserted} yeni, {updated} değişen, {deleted} silinen kelime"
+    except Exception as e:
+        return False, f"❌ Senkronizasyon hatası: {e}"
+
+
+def load_words_from_sheet(sheet, only_changed=False):
+    """Google Sheets'ten kelimeleri yükle (only_changed: yalnızca içeriği değişen satırlar)
+
+    (başarı, mesaj, yüklenen kelimeler, Sheets'ten silinen kelime kimlikleri) döndürür.
+    """
+    if sheet is None:
+        return False, "Sheets bağlantısı yok", [], []
+    try:
+        if only_changed and sheet_tracker.synced:
+            changed_words, removed_ids, row_map = pull_changed_words(sheet, sheet_tracker, today_str)
+            sheet_tracker.update_rows(row_map)
+            return True, f"✅ {len(changed_words)} değişen, {len(removed_ids)} silinen kelime Sheets'ten alındı", changed_words, removed_ids
+        all_values = sheet.get_all_values()
         loaded_words = []
-        for row in all_rows:
-            if len(row) >= 2 and row[0] and row[1]:
-                word = {
-                    "en": row[0], "tr": row[1],
-                    "wrong_count": int(row[2]) if len(row) > 2 and row[2].isdigit() else 0,
-                    "wrong_test_count": 0,
-                    "added_date": row[3] if len(row) > 3 and row[3] else today_str
-                }
+        for row in all_values[1:]:
+            word = row_to_word(row, today_str)
+            if word is not None:
                 loaded_words.append(word)
-        return True, f"✅ {len(loaded_words)} kelime Sheets'ten yüklendi", loaded_words
+        if loaded_words:
+            sheet_tracker.reset(sheet_row_map(all_values))
+        return True, f"✅ {len(loaded_words)} kelime Sheets'ten yüklendi", loaded_words, []
     except Exception as e:
-        return False, f"❌ Yükleme hatası: {e}", []
+        return False, f"❌ Yükleme hatası: {e}", [], []
+
+
+def merge_sheet_changes(changed_words, removed_ids):
+    """Sheets'ten gelen değişiklikleri yerel kelime listesine uygula"""
+    with shared_data.lock:
+        for word in changed_words:
+            existing = wrong_index.get(word["en"])
+            if existing is not None:
+                existing.update({key: word[key] for key in ("tr", "wrong_count", "added_date")})
+            else:
+                kelimeler.append(word)
+        if removed_ids:
+            removed = set(removed_ids)
+            kelimeler[:] = [k for k in kelimeler if k["en"] not in removed]
+            for word_id in removed_ids:
+                wrong_index.discard(word_id)
+        rebuild_word_indexes()
 
 
 # -------------------- Ana Program --------------------
 
-# Verileri yükle
-kelimeler, score_data = safe_load_data()
 current_time = get_internet_time()
 today = current_time.date()
 today_str = today.strftime("%Y-%m-%d")
-google_sheet = init_google_sheets() if SHEETS_AVAILABLE else None
-
-if "daily" not in score_data:
-    score_data["daily"] = {}
-
-# Günlük kontrol
-if score_data.get("last_check_date") != today_str:
-    if score_data.get("last_check_date") is not None:
-        yesterday_str = score_data["last_check_date"]
-        if yesterday_str in score_data["daily"]:
-            yesterday_words = score_data["daily"][yesterday_str]["yeni_kelime"]
-            if yesterday_words < 10:
-                penalty = -20
-                score_data["score"] += penalty
-                score_data["daily"][yesterday_str]["puan"] += penalty
-                st.warning(f"⚠️ Dün {10 - yesterday_words} kelime eksik olduğu için -20 puan kesildi!")
-    
-    score_data["answered_today"] = 0
-    score_data["last_check_date"] = today_str
-    score_data["correct_streak"] = 0
-    score_data["wrong_streak"] = 0
-    score_data["combo_multiplier"] = 1.0
-    score_data["en_tr_answered"] = 0
-    score_data["tr_en_answered"] = 0
-    score_data["tekrar_answered"] = 0
-
-if today_str not in score_data["daily"]:
-    score_data["daily"][today_str] = {
-        "puan": 0, "yeni_kelime": 0, "dogru": 0, "yanlis": 0,
-        "en_tr_answered": 0, "tr_en_answered": 0, "tekrar_answered": 0
-    }
+sheets_connection = get_sheets_connection() if SHEETS_AVAILABLE else None
 
-safe_save_data()
+# Verileri yükle (süreçte bir kez; başka bir süreç dosyaları değiştirdiyse yeniden)
+with shared_data.lock:
+    kelimeler, score_data, reloaded = shared_data.get(safe_load_data)
+    if reloaded:
+        rebuild_word_indexes()
+
+    # Günlük kontrol
+    changed_dates, penalty, missing_words = roll_over_day(score_data, today_str)
+    if penalty:
+        st.warning(f"⚠️ Dün {missing_words} kelime eksik olduğu için {penalty} puan kesildi!")
+
+    # Her rerun'da tam yazım yerine yalnızca gün değişimi günlüğe eklenir
+    if changed_dates:
+        safe_save_record({"op": "score", **score_patch(score_data, changed_dates)})
+
+quiz_engine = QuizEngine(kelimeler, score_data, today, (age_index, distractor_sampler, wrong_index, review_scheduler),
+                         get_question_generator(), shared_data.lock, safe_save_record, get_internet_time)
+
+# Veri yeniden yüklendiyse (başka süreç yazdı ya da kullanıcı bellekten atıldı) gösterilen soru
+# ve hazır sorular eski kelime nesnelerini tutar; bunlara verilen cevap kaybolmasın diye atılır
+if st.session_state.get("current_question") is not None and \
+        st.session_state.current_question.get("load_revision") != shared_data.load_revision:
+    st.session_state.current_question = None
+    get_question_queue().clear()
 
-# Streamlit Sayfa Ayarları
-st.set_page_config(page_title="İngilizce Akademi", page_icon="📘", layout="wide")
 st.title("📘 Akademi - İngilizce Kelime Uygulaması v2.4")
 
 # Sidebar
 with st.sidebar:
     st.markdown("### 📊 Genel Bilgiler")
+    if user_id is not None:
+        st.write(f"👤 **Kullanıcı:** {user_id}")
     st.write(f"💰 **Genel Puan:** {score_data['score']}")
     st.write(f"🕐 **Güncel Saat:** {current_time.strftime('%H:%M:%S')}")
     st.write(f"📅 **Tarih:** {today_str}")
@@ -937,8 +713,10 @@ with st.sidebar:
         progress = 1.0
     st.progress(progress)
     
-    if google_sheet:
+    if sheets_connection is not None and sheets_connection.connected:
         st.success("☁️ Sheets bağlantısı aktif")
+    elif sheets_connection is not None and sheets_connection.last_error is None:
+        st.info("☁️ Sheets ilk kullanımda bağlanacak")
     else:
         st.warning("☁️ Sheets bağlantısı yok")
 
@@ -1006,6 +784,8 @@ elif menu == "📝 Testler":
     if "selected_test_type" not in st.session_state:
         st.session_state.selected_test_type = None
     
+    st.checkbox("🧠 Zor seçenekler", key="hard_distractors", help="Yanlış seçenekler doğru cevaba benzer uzunlukta veya aynı harflerle başlayan kelimelerden seçilir")
+    
     col1, col2, col3, col4 = st.columns(4)
     with col1:
         current, target, test_name = get_test_progress_info("en_tr")
@@ -1060,15 +840,17 @@ elif menu == "📝 Testler":
             st.warning("⚠️ Günlük test hedefleri tamamlanmadan sadece eksi puan verilir!")
         
         if "current_question" not in st.session_state or st.session_state.current_question is None:
-            result = generate_question(st.session_state.selected_test_type)
+            result = next_question(st.session_state.selected_test_type)
             if result[0] is None:
                 st.success("🎉 Hiç yanlış kelime yok!")
                 st.session_state.selected_test_type = None
                 st.stop()
-            st.session_state.current_question = {
-                "soru": result[0], "dogru": result[1], "secenekler": result[2],
-                "question_text": result[3], "answered": False, "result_message": ""
-            }
+            st.session_state.current_question = make_question(st.session_state.selected_test_type, result)
+            st.session_state.current_question.update({"answered": False, "result_message": "",
+                                                      "load_revision": shared_data.load_revision})
+            recorder = get_question_recorder()
+            if recorder is not None:
+                recorder.question(today_str, st.session_state.current_question)
         
         question_data = st.session_state.current_question
         st.write(question_data["question_text"])
@@ -1088,7 +870,7 @@ elif menu == "📝 Testler":
         
         if st.session_state.selected_test_type == "yanlis":
             wrong_test_count = question_data["soru"].get("wrong_test_count", 0)
-            st.info(f"❌ Bu kelime yanlış listesinde - {3 - wrong_test_count} doğru daha gerekli")
+            st.info(f"❌ Bu kelime yanlış listesinde - {WRONG_LIST_STEPS - wrong_test_count} doğru daha gerekli")
         
         if not can_get_points and st.session_state.selected_test_type != "yanlis":
             st.info("ℹ️ Günlük test hedefleri tamamlanmadan sadece eksi puan verilir!")
@@ -1098,75 +880,21 @@ elif menu == "📝 Testler":
             col1, col2 = st.columns([1, 4])
             with col1:
                 if st.button("Cevapla", key="answer_btn", type="primary"):
-                    is_correct = selected_answer == question_data["dogru"]
-                    score_data["answered_today"] += 1
-                    test_type = st.session_state.selected_test_type
-                    
-                    if test_type == "en_tr":
-                        score_data["en_tr_answered"] += 1
-                        score_data["daily"][today_str]["en_tr_answered"] += 1
-                    elif test_type == "tr_en":
-                        score_data["tr_en_answered"] += 1
-                        score_data["daily"][today_str]["tr_en_answered"] += 1
-                    elif test_type == "tekrar":
-                        score_data["tekrar_answered"] += 1
-                        score_data["daily"][today_str]["tekrar_answered"] += 1
-                    
-                    word_points = calculate_word_points(question_data["soru"], is_correct)
-                    combo_penalty = update_combo_system(is_correct)
-                    
-                    if is_correct:
-                        if can_get_points:
-                            combo_multiplier = score_data.get("combo_multiplier", 1.0)
-                            final_points = int(word_points * combo_multiplier)
-                        else:
-                            final_points = 0
-                    else:
-                        final_points = word_points
-                    
-                    final_points += combo_penalty
-                    
-                    if final_points != 0:
-                        score_data["score"] += final_points
-                        score_data["daily"][today_str]["puan"] += final_points
-                    
-                    if is_correct:
-                        score_data["daily"][today_str]["dogru"] += 1
-                        if test_type == "yanlis":
-                            question_data["soru"]["wrong_test_count"] += 1
-                            if question_data["soru"]["wrong_test_count"] >= 3:
-                                remove_word_from_wrong_list(question_data["soru"])
-                                question_data["result_message"] = f"🎉 Harika! Bu kelime artık yanlış listesinde değil! (+{final_points} puan)" if final_points > 0 else "🎉 Harika! Bu kelime artık yanlış listesinde değil!"
-                            else:
-                                remaining = 3 - question_data["soru"]["wrong_test_count"]
-                                if final_points > 0:
-                                    question_data["result_message"] = f"✅ Doğru! ({remaining} doğru daha gerekli) (+{final_points} puan)"
-                                else:
-                                    question_data["result_message"] = f"✅ Doğru! ({remaining} doğru daha gerekli)"
-                        else:
-                            if final_points > 0:
-                                question_data["result_message"] = f"✅ Doğru! (+{final_points} puan)"
-                            else:
-                                question_data["result_message"] = f"✅ Doğru! (Hedef tamamlanınca puan alacaksınız)"
-                    else:
-                        score_data["daily"][today_str]["yanlis"] += 1
-                        question_data["soru"]["wrong_count"] = question_data["soru"].get("wrong_count", 0) + 1
-                        question_data["soru"]["last_wrong_date"] = today_str
-                        if test_type in ["en_tr", "tr_en", "tekrar"]:
-                            add_word_to_wrong_list(question_data["soru"])
-                        if test_type == "yanlis":
-                            question_data["soru"]["wrong_test_count"] = 0
-                        penalty_msg = f"({final_points} puan)" if final_points != 0 else ""
-                        combo_msg = ""
-                        if combo_penalty < 0:
-                            combo_msg = f" | Seri ceza: {combo_penalty}"
-                        if test_type in ["en_tr", "tr_en", "tekrar"]:
-                            question_data["result_message"] = f"❌ Yanlış! Doğru cevap: **{question_data['dogru']}** {penalty_msg}{combo_msg} (Yanlış listesine eklendi)"
-                        else:
-                            question_data["result_message"] = f"❌ Yanlış! Doğru cevap: **{question_data['dogru']}** {penalty_msg}{combo_msg}"
-                    
-                    question_data["answered"] = True
-                    safe_save_data()
+                    question_data.setdefault("test_type", st.session_state.selected_test_type)
+                    test_type = question_data["test_type"]
+                    with shared_data.lock:
+                        result = quiz_engine.answer(question_data, selected_answer, can_get_points)
+                        if not result["correct"]:
+                            sheet_tracker.mark(question_data["soru"]["en"])
+                        question_data["result_message"] = result["message"]
+                        question_data["answered"] = True
+                    recorder = get_question_recorder()
+                    if recorder is not None:
+                        recorder.answer(today_str, test_type, question_data["soru"], selected_answer,
+                                        result["correct"], result["points"])
+                    # Kelimenin durumu değişti: onu soran hazır sorular atılır, kuyruk yeni durumla doldurulur
+                    get_question_queue().discard(question_data["soru"])
+                    prefetch_questions(test_type)
                     st.rerun()
         else:
             if "✅" in question_data["result_message"] or "🎉" in question_data["result_message"]:
@@ -1193,18 +921,33 @@ elif menu == "📝 Testler":
                 with col2:
                     if st.button("💾 Kaydet", key="save_edit"):
                         if yeni_en.strip() and yeni_tr.strip():
-                            question_data["soru"]["en"] = yeni_en.strip()
-                            question_data["soru"]["tr"] = yeni_tr.strip()
-                            safe_save_data()
+                            with shared_data.lock:
+                                old_en = question_data["soru"]["en"]
+                                distractor_sampler.remove(question_data["soru"])
+                                question_data["soru"]["en"] = yeni_en.strip()
+                                question_data["soru"]["tr"] = yeni_tr.strip()
+                                age_index.update(question_data["soru"])
+                                sheet_tracker.mark(old_en, question_data["soru"]["en"])
+                                wrong_index.rename_word(question_data["soru"], old_en)
+                                update_search_index(question_data["soru"], old_en)
+                                distractor_sampler.add(question_data["soru"])
+                                shared_data.words_changed()
+                                safe_save_record(word_record("edit", question_data["soru"], old_en=old_en))
                             st.success("✅ Kelime güncellendi!")
                             st.rerun()
                         else:
                             st.error("❌ Boş bırakılamaz!")
                     if st.button("🗑️ Sil", key="delete_word", type="secondary"):
-                        if question_data["soru"]["en"] in score_data.get("wrong_words_list", []):
-                            score_data["wrong_words_list"].remove(question_data["soru"]["en"])
-                        kelimeler.remove(question_data["soru"])
-                        safe_save_data()
+                        with shared_data.lock:
+                            wrong_index.remove_word(question_data["soru"])
+                            review_scheduler.remove(question_data["soru"])
+                            update_search_index(old_en=question_data["soru"]["en"])
+                            kelimeler.remove(question_data["soru"])
+                            age_index.remove(question_data["soru"])
+                            distractor_sampler.remove(question_data["soru"])
+                            sheet_tracker.mark(question_data["soru"]["en"])
+                            shared_data.words_changed()
+                            safe_save_record(word_record("delete", question_data["soru"]))
                         st.warning("🗑️ Kelime silindi!")
                         st.session_state.current_question = None
                         st.session_state.selected_test_type = None
@@ -1224,10 +967,10 @@ elif menu == "📝 Testler":
         with col2:
             st.markdown("""
             **🔄 Genel Tekrar:**
-            - 📖 30+ gün önce eklenen: %50
+            - ⏰ Önce tekrar günü en çok gecikmiş, daha önce tekrar edilmiş kelimeler (SM-2)
+            - 📖 Tekrarı gelen yoksa 30+ gün önce eklenen: %50
             - 📚 7-29 gün önce eklenen: %30  
             - 🆕 1-6 gün önce eklenen: %20
-            - 📅 Bugün eklenen: Dahil değil
             """)
 
 # -------------------- KELİME EKLE BÖLÜMÜ --------------------
@@ -1251,35 +994,44 @@ elif menu == "➕ Kelime Ekle":
             
             if submitted:
                 if ing.strip() and tr.strip():
-                    existing_word = any(k["en"].lower() == ing.strip().lower() for k in kelimeler)
+                    with shared_data.lock:
+                        existing_word = any(k["en"].lower() == ing.strip().lower() for k in kelimeler)
+                        if not existing_word:
+                            yeni_kelime = {
+                                "en": ing.strip().lower(), "tr": tr.strip().lower(),
+                                "wrong_count": 0, "wrong_test_count": 0,
+                                "added_date": today_str, "last_wrong_date": None
+                            }
+                            kelimeler.append(yeni_kelime)
+                            yeni_kelime = kelimeler[-1]
+                            age_index.add(yeni_kelime)
+                            wrong_index.add_word(yeni_kelime)
+                            sheet_tracker.mark(yeni_kelime["en"])
+                            distractor_sampler.add(yeni_kelime)
+                            review_scheduler.push(yeni_kelime)
+                            update_search_index(yeni_kelime)
+                            score_data["daily"][today_str]["yeni_kelime"] += 1
+                            score_data["score"] += 1
+                            score_data["daily"][today_str]["puan"] += 1
+                            saved = safe_save_record(word_record("add", yeni_kelime, score_data, [today_str]))
                     if existing_word:
                         st.error("⚠️ Bu kelime zaten mevcut!")
-                    else:
-                        yeni_kelime = {
-                            "en": ing.strip().lower(), "tr": tr.strip().lower(),
-                            "wrong_count": 0, "wrong_test_count": 0,
-                            "added_date": today_str, "last_wrong_date": None
-                        }
-                        kelimeler.append(yeni_kelime)
-                        score_data["daily"][today_str]["yeni_kelime"] += 1
-                        score_data["score"] += 1
-                        score_data["daily"][today_str]["puan"] += 1
-                        
-                        if safe_save_data():
-                            if google_sheet:
-                                if add_word_to_sheet(google_sheet, ing.strip().lower(), tr.strip().lower(), 0, today_str):
-                                    st.success(f"✅ Kelime kaydedildi: **{ing.strip()}** → **{tr.strip()}** (+1 puan) ☁️ Sheets'e de kaydedildi!")
-                                else:
-                                    st.success(f"✅ Kelime kaydedildi: **{ing.strip()}** → **{tr.strip()}** (+1 puan)")
-                                    st.warning("⚠️ Sheets'e kayıt yapılamadı")
+                    elif saved:
+                        google_sheet = init_google_sheets()
+                        if google_sheet:
+                            if add_word_to_sheet(google_sheet, ing.strip().lower(), tr.strip().lower(), 0, today_str):
+                                st.success(f"✅ Kelime kaydedildi: **{ing.strip()}** → **{tr.strip()}** (+1 puan) ☁️ Sheets'e de kaydedildi!")
                             else:
                                 st.success(f"✅ Kelime kaydedildi: **{ing.strip()}** → **{tr.strip()}** (+1 puan)")
-                            
-                            if score_data["daily"][today_str]["yeni_kelime"] == 10:
-                                st.balloons()
-                                st.success("🎉 Günlük kelime hedefi tamamlandı!")
+                                st.warning("⚠️ Sheets'e kayıt yapılamadı")
                         else:
-                            st.error("❌ Kayıt sırasında hata oluştu!")
+                            st.success(f"✅ Kelime kaydedildi: **{ing.strip()}** → **{tr.strip()}** (+1 puan)")
+                            
+                        if score_data["daily"][today_str]["yeni_kelime"] == 10:
+                            st.balloons()
+                            st.success("🎉 Günlük kelime hedefi tamamlandı!")
+                    else:
+                        st.error("❌ Kayıt sırasında hata oluştu!")
                 else:
                     st.warning("⚠️ İngilizce ve Türkçe kelimeyi doldurun.")
     
@@ -1288,47 +1040,32 @@ elif menu == "➕ Kelime Ekle":
         if kelimeler:
             col1, col2, col3 = st.columns(3)
             with col1:
-                filtre = st.selectbox("Filtrele:", ["Tümü", "Bugün Eklenenler", "Bu Hafta", "Yanlış Olanlar", "Yanlış Listesindekiler"], key="word_filter")
+                filtre = st.selectbox("Filtrele:", WORD_FILTERS, key="word_filter")
             with col2:
-                siralama = st.selectbox("Sırala:", ["En Yeni", "En Eski", "Alfabetik", "En Çok Yanlış"], key="word_sort")
+                siralama = st.selectbox("Sırala:", WORD_SORTS, key="word_sort")
             with col3:
                 arama = st.text_input("🔍 Kelime Ara:", placeholder="Kelime ara...")
+                yakin_eslesme = st.checkbox("🔤 Yakın eşleşmeler", key="fuzzy_search",
+                                            help="Bir harf hatalı yazılmış kelimeleri de bul")
             
-            filtered_words = kelimeler.copy()
-            if filtre == "Bugün Eklenenler":
-                filtered_words = [k for k in kelimeler if k.get("added_date") == today_str]
-            elif filtre == "Bu Hafta":
-                week_ago = (today - timedelta(days=7)).strftime("%Y-%m-%d")
-                filtered_words = [k for k in kelimeler if k.get("added_date", "") >= week_ago]
-            elif filtre == "Yanlış Olanlar":
-                filtered_words = [k for k in kelimeler if k.get("wrong_count", 0) > 0]
-            elif filtre == "Yanlış Listesindekiler":
-                wrong_word_ids = score_data.get("wrong_words_list", [])
-                filtered_words = [k for k in kelimeler if k["en"] in wrong_word_ids]
-            
-            if arama:
-                filtered_words = [k for k in filtered_words if arama.lower() in k["en"].lower() or arama.lower() in k["tr"].lower()]
-            
-            if siralama == "En Yeni":
-                filtered_words.sort(key=lambda x: x.get("added_date", ""), reverse=True)
-            elif siralama == "En Eski":
-                filtered_words.sort(key=lambda x: x.get("added_date", ""))
-            elif siralama == "Alfabetik":
-                filtered_words.sort(key=lambda x: x["en"])
-            elif siralama == "En Çok Yanlış":
-                filtered_words.sort(key=lambda x: x.get("wrong_count", 0), reverse=True)
+            page_size = 20
+            word_query = get_word_query()
+            revision = shared_data.revision
+            page = st.session_state.get("word_page", 1) - 1
+            search_options = {"search_index": get_search_index(), "fuzzy": yakin_eslesme} if arama.strip() else {}
+            total, words_to_show = word_query.query(kelimeler, revision, filtre, siralama, arama, today, wrong_index,
+                                                    page * page_size, page_size, **search_options)
+            total_pages = (total + page_size - 1) // page_size
+            if page > 0 and page >= total_pages:
+                page = 0
+                st.session_state["word_page"] = 1
+                total, words_to_show = word_query.query(kelimeler, revision, filtre, siralama, arama, today,
+                                                        wrong_index, 0, page_size, **search_options)
             
-            st.write(f"📊 {len(filtered_words)} kelime gösteriliyor")
+            st.write(f"📊 {total} kelime gösteriliyor")
             
-            page_size = 20
-            total_pages = (len(filtered_words) + page_size - 1) // page_size
             if total_pages > 1:
-                page = st.selectbox("Sayfa:", range(1, total_pages + 1)) - 1
-                start_idx = page * page_size
-                end_idx = min(start_idx + page_size, len(filtered_words))
-                words_to_show = filtered_words[start_idx:end_idx]
-            else:
-                words_to_show = filtered_words
+                st.selectbox("Sayfa:", range(1, total_pages + 1), key="word_page")
             
             for i, k in enumerate(words_to_show, 1):
                 with st.container():
@@ -1352,10 +1089,10 @@ elif menu == "➕ Kelime Ekle":
                         else:
                             st.success("✅ 0")
                     with col6:
-                        if k["en"] in score_data.get("wrong_words_list", []):
+                        if wrong_index.contains(k["en"]):
                             wrong_test_progress = k.get("wrong_test_count", 0)
                             if wrong_test_progress > 0:
-                                st.info(f"🔄 {wrong_test_progress}/3")
+                                st.info(f"🔄 {wrong_test_progress}/{WRONG_LIST_STEPS}")
                             else:
                                 st.warning("🔄 Listede")
                         else:
@@ -1369,21 +1106,22 @@ elif menu == "➕ Kelime Ekle":
 elif menu == "📊 İstatistikler":
     st.header("📊 İstatistikler")
     tab1, tab2, tab3 = st.tabs(["📈 Günlük", "📊 Genel", "❌ Yanlış Kelimeler"])
+    daily_stats = get_daily_stats()
     
     with tab1:
         st.subheader("📈 Günlük İstatistikler")
-        if score_data["daily"]:
-            daily_df = pd.DataFrame.from_dict(score_data["daily"], orient="index")
-            daily_df.index = pd.to_datetime(daily_df.index)
-            daily_df = daily_df.sort_index()
-            col1, col2 = st.columns(2)
+        if daily_stats.day_count():
+            daily_df = daily_stats.frame()
+            col1, col2, col3 = st.columns(3)
             with col1:
-                st.metric("📅 Toplam Gün", len(daily_df))
-                st.metric("📚 Toplam Eklenen Kelime", daily_df["yeni_kelime"].sum())
+                st.metric("📅 Toplam Gün", daily_stats.day_count())
+                st.metric("📚 Toplam Eklenen Kelime", daily_stats.totals["yeni_kelime"])
             with col2:
-                st.metric("💰 Toplam Kazanılan Puan", daily_df["puan"].sum())
-                avg_daily = daily_df["puan"].mean()
-                st.metric("📊 Günlük Ortalama", f"{avg_daily:.1f}")
+                st.metric("💰 Toplam Kazanılan Puan", daily_stats.totals["puan"])
+                st.metric("📊 Günlük Ortalama", f"{daily_stats.daily_mean():.1f}")
+            with col3:
+                st.metric("📆 Son 7 Gün Ortalaması", f"{daily_stats.rolling_mean(7):.1f}")
+                st.metric("🗓️ Son 30 Gün Ortalaması", f"{daily_stats.rolling_mean(30):.1f}")
             st.subheader("📈 Günlük Puan Grafiği")
             st.line_chart(daily_df["puan"])
             st.subheader("📋 Günlük Detay Tablosu")
@@ -1398,18 +1136,14 @@ elif menu == "📊 İstatistikler":
             st.metric("💰 Genel Puan", score_data["score"])
             st.metric("📖 Toplam Kelime", len(kelimeler))
         with col2:
-            total_dogru = sum(v.get("dogru", 0) for v in score_data["daily"].values())
-            total_yanlis = sum(v.get("yanlis", 0) for v in score_data["daily"].values())
-            st.metric("✅ Toplam Doğru", total_dogru)
-            st.metric("❌ Toplam Yanlış", total_yanlis)
+            st.metric("✅ Toplam Doğru", daily_stats.totals["dogru"])
+            st.metric("❌ Toplam Yanlış", daily_stats.totals["yanlis"])
         with col3:
-            if total_dogru + total_yanlis > 0:
-                basari_orani = (total_dogru / (total_dogru + total_yanlis)) * 100
-                st.metric("🎯 Genel Başarı", f"{basari_orani:.1f}%")
+            if daily_stats.totals["dogru"] + daily_stats.totals["yanlis"] > 0:
+                st.metric("🎯 Genel Başarı", f"{daily_stats.accuracy():.1f}%")
             else:
                 st.metric("🎯 Genel Başarı", "0%")
-            aktif_gunler = len([d for d in score_data["daily"].values() if d.get("dogru", 0) + d.get("yanlis", 0) > 0])
-            st.metric("📅 Aktif Gün", aktif_gunler)
+            st.metric("📅 Aktif Gün", daily_stats.active_days)
         with col4:
             combo = score_data.get("correct_streak", 0)
             st.metric("🔥 Mevcut Seri", combo)
@@ -1418,17 +1152,10 @@ elif menu == "📊 İstatistikler":
         
         if kelimeler:
             st.subheader("📅 Kelime Yaş Dağılımı")
-            age_groups = {"Bugün (0 gün)": 0, "Yeni (1-6 gün)": 0, "Orta (7-29 gün)": 0, "Eski (30+ gün)": 0}
-            for word in kelimeler:
-                category = get_word_age_category(word)
-                if category == "bugun":
-                    age_groups["Bugün (0 gün)"] += 1
-                elif category == "yeni":
-                    age_groups["Yeni (1-6 gün)"] += 1
-                elif category == "orta":
-                    age_groups["Orta (7-29 gün)"] += 1
-                else:
-                    age_groups["Eski (30+ gün)"] += 1
+            age_index.ensure_day(kelimeler, today)
+            age_counts = age_index.counts()
+            age_groups = {"Bugün (0 gün)": age_counts["bugun"], "Yeni (1-6 gün)": age_counts["yeni"],
+                          "Orta (7-29 gün)": age_counts["orta"], "Eski (30+ gün)": age_counts["eski"]}
             age_df = pd.DataFrame(list(age_groups.items()), columns=["Yaş Grubu", "Kelime Sayısı"])
             st.bar_chart(age_df.set_index("Yaş Grubu"))
     
@@ -1456,7 +1183,7 @@ elif menu == "📊 İstatistikler":
                 with col5:
                     wrong_test_progress = k.get("wrong_test_count", 0)
                     if wrong_test_progress > 0:
-                        st.info(f"✅ {wrong_test_progress}/3")
+                        st.info(f"✅ {wrong_test_progress}/{WRONG_LIST_STEPS}")
                     else:
                         st.warning("🔄 Başlamamış")
             if st.button("🔄 Yanlış Kelimeleri Tekrar Et", type="primary"):
@@ -1478,10 +1205,12 @@ elif menu == "🔧 Ayarlar":
         with col1:
             st.write("**📥 Tam Yedekleme İndirme:**")
             if st.button("📦 Tam Yedekleme İndir (ZIP)", use_container_width=True, type="primary"):
-                zip_data = create_complete_backup_zip()
-                if zip_data:
+                zip_file = create_complete_backup_zip()
+                if zip_file:
                     backup_filename = f"akademi_yedek_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip"
-                    st.download_button(label="⬇️ ZIP Dosyasını İndir", data=zip_data, file_name=backup_filename, mime="application/zip")
+                    # ZIP diske akış halinde yazılır; Streamlit (1.26) indirme için dosyayı bir kez okur, sonra dosya kapatılır
+                    with zip_file:
+                        st.download_button(label="⬇️ ZIP Dosyasını İndir", data=zip_file, file_name=backup_filename, mime="application/zip")
                     st.success("✅ Tam yedekleme hazır! İndirme butonuna tıklayın.")
                 else:
                     st.error("❌ Yedekleme oluşturulamadı!")
@@ -1498,10 +1227,7 @@ elif menu == "🔧 Ayarlar":
                             if 'kelimeler.json' not in file_list or 'puan.json' not in file_list:
                                 st.error("❌ Geçersiz yedekleme dosyası! kelimeler.json veya puan.json eksik.")
                             else:
-                                kelimeler_content = zip_file.read('kelimeler.json').decode('utf-8')
-                                puan_content = zip_file.read('puan.json').decode('utf-8')
-                                kelimeler_data = json.loads(kelimeler_content)
-                                score_data_backup = json.loads(puan_content)
+                                score_data_backup = json.loads(zip_file.read('puan.json').decode('utf-8'))
                                 if 'backup_info.json' in file_list:
                                     backup_info_content = zip_file.read('backup_info.json').decode('utf-8')
                                     backup_info = json.loads(backup_info_content)
@@ -1512,7 +1238,9 @@ elif menu == "🔧 Ayarlar":
                                     - Kelime Sayısı: {backup_info.get('total_words', 'Bilinmiyor')}
                                     - Toplam Puan: {backup_info.get('total_score', 'Bilinmiyor')}
                                     """)
-                                success, message = restore_from_complete_backup(kelimeler_data, score_data_backup, preserve_progress)
+                                with zip_file.open('kelimeler.json') as kelimeler_file:
+                                    success, message = restore_from_complete_backup(iter_json_items(kelimeler_file),
+                                                                                    score_data_backup, preserve_progress)
                                 if success:
                                     st.success(f"🎉 {message}")
                                     st.info("🔄 Sayfa yenilenecek...")
@@ -1528,17 +1256,48 @@ elif menu == "🔧 Ayarlar":
                     except Exception as e:
                         st.error(f"❌ Beklenmeyen hata: {e}")
         st.divider()
+        st.markdown("### 🕒 Artımlı Yedekler")
+        snapshots = backup_store.snapshots()
+        if not snapshots:
+            st.info("Henüz artımlı yedek yok. Manuel backup oluşturunca veya geri yükleme/sıfırlama öncesinde otomatik alınır.")
+        else:
+            snapshot_labels = {
+                m['id']: f"{m['backup_date'][:19].replace('T', ' ')} · {m['total_words']} kelime · {m['total_score']} puan"
+                         + (f" · {m['label']}" if m.get('label') else "")
+                for m in snapshots
+            }
+            snapshot_id = st.selectbox("Yedek seçin:", list(snapshot_labels), format_func=snapshot_labels.get,
+                                       key="snapshot_id")
+            col1, col2 = st.columns(2)
+            with col1:
+                if st.button("📥 Bu Yedeğe Dön", use_container_width=True):
+                    success, message = restore_from_complete_backup(
+                        backup_store.iter_words(snapshot_id), backup_store.load_score(snapshot_id),
+                        preserve_daily_progress=False)
+                    if success:
+                        st.success(f"🎉 {message}")
+                        st.rerun()
+                    else:
+                        st.error(f"❌ {message}")
+            with col2:
+                if st.button("📦 ZIP Olarak Hazırla", use_container_width=True):
+                    with tempfile.TemporaryFile(buffering=0) as snapshot_zip:
+                        write_backup_zip(snapshot_zip, backup_store.entries(snapshot_id))
+                        snapshot_zip.seek(0)
+                        st.download_button("⬇️ ZIP Dosyasını İndir", snapshot_zip, f"akademi_yedek_{snapshot_id}.zip",
+                                           "application/zip")
+        st.divider()
         st.markdown("### 📁 Ayrı Dosya İşlemleri")
         col1, col2 = st.columns(2)
         with col1:
             st.write("**Backup İşlemleri:**")
             if st.button("💾 Manuel Backup Oluştur", use_container_width=True):
-                if create_backup():
+                if create_backup() and create_snapshot("Manuel"):
                     st.success("✅ Backup başarıyla oluşturuldu!")
                 else:
                     st.error("❌ Backup oluşturulamadı!")
             if st.button("🔄 Backup'tan Geri Yükle", use_container_width=True):
-                if os.path.exists(BACKUP_DATA_FILE) and os.path.exists(BACKUP_SCORE_FILE):
+                if storage.has_backup():
                     if st.button("⚠️ Onaylıyorum", key="confirm_restore"):
                         if restore_from_backup():
                             st.success("✅ Backup'tan geri yüklendi!")
@@ -1549,10 +1308,8 @@ elif menu == "🔧 Ayarlar":
                     st.warning("⚠️ Backup dosyası bulunamadı!")
         with col2:
             st.write("**Dosya Durumu:**")
-            st.write(f"📄 Kelime dosyası: {'✅' if os.path.exists(DATA_FILE) else '❌'}")
-            st.write(f"📊 Puan dosyası: {'✅' if os.path.exists(SCORE_FILE) else '❌'}")
-            st.write(f"💾 Kelime backup: {'✅' if os.path.exists(BACKUP_DATA_FILE) else '❌'}")
-            st.write(f"💾 Puan backup: {'✅' if os.path.exists(BACKUP_SCORE_FILE) else '❌'}")
+            for label, path in storage.files():
+                st.write(f"{label}: {'✅' if os.path.exists(path) else '❌'}")
             if st.button("🔄 Verileri Yenile", use_container_width=True):
                 st.rerun()
         st.divider()
@@ -1567,25 +1324,32 @@ elif menu == "🔧 Ayarlar":
                 try:
                     success_messages = []
                     if uploaded_kelimeler:
-                        kelimeler_data = json.loads(uploaded_kelimeler.read())
-                        errors, warnings = validate_backup_data(kelimeler_data, score_data)
-                        if errors:
-                            st.error(f"❌ Kelimeler verisi hatalı: {'; '.join(errors)}")
+                        report = ImportReport()
+                        kelimeler_data = import_word_items(iter_json_items(uploaded_kelimeler), report)
+                        if report.error_count:
+                            st.error(f"❌ Kelimeler verisi hatalı: {report.error_text()}")
                         else:
-                            kelimeler.clear()
-                            kelimeler.extend(kelimeler_data)
+                            with shared_data.lock:
+                                kelimeler.clear()
+                                kelimeler.extend(kelimeler_data)
+                                rebuild_word_indexes()
+                                sheet_tracker.mark_changed_by_hash(kelimeler, today_str)
+                                safe_save_data()
                             success_messages.append("✅ Kelimeler içe aktarıldı!")
                     if uploaded_puan:
                         puan_data = json.loads(uploaded_puan.read())
-                        errors, warnings = validate_backup_data(kelimeler, puan_data)
-                        if errors:
-                            st.error(f"❌ Puan verisi hatalı: {'; '.join(errors)}")
+                        report = ImportReport()
+                        validate_score_data(puan_data, report)
+                        if report.error_count:
+                            st.error(f"❌ Puan verisi hatalı: {report.error_text()}")
                         else:
-                            score_data.clear()
-                            score_data.update(puan_data)
+                            with shared_data.lock:
+                                score_data.clear()
+                                score_data.update(puan_data)
+                                rebuild_word_indexes()
+                                safe_save_data()
                             success_messages.append("✅ Puan verileri içe aktarıldı!")
-                    if success_messages and (uploaded_kelimeler or uploaded_puan):
-                        safe_save_data()
+                    if success_messages:
                         for msg in success_messages:
                             st.success(msg)
                         st.rerun()
@@ -1594,7 +1358,7 @@ elif menu == "🔧 Ayarlar":
         with col2:
             st.write("**📤 Eski Veri Dışa Aktarma:**")
             if st.button("📤 Kelimeleri İndir", use_container_width=True):
-                kelimeler_json = json.dumps(kelimeler, ensure_ascii=False, indent=2)
+                kelimeler_json = json.dumps(plain_words(kelimeler), ensure_ascii=False, indent=2)
                 st.download_button("⬇️ kelimeler.json İndir", kelimeler_json, "kelimeler_backup.json", "application/json")
             if st.button("📤 Puanları İndir", use_container_width=True):
                 puan_json = json.dumps(score_data, ensure_ascii=False, indent=2)
@@ -1602,10 +1366,15 @@ elif menu == "🔧 Ayarlar":
         st.divider()
         if st.button("🗑️ Tüm Verileri Sıfırla", type="secondary"):
             if st.button("⚠️ EMİNİM, SİL!", key="confirm_reset"):
-                kelimeler.clear()
-                score_data.clear()
-                score_data.update({"score": 0, "daily": {}, "last_check_date": None, "answered_today": 0, "correct_streak": 0, "wrong_streak": 0, "combo_multiplier": 1.0, "en_tr_answered": 0, "tr_en_answered": 0, "tekrar_answered": 0, "wrong_words_list": []})
-                if safe_save_data():
+                with shared_data.lock:
+                    create_snapshot("Sıfırlama öncesi")
+                    kelimeler.clear()
+                    score_data.clear()
+                    score_data.update({"score": 0, "daily": {}, "last_check_date": None, "answered_today": 0, "correct_streak": 0, "wrong_streak": 0, "combo_multiplier": 1.0, "en_tr_answered": 0, "tr_en_answered": 0, "tekrar_answered": 0, "wrong_words_list": []})
+                    rebuild_word_indexes()
+                    sheet_tracker.mark_changed_by_hash(kelimeler, today_str)
+                    saved = safe_save_data()
+                if saved:
                     st.success("✅ Tüm veriler sıfırlandı!")
                     st.rerun()
     
@@ -1614,13 +1383,13 @@ elif menu == "🔧 Ayarlar":
         st.write("**📚 Kelime Ekleme:**")
         st.info("• Her gün en az 10 kelime eklenmeli\n• Eksik kelime başına -20 puan cezası\n• Her eklenen kelime +1 puan")
         st.write("**📝 Yeni Test Sistemi (v2.4):**")
-        st.info("• EN→TR Testi: 30 soru hedefi (%40 bugün, %30 yeni, %20 orta, %10 eski kelime)\n• TR→EN Testi: 30 soru hedefi (%40 bugün, %30 yeni, %20 orta, %10 eski kelime)\n• Genel Tekrar: 30 soru hedefi (%50 eski, %30 orta, %20 yeni kelime)\n• Tüm hedefler tamamlandıktan sonra artı puan verilir\n• Yanlış cevaplarda her zaman -2 puan")
+        st.info("• EN→TR Testi: 30 soru hedefi (%40 bugün, %30 yeni, %20 orta, %10 eski kelime)\n• TR→EN Testi: 30 soru hedefi (%40 bugün, %30 yeni, %20 orta, %10 eski kelime)\n• Genel Tekrar: 30 soru hedefi (önce SM-2 ile tekrarı gelen kelimeler, sonra %50 eski, %30 orta, %20 yeni kelime; bugün eklenenler hariç)\n• Tüm hedefler tamamlandıktan sonra artı puan verilir\n• Yanlış cevaplarda her zaman -2 puan")
         st.write("**🎯 Puanlama Sistemi:**")
         st.info("• Bugün/Yeni kelimeler (0-6 gün): +1 puan\n• Orta kelimeler (7-29 gün): +2 puan\n• Eski kelimeler (30+ gün): +3 puan\n• Yanlış cevap: -2 puan")
         st.write("**🔥 Combo Sistemi:**")
         st.info("• 5 doğru arka arkaya: 2x puan\n• 10 doğru arka arkaya: 3x puan\n• 5 yanlış arka arkaya: -5 puan cezası\n• 10 yanlış arka arkaya: -10 puan cezası")
         st.write("**❌ Yeni Yanlış Kelime Sistemi (v2.4):**")
-        st.info("• Normal testlerde yanlış cevaplanan kelimeler otomatik olarak yanlış listesine eklenir\n• Yanlış kelimeler testinde bu kelimeler rastgele sorulur\n• Bir kelime 3 kez doğru cevaplandığında listeden çıkarılır\n• Yanlış kelime testinde tekrar yanlış cevap verilirse sayaç sıfırlanır")
+        st.info(f"• Normal testlerde yanlış cevaplanan kelimeler otomatik olarak yanlış listesine eklenir\n• Yanlış kelimeler testinde bu kelimeler rastgele sorulur\n• Bir kelime {WRONG_LIST_STEPS} kez doğru cevaplandığında listeden çıkarılır ve ertesi gün tekrar sorulur\n• Yanlış kelime testinde tekrar yanlış cevap verilirse sayaç sıfırlanır")
     
     with tab3:
         st.subheader("☁️ Google Sheets Entegrasyonu")
@@ -1628,6 +1397,7 @@ elif menu == "🔧 Ayarlar":
             st.error("❌ Google Sheets kullanımı için gerekli kütüphaneler yüklü değil!")
             st.code("pip install gspread oauth2client")
             st.stop()
+        google_sheet = init_google_sheets()
         if google_sheet:
             st.success("✅ Google Sheets bağlantısı aktif!")
             st.info("📋 Bağlı tablo: **Kelime Verilerim**")
@@ -1648,7 +1418,18 @@ elif menu == "🔧 Ayarlar":
             if st.button("☁️ Tüm Kelimeleri Sheets'e Aktar", type="primary", use_container_width=True):
                 if google_sheet:
                     with st.spinner("Senkronize ediliyor..."):
-                        success, message = sync_all_words_to_sheet(google_sheet)
+                        sync_progress = st.progress(0.0)
+                        success, message = sync_all_words_to_sheet(google_sheet, lambda done, total: sync_progress.progress(done / total))
+                        if success:
+                            st.success(message)
+                        else:
+                            st.error(message)
+                else:
+                    st.error("❌ Sheets bağlantısı yok!")
+            if st.button("⚡ Sadece Değişenleri Gönder", use_container_width=True):
+                if google_sheet:
+                    with st.spinner("Senkronize ediliyor..."):
+                        success, message = push_sheet_changes(google_sheet)
                         if success:
                             st.success(message)
                         else:
@@ -1660,11 +1441,27 @@ elif menu == "🔧 Ayarlar":
             if st.button("☁️ Sheets'ten Kelimeleri Yükle", type="primary", use_container_width=True):
                 if google_sheet:
                     with st.spinner("Yükleniyor..."):
-                        success, message, loaded_words = load_words_from_sheet(google_sheet)
+                        success, message, loaded_words, _ = load_words_from_sheet(google_sheet)
                         if success and loaded_words:
-                            kelimeler.clear()
-                            kelimeler.extend(loaded_words)
-                            safe_save_data()
+                            with shared_data.lock:
+                                kelimeler.clear()
+                                kelimeler.extend(loaded_words)
+                                rebuild_word_indexes()
+                                safe_save_data()
+                            st.success(message)
+                            st.rerun()
+                        else:
+                            st.error(message)
+                else:
+                    st.error("❌ Sheets bağlantısı yok!")
+            if st.button("⚡ Sadece Değişenleri Çek", use_container_width=True):
+                if google_sheet:
+                    with st.spinner("Yükleniyor..."):
+                        success, message, changed_words, removed_ids = load_words_from_sheet(google_sheet, only_changed=True)
+                        if success:
+                            with shared_data.lock:
+                                merge_sheet_changes(changed_words, removed_ids)
+                                safe_save_data()
                             st.success(message)
                             st.rerun()
                         else:
@@ -1675,7 +1472,9 @@ elif menu == "🔧 Ayarlar":
         💡 **Kullanım İpuçları:**
         - Kelime eklediğinizde otomatik olarak Sheets'e de kaydedilir
         - "Tüm Kelimeleri Aktar" butonu mevcut tüm kelimelerinizi Sheets'e gönderir
+        - "Sadece Değişenleri Gönder" son senkronizasyondan beri değişen satırları gönderir
         - "Sheets'ten Yükle" butonu Sheets'teki kelimeleri uygulamaya aktarır
+        - "Sadece Değişenleri Çek" yalnızca içeriği değişen satırları alır
         """)
     
     with tab4:
@@ -1683,7 +1482,7 @@ elif menu == "🔧 Ayarlar":
         st.write("**🔧 Versiyon:** 2.4 - Google Sheets Entegrasyonlu")
         st.write("**📅 Son Güncelleme:** Bugün")
         st.markdown("### ✨ v2.4 Yenilikleri:")
-        st.success("""
+        st.success(f"""
         ☁️ **Google Sheets Entegrasyonu:**
         - Kelimelerinizi Google Sheets'te saklayın
         - Otomatik senkronizasyon
@@ -1693,12 +1492,16 @@ elif menu == "🔧 Ayarlar":
         🆕 **Akıllı Yanlış Kelime Sistemi:**
         - Normal testlerde yanlış cevaplanan kelimeler otomatik yanlış listesine eklenir
         - Yanlış kelime testinde bu kelimeler rastgele sorulur  
-        - 3 kez doğru cevaplandığında kelime listeden çıkarılır
+        - Yanlış kelime testinde {WRONG_LIST_STEPS} kez art arda doğru cevaplandığında listeden çıkar ve ertesi gün tekrar sorulur
         - Tekrar yanlış cevap verilirse progress sıfırlanır
 
+        ⏰ **Aralıklı Tekrar (SM-2):**
+        - Genel Tekrar'da doğru bilinen kelimenin bir sonraki tekrarı 1, 6, sonra giderek artan gün sonra planlanır
+        - Yanlış cevap aralığı sıfırlar ve kelimenin kolaylık katsayısını düşürür
+
         📊 **Yeni Test İstatistikleri:**
         - EN→TR & TR→EN: %40 bugün, %30 yeni, %20 orta, %10 eski
-        - Genel Tekrar: %50 eski, %30 orta, %20 yeni (bugün eklenenler hariç)
+        - Genel Tekrar: önce tekrar günü gelmiş kelimeler; yoksa hiç tekrar edilmemişlerden %50 eski, %30 orta, %20 yeni (bugün eklenenler hariç)
         - Daha akıllı kelime seçim algoritması
 
         🔧 **İyileştirmeler:**
@@ -0,0 +1,260 @@
+import codecs
+import json
+import zipfile
+from collections import Counter
+
+WORDS_PER_CHUNK = 500
+CHUNK_BYTES = 64 * 1024
+READ_BYTES = 64 * 1024
+IMPORT_BATCH = 1000
+MAX_ERROR_MESSAGES = 10
+WORD_REQUIRED = ("en", "tr")
+SCORE_DEFAULTS = {
+    'score': 0, 'daily': {}, 'last_check_date': None, 'answered_today': 0,
+    'correct_streak': 0, 'wrong_streak': 0, 'combo_multiplier': 1.0,
+    'en_tr_answered': 0, 'tr_en_answered': 0, 'tekrar_answered': 0, 'wrong_words_list': []
+}
+DAILY_DEFAULTS = {
+    'puan': 0, 'yeni_kelime': 0, 'dogru': 0, 'yanlis': 0,
+    'en_tr_answered': 0, 'tr_en_answered': 0, 'tekrar_answered': 0
+}
+
+
+def iter_json_array(items, chunk_size=WORDS_PER_CHUNK):
+    """Listeyi kompakt JSON dizisi olarak parça parça üret (tamamı tek metinde birleştirilmez)"""
+    yield "["
+    batch = []
+    separator = ""
+    for item in items:
+        batch.append(json.dumps(item if isinstance(item, dict) else dict(item), ensure_ascii=False,
+                                separators=(",", ":")))
+        if len(batch) >= chunk_size:
+            yield separator + ",".join(batch)
+            batch = []
+            separator = ","
+    if batch:
+        yield separator + ",".join(batch)
+    yield "]"
+
+
+def backup_entries(kelimeler, score_data, info):
+    """Tam yedeklemenin (dosya adı, metin parçaları) girdileri
+
+    backup_info.json yalnızca özet bilgileri içerir; kelimeler ve puanlar
+    kendi dosyalarında bir kez yazılır.
+    """
+    encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+    yield "kelimeler.json", iter_json_array(kelimeler)
+    yield "puan.json", encoder.iterencode(score_data)
+    yield "backup_info.json", encoder.iterencode(info)
+
+
+def encode_chunks(chunks, chunk_bytes=CHUNK_BYTES):
+    """Metin parçalarını UTF-8'e çevirip yaklaşık chunk_bytes büyüklüğünde birleştir"""
+    buffer = bytearray()
+    for chunk in chunks:
+        buffer += chunk.encode("utf-8")
+        if len(buffer) >= chunk_bytes:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
+class _ChunkSink:
+    """ZipFile'ın yazdığı baytları biriktiren, konum değiştirilemeyen hedef"""
+
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b"".join(self.chunks)
+        self.chunks = []
+        return data
+
+
+def stream_backup_zip(entries):
+    """Girdilerden ZIP arşivinin baytlarını parça parça üret (bellek kullanımı veri boyutundan bağımsız)"""
+    sink = _ChunkSink()
+    with zipfile.ZipFile(sink, "w", zipfile.ZIP_DEFLATED) as zip_file:
+        for name, chunks in entries:
+            # Boyut önceden bilinmediği için 4 GB üstüne çıkabilecek girdiler ZIP64 açılır
+            with zip_file.open(name, "w", force_zip64=True) as entry:
+                for data in encode_chunks(chunks):
+                    entry.write(data)
+                    if sink.chunks:
+                        yield sink.drain()
+    yield sink.drain()
+
+
+def write_backup_zip(fileobj, entries):
+    """ZIP arşivini dosyaya akış halinde yaz; yazılan bayt sayısını döndür"""
+    size = 0
+    for data in stream_backup_zip(entries):
+        fileobj.write(data)
+        size += len(data)
+    return size
+
+
+# --- içe aktarma ---
+
+def iter_json_items(stream, read_bytes=READ_BYTES):
+    """Dosyadaki JSON dizisinin elemanlarını tek tek çöz (dosya bütünüyle belleğe alınmaz)"""
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    buffer, pos, eof = "", 0, False
+    state = "open"  # open → first → (item → sep)* → bitti
+    while True:
+        while pos < len(buffer) and buffer[pos] in " \t\r\n":
+            pos += 1
+        if pos == len(buffer):
+            if eof:
+                raise json.JSONDecodeError("JSON dizisi beklenmedik şekilde bitti", buffer, pos)
+            data = stream.read(read_bytes)
+            eof = not data
+            buffer = buffer[pos:] + (text_decoder.decode(data, final=eof) if isinstance(data, bytes) else data)
+            pos = 0
+            continue
+        char = buffer[pos]
+        if state == "open":
+            if char != "[":
+                raise json.JSONDecodeError("Kelimeler verisi liste formatında değil", buffer, pos)
+            pos += 1
+            state = "first"
+        elif state == "sep" or (state == "first" and char == "]"):
+            if char == "]":
+                return
+            if char != ",":
+                raise json.JSONDecodeError("',' veya ']' bekleniyordu", buffer, pos)
+            pos += 1
+            state = "item"
+        else:
+            try:
+                item, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                end = None
+            # Eleman okunamadıysa veya ardından ayraç gelmiyorsa (ör. "1.5e" diye bölünmüş sayı) devamı okunur
+            if end is not None:
+                rest = end
+                while rest < len(buffer) and buffer[rest] in " \t\r\n":
+                    rest += 1
+            if end is None or (not eof and (rest == len(buffer) or buffer[rest] not in ",]")):
+                data = stream.read(read_bytes)
+                eof = not data
+                buffer = buffer[pos:] + (text_decoder.decode(data, final=eof) if isinstance(data, bytes) else data)
+                pos = 0
+                continue
+            yield item
+            pos = end
+            state = "sep"
+        if pos > read_bytes:
+            buffer, pos = buffer[pos:], 0
+
+
+class ImportReport:
+    """İçe aktarma özeti: alan başına düzeltme sayıları ve sınırlı sayıda hata mesajı"""
+
+    def __init__(self):
+        self.words = 0
+        self.fixed = Counter()
+        self.errors = []
+        self.error_count = 0
+        self.word_dates = Counter()
+
+    def error(self, message):
+        self.error_count += 1
+        if len(self.errors) < MAX_ERROR_MESSAGES:
+            self.errors.append(message)
+
+    def error_text(self):
+        hidden = self.error_count - len(self.errors)
+        return "; ".join(self.errors) + (f"; ... ve {hidden} hata daha" if hidden else "")
+
+    def warning_count(self):
+        return sum(self.fixed.values())
+
+    def warning_text(self):
+        return ", ".join(f"{field}: {count}" for field, count in self.fixed.most_common())
+
+
+def word_defaults(today_str):
+    """Eksikse kelimeye eklenecek alanlar"""
+    return {'wrong_count': 0, 'added_date': today_str, 'wrong_test_count': 0}
+
+
+def compile_word_validator(defaults, required=WORD_REQUIRED):
+    """Kelime şemasını doğrulama fonksiyonuna derle
+
+    Dönen fonksiyon kelimeyi yerinde tamamlar, eklenen alanları rapora sayar
+    ve kelime geçersizse hata mesajını döndürür.
+    """
+    required = tuple(required)
+    defaults = tuple(defaults.items())
+
+    def validate(word, number, report):
+        if not isinstance(word, dict):
+            return f"Kelime {number}: Dict formatında değil"
+        for key in required:
+            if key not in word:
+                return f"Kelime {number}: 'en' veya 'tr' alanı eksik"
+        for key, value in defaults:
+            if key not in word:
+                word[key] = value
+                report.fixed[key] += 1
+        return None
+    return validate
+
+
+def import_words(items, target, validate, report, batch_size=IMPORT_BATCH):
+    """Kelimeleri doğrulayıp hedef listeye/depoya batch_size'lık gruplarla ekle
+
+    İlk hatadan sonra kelimeler saklanmaz, yalnızca kalan hatalar sayılır.
+    """
+    batch = []
+    for number, word in enumerate(items, 1):
+        message = validate(word, number, report)
+        if message:
+            report.error(message)
+            batch = []
+            continue
+        if report.error_count:
+            continue
+        report.words += 1
+        if word.get('added_date'):
+            report.word_dates[word['added_date']] += 1
+        batch.append(word)
+        if len(batch) >= batch_size:
+            target.extend(batch)
+            batch = []
+    if batch:
+        target.extend(batch)
+    return report
+
+
+def validate_score_data(score_data_backup, report):
+    """Puan verisini yerinde tamamla; eksik alanlar rapora sayılır"""
+    if not isinstance(score_data_backup, dict):
+        report.error("Puan verisi dict formatında değil")
+        return
+    for field, default_value in SCORE_DEFAULTS.items():
+        if field not in score_data_backup:
+            score_data_backup[field] = default_value.copy() if isinstance(default_value, (dict, list)) else default_value
+            report.fixed[field] += 1
+    if isinstance(score_data_backup['daily'], dict):
+        for date_str, day_data in score_data_backup['daily'].items():
+            if not isinstance(day_data, dict):
+                report.error(f"Günlük veri {date_str}: Dict formatında değil")
+                continue
+            for field, default_value in DAILY_DEFAULTS.items():
+                if field not in day_data:
+                    day_data[field] = default_value
+                    report.fixed['daily.' + field] += 1
@@ -0,0 +1,228 @@
+import hashlib
+import json
+import os
+import sys
+import time
+import zlib
+from contextlib import contextmanager
+from datetime import datetime
+
+from backup_archive import write_backup_zip
+
+# Yedekler parçalara bölünür ve her parça içeriğinin SHA-256 özeti adıyla bir
+# kez saklanır; her yedek yalnızca parça özetlerini listeleyen bir manifesttir.
+# Kelime parçalarının sınırları içerikten (kelimenin "en" alanının özetinden)
+# belirlenir, bu yüzden bir kelime eklenip silindiğinde yalnızca o kelimenin
+# parçası değişir. Günlük istatistikler aya göre bölünür; geçmiş aylar değişmez.
+
+CHUNK_WORDS = 256
+MAX_CHUNK_WORDS = 4 * CHUNK_WORDS
+LOCK_STALE_SECONDS = 600
+LOCK_POLL_SECONDS = 0.05
+COMPACT = {"ensure_ascii": False, "separators": (",", ":")}
+
+
+def word_chunks(kelimeler, chunk_words=CHUNK_WORDS, max_chunk_words=MAX_CHUNK_WORDS):
+    """Kelimeleri içerik tanımlı sınırlarla NDJSON parçalarına böl"""
+    lines = []
+    for word in kelimeler:
+        word = word if isinstance(word, dict) else dict(word)
+        lines.append(json.dumps(word, **COMPACT))
+        boundary = zlib.crc32(str(word.get("en", "")).encode("utf-8")) % chunk_words == 0
+        if boundary or len(lines) >= max_chunk_words:
+            yield "\n".join(lines).encode("utf-8")
+            lines = []
+    if lines:
+        yield "\n".join(lines).encode("utf-8")
+
+
+def score_chunks(score_data):
+    """Puan verisini (günlükler hariç alanlar, ay → o ayın günlükleri) parçalarına ayır"""
+    meta = {key: value for key, value in score_data.items() if key != "daily"}
+    months = {}
+    for date_str, day_data in score_data.get("daily", {}).items():
+        months.setdefault(str(date_str)[:7], {})[date_str] = day_data
+    return (json.dumps(meta, **COMPACT).encode("utf-8"),
+            {month: json.dumps(days, **COMPACT).encode("utf-8") for month, days in sorted(months.items())})
+
+
+class ChunkedBackupStore:
+    """İçerik adresli, tekrarsız artımlı yedek deposu
+
+    Her backup() çağrısı yalnızca daha önce görülmemiş parçaları yazar, böylece
+    sık alınan yedekler yalnızca değişen kısım kadar yer kaplar. backup() ve
+    prune() depo dizinindeki kilit dosyasıyla sıralanır (süreçler arasında da);
+    aksi halde prune, manifesti henüz yazılmamış bir yedeğin parçasını silebilir.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.chunk_dir = os.path.join(root, "chunks")
+        self.manifest_dir = os.path.join(root, "manifests")
+        self.lock_path = os.path.join(root, "lock")
+
+    @contextmanager
+    def _locked(self):
+        """Depo kilidini al (çökmüş bir süreçten kalan eski kilit dosyası silinir)"""
+        os.makedirs(self.root, exist_ok=True)
+        while True:
+            try:
+                os.close(os.open(self.lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                break
+            except FileExistsError:
+                try:
+                    if time.time() - os.path.getmtime(self.lock_path) > LOCK_STALE_SECONDS:
+                        os.remove(self.lock_path)
+                        continue
+                except OSError:
+                    continue
+                time.sleep(LOCK_POLL_SECONDS)
+        try:
+            yield
+        finally:
+            os.remove(self.lock_path)
+
+    def _chunk_path(self, digest):
+        return os.path.join(self.chunk_dir, digest[:2], digest)
+
+    def _put(self, data, stats):
+        """Parçayı (yoksa ya da bozuksa) sıkıştırarak yaz, özetini döndür"""
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._chunk_path(digest)
+        if os.path.exists(path):
+            try:
+                self._get(digest)
+                stats["reused_chunks"] += 1
+                return digest
+            except (OSError, ValueError, zlib.error):
+                # Yarım yazılmış veya bozulmuş parça yeniden yazılır
+                pass
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        compressed = zlib.compress(data)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(compressed)
+        os.replace(tmp_path, path)
+        stats["new_chunks"] += 1
+        stats["new_bytes"] += len(compressed)
+        return digest
+
+    def _get(self, digest):
+        with open(self._chunk_path(digest), "rb") as f:
+            data = zlib.decompress(f.read())
+        if hashlib.sha256(data).hexdigest() != digest:
+            raise ValueError(f"Bozuk yedek parçası: {digest}")
+        return data
+
+    def backup(self, kelimeler, score_data, label=None, now=None):
+        """Yeni yedek al; (manifest, istatistik) döndür"""
+        with self._locked():
+            return self._backup(kelimeler, score_data, label, now)
+
+    def _backup(self, kelimeler, score_data, label, now):
+        now = now or datetime.now()
+        stats = {"new_chunks": 0, "reused_chunks": 0, "new_bytes": 0}
+        words = [self._put(chunk, stats) for chunk in word_chunks(kelimeler)]
+        meta, months = score_chunks(score_data)
+        manifest = {
+            "id": now.strftime("%Y%m%dT%H%M%S_%f"),
+            "backup_date": now.isoformat(),
+            "label": label,
+            "total_words": len(kelimeler),
+            "total_score": score_data.get("score", 0),
+            "words": words,
+            "score": self._put(meta, stats),
+            "daily": {month: self._put(data, stats) for month, data in months.items()},
+        }
+        os.makedirs(self.manifest_dir, exist_ok=True)
+        path = os.path.join(self.manifest_dir, manifest["id"] + ".json")
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(manifest, f, **COMPACT)
+        os.replace(path + ".tmp", path)
+        return manifest, stats
+
+    def snapshots(self):
+        """Yedeklerin manifestleri, en yeniden eskiye"""
+        if not os.path.isdir(self.manifest_dir):
+            return []
+        manifests = []
+        for name in sorted(os.listdir(self.manifest_dir), reverse=True):
+            if name.endswith(".json"):
+                with open(os.path.join(self.manifest_dir, name), "r", encoding="utf-8") as f:
+                    manifests.append(json.load(f))
+        return manifests
+
+    def manifest(self, snapshot_id):
+        with open(os.path.join(self.manifest_dir, snapshot_id + ".json"), "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def iter_words(self, snapshot_id):
+        """Yedekteki kelimeleri parça parça üret"""
+        for digest in self.manifest(snapshot_id)["words"]:
+            for line in self._get(digest).decode("utf-8").split("\n"):
+                yield json.loads(line)
+
+    def load_score(self, snapshot_id):
+        """Yedekteki puan verisini birleştir"""
+        manifest = self.manifest(snapshot_id)
+        score_data = json.loads(self._get(manifest["score"]))
+        score_data["daily"] = {}
+        for digest in manifest["daily"].values():
+            score_data["daily"].update(json.loads(self._get(digest)))
+        return score_data
+
+    def entries(self, snapshot_id):
+        """Yedeği tam yedekleme ZIP'i girdilerine çevir (stream_backup_zip / write_backup_zip için)"""
+        manifest = self.manifest(snapshot_id)
+        encoder = json.JSONEncoder(**COMPACT)
+        yield "kelimeler.json", self._words_json(manifest)
+        yield "puan.json", encoder.iterencode(self.load_score(snapshot_id))
+        yield "backup_info.json", encoder.iterencode({
+            "backup_date": manifest["backup_date"], "app_version": "2.4",
+            "total_words": manifest["total_words"], "total_score": manifest["total_score"]})
+
+    def _words_json(self, manifest):
+        separator = "["
+        for digest in manifest["words"]:
+            yield separator + self._get(digest).decode("utf-8").replace("\n", ",")
+            separator = ","
+        yield "[]" if separator == "[" else "]"
+
+    def prune(self, keep):
+        """En yeni keep yedek dışındakileri ve artık kullanılmayan parçaları sil"""
+        with self._locked():
+            return self._prune(keep)
+
+    def _prune(self, keep):
+        manifests = self.snapshots()
+        for manifest in manifests[keep:]:
+            os.remove(os.path.join(self.manifest_dir, manifest["id"] + ".json"))
+        used = set()
+        for manifest in manifests[:keep]:
+            used.update(manifest["words"])
+            used.add(manifest["score"])
+            used.update(manifest["daily"].values())
+        removed = 0
+        if os.path.isdir(self.chunk_dir):
+            for prefix in os.listdir(self.chunk_dir):
+                for digest in os.listdir(os.path.join(self.chunk_dir, prefix)):
+                    if digest not in used:
+                        os.remove(os.path.join(self.chunk_dir, prefix, digest))
+                        removed += 1
+        return removed
+
+
+if __name__ == "__main__":
+    # Kullanım: python backup_store.py list [dizin]
+    #           python backup_store.py restore <yedek_id> <çıktı.zip> [dizin]
+    command = sys.argv[1] if len(sys.argv) > 1 else "list"
+    if command == "restore":
+        store = ChunkedBackupStore(sys.argv[4] if len(sys.argv) > 4 else "yedekler")
+        with open(sys.argv[3], "wb") as f:
+            size = write_backup_zip(f, store.entries(sys.argv[2]))
+        print(f"{sys.argv[2]} → {sys.argv[3]} ({size} bayt)")
+    else:
+        store = ChunkedBackupStore(sys.argv[2] if len(sys.argv) > 2 else "yedekler")
+        for manifest in store.snapshots():
+            print(f"{manifest['id']}  {manifest['total_words']} kelime  {manifest['total_score']} puan"
+                  f"  {manifest.get('label') or ''}")
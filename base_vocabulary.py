@@ -0,0 +1,100 @@
+import json
+import os
+from collections.abc import MutableMapping
+from types import MappingProxyType
+
+_MISSING = object()
+
+
+class BaseWord(MutableMapping):
+    """Temel kelimeye bağlı kullanıcı kelimesi (kelime dict'inin yerine geçer)
+
+    Okumada önce kullanıcının kendi alanlarına (own), yoksa paylaşılan temel
+    kelimeye bakılır; yazmalar yalnızca own'a gider. Temel alanlar kullanıcı
+    başına kopyalanmaz.
+    """
+
+    __slots__ = ("own", "entry")
+
+    def __init__(self, own, entry):
+        self.own = own
+        self.entry = entry
+
+    def __getitem__(self, key):
+        try:
+            return self.own[key]
+        except KeyError:
+            return self.entry[key]
+
+    def __setitem__(self, key, value):
+        self.own[key] = value
+
+    def __delitem__(self, key):
+        # Yalnızca kullanıcının alanı silinebilir (temel değer yeniden görünür)
+        del self.own[key]
+
+    def __contains__(self, key):
+        return key in self.own or key in self.entry
+
+    def __iter__(self):
+        yield from self.own
+        for key in self.entry:
+            if key not in self.own:
+                yield key
+
+    def __len__(self):
+        return len(self.own) + sum(1 for key in self.entry if key not in self.own)
+
+    def __repr__(self):
+        return f"BaseWord({dict(self)!r})"
+
+
+class BaseVocabulary:
+    """Tüm kullanıcıların paylaştığı salt okunur temel kelime listesi
+
+    Kullanıcı dosyalarında temel kelimeler yalnızca {"base": <temel en>}
+    referansı ve temel listeden farklı alanlarla (ilerleme, değiştirilmiş
+    çeviri) saklanır. Yüklemede bu kelimeler BaseWord görünümüne sarılır;
+    temel alanlar okunurken çözülür, tüm kullanıcılar aynı nesneleri paylaşır.
+    """
+
+    def __init__(self, words=()):
+        self.words = {}
+        for word in words:
+            if isinstance(word, dict) and word.get("en") and word.get("tr"):
+                self.words.setdefault(word["en"], MappingProxyType(dict(word)))
+
+    @classmethod
+    def load(cls, path):
+        """JSON dosyasından yükle; dosya yoksa boş liste"""
+        if not path or not os.path.exists(path):
+            return cls()
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def __len__(self):
+        return len(self.words)
+
+    def new_user_words(self, today_str):
+        """Yeni kullanıcının başlangıç listesi: her temel kelimeye bir referans"""
+        return [self.expand({"base": en, "wrong_count": 0, "wrong_test_count": 0,
+                             "added_date": entry.get("added_date", today_str)})
+                for en, entry in self.words.items()]
+
+    def expand(self, word):
+        """Temel kelimeye referans veren kelimeyi BaseWord görünümüne sar (diğerleri aynen döner)
+
+        Temel kelimeyle aynı olan alanlar kullanıcının sözlüğünden atılır.
+        """
+        entry = self.words.get(word.get("base")) if isinstance(word, dict) else None
+        if entry is None:
+            return word
+        own = {key: value for key, value in word.items() if key == "base" or entry.get(key, _MISSING) != value}
+        return BaseWord(own, entry)
+
+    def strip(self, word):
+        """Kaydedilecek hali: temel kelimeyle aynı olan alanlar çıkarılır"""
+        entry = self.words.get(word.get("base"))
+        if entry is None:
+            return word
+        return {key: value for key, value in word.items() if key == "base" or entry.get(key, _MISSING) != value}
@@ -0,0 +1,300 @@
+"""Sıcak yol ölçümleri (Streamlit olmadan)
+
+    python benchmark.py                          # 100 → 1.000.000 kelime, benchmark.json
+    python benchmark.py --sizes 100,10000 -o a.json
+    python benchmark.py --compare eski.json yeni.json
+"""
+import argparse
+import itertools
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import zipfile
+from datetime import date, datetime, timedelta
+
+from backup_archive import (ImportReport, backup_entries, compile_word_validator, import_words, iter_json_items,
+                            word_defaults, write_backup_zip)
+from distractors import DistractorSampler
+from journal import answer_record
+from quiz import QuestionGenerator, generate_question, select_word
+from quiz_engine import QuizEngine
+from scheduler import ReviewScheduler
+from search_index import SearchIndex
+from stats import DailyStats
+from storage import JsonStorage, SqliteStorage
+from word_index import AgeBucketIndex, WrongWordsIndex, all_age_days, word_age_days
+from word_list import WordQueryEngine, filter_words
+from word_store import ColumnarWordStore
+
+DEFAULT_SIZES = (100, 1000, 10000, 100000, 1000000)
+SYLLABLES = ("ab", "ac", "al", "an", "ar", "be", "ca", "co", "de", "di", "en", "er", "fa", "ge", "in", "is",
+             "ka", "la", "le", "ma", "mi", "ne", "no", "or", "pa", "ra", "re", "ri", "sa", "se", "ta", "te",
+             "ti", "to", "ul", "un", "ur", "va", "ya", "ze")
+SEARCH_QUERIES = ("ar", "ara", "arabe")
+TEST_TYPES = ("en_tr", "tr_en", "tekrar", "yanlis")
+LIST_QUERIES = (
+    ("Tümü", "En Yeni", ""),
+    ("Bu Hafta", "Alfabetik", ""),
+    ("Yanlış Olanlar", "En Çok Yanlış", ""),
+    ("Tümü", "Alfabetik", "ar"),
+)
+
+
+def make_word(rng, min_parts=2, max_parts=5):
+    return "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(min_parts, max_parts)))
+
+
+def make_vocabulary(size, today, rng, mean_age_days=120, max_age_days=1500, wrong_ratio=0.15):
+    """Gerçekçi dağılımlı sentetik kelime listesi ve puan verisi üret
+
+    Eklenme tarihleri yakın günlere yoğunlaşır (üstel dağılım); kelimelerin bir kısmı
+    yanlış cevaplanmış, bunların bir kısmı da yanlış listesindedir.
+    """
+    kelimeler = []
+    seen = set()
+    wrong_list = []
+    for i in range(size):
+        en = make_word(rng)
+        if en in seen:
+            en = f"{en}{i}"
+        seen.add(en)
+        age = min(int(rng.expovariate(1 / mean_age_days)), max_age_days)
+        word = {
+            "en": en,
+            "tr": make_word(rng),
+            "wrong_count": 0,
+            "wrong_test_count": 0,
+            "added_date": (today - timedelta(days=age)).strftime("%Y-%m-%d"),
+        }
+        if rng.random() < wrong_ratio:
+            word["wrong_count"] = 1 + int(rng.expovariate(0.5))
+            word["last_wrong_date"] = (today - timedelta(days=rng.randint(0, age))).strftime("%Y-%m-%d")
+            if rng.random() < 0.3:
+                wrong_list.append(en)
+                word["wrong_test_count"] = rng.randint(0, 2)
+        kelimeler.append(word)
+
+    daily = {}
+    for days_ago in range(min(365, max_age_days)):
+        daily[(today - timedelta(days=days_ago)).strftime("%Y-%m-%d")] = {
+            "puan": rng.randint(0, 120), "yeni_kelime": rng.randint(0, 20), "dogru": rng.randint(0, 90),
+            "yanlis": rng.randint(0, 30), "en_tr_answered": 30, "tr_en_answered": 30, "tekrar_answered": 30,
+        }
+    score_data = {
+        "score": sum(d["puan"] for d in daily.values()), "daily": daily,
+        "last_check_date": today.strftime("%Y-%m-%d"), "answered_today": 0,
+        "correct_streak": 0, "wrong_streak": 0, "combo_multiplier": 1.0,
+        "en_tr_answered": 0, "tr_en_answered": 0, "tekrar_answered": 0,
+        "wrong_words_list": wrong_list,
+    }
+    return kelimeler, score_data
+
+
+def measure(func, repeat=5, min_time=0.05, slow_time=1.0):
+    """func'ı çağrı başına süre olarak ölç; hızlı fonksiyonlar döngüde toplu çalıştırılır"""
+    number = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time or number >= 10 ** 6:
+            break
+        number *= 10
+    timings = [elapsed / number]
+    if elapsed < slow_time:
+        for _ in range(repeat - 1):
+            started = time.perf_counter()
+            for _ in range(number):
+                func()
+            timings.append((time.perf_counter() - started) / number)
+    return {
+        "median_s": statistics.median(timings),
+        "min_s": min(timings),
+        "mean_s": statistics.fmean(timings),
+        "runs": len(timings),
+        "number": number,
+    }
+
+
+def run_size(size, today, seed, repeat, workdir, log, word_store="dict"):
+    """Tek bir kelime sayısı için tüm ölçümler"""
+    rng = random.Random(seed)
+    kelimeler, score_data = make_vocabulary(size, today, rng)
+    results = {}
+    if word_store == "columnar":
+        kelimeler = ColumnarWordStore(kelimeler)
+
+    def bench(name, func, **kwargs):
+        kwargs.setdefault("repeat", repeat)
+        results[name] = measure(func, **kwargs)
+        log(f"  {name:<40} {results[name]['median_s'] * 1e6:>14.2f} µs")
+
+    age_index = AgeBucketIndex()
+    sampler = DistractorSampler()
+    wrong_index = WrongWordsIndex()
+    bench("index_build.age", lambda: age_index.build(kelimeler, today), repeat=min(repeat, 3))
+    bench("age_days.per_word", lambda: [word_age_days(k, today) for k in kelimeler], repeat=min(repeat, 3))
+    bench("age_days.all", lambda: all_age_days(kelimeler, today), repeat=min(repeat, 3))
+    bench("index_build.distractors", lambda: sampler.build(kelimeler), repeat=min(repeat, 3))
+    bench("index_build.wrong", lambda: wrong_index.build(kelimeler, score_data["wrong_words_list"]),
+          repeat=min(repeat, 3))
+    scheduler = ReviewScheduler(wrong_index)
+    bench("index_build.scheduler", lambda: scheduler.build(kelimeler), repeat=min(repeat, 3))
+
+    for test_type in ("en_tr", "tekrar"):
+        bench(f"select_word_by_probability.{test_type}",
+              lambda t=test_type: select_word(kelimeler, age_index, today, t, rng))
+    for test_type in TEST_TYPES:
+        bench(f"generate_question.{test_type}",
+              lambda t=test_type: generate_question(t, kelimeler, age_index, sampler, wrong_index, today, rng=rng,
+                                                    scheduler=scheduler))
+    bench("generate_question.en_tr_hard",
+          lambda: generate_question("en_tr", kelimeler, age_index, sampler, wrong_index, today, hard=True, rng=rng))
+    bench("get_wrong_words", wrong_index.wrong_words)
+    engine = QuizEngine(kelimeler, score_data, today, (age_index, sampler, wrong_index, scheduler),
+                        QuestionGenerator(seed))
+    bench("quiz_engine.next_question", lambda: engine.next_question("en_tr"))
+    question = engine.next_question("en_tr")
+    # Doğru/yanlış dönüşümlü: sürekli doğru cevapta tekrar aralığı sınırsız büyür
+    choices = itertools.cycle([question["dogru"], None])
+    bench("quiz_engine.answer", lambda: engine.answer(question, next(choices)))
+
+    for filtre, siralama, arama in LIST_QUERIES:
+        name = f"word_list.{filtre}/{siralama}" + (f"/{arama}" if arama else "")
+        bench(name, lambda f=filtre, s=siralama, a=arama: filter_words(kelimeler, f, s, a, today, wrong_index))
+    revisions = iter(range(10 ** 9))
+    word_query = WordQueryEngine()
+    for filtre, siralama, arama in LIST_QUERIES:
+        name = f"word_query.{filtre}/{siralama}" + (f"/{arama}" if arama else "")
+        bench(name + ".cold", lambda f=filtre, s=siralama, a=arama: word_query.query(
+            kelimeler, next(revisions), f, s, a, today, wrong_index, 0, 20))
+        page = lambda f=filtre, s=siralama, a=arama: word_query.query(
+            kelimeler, -1, f, s, a, today, wrong_index, 100, 20)
+        page()
+        bench(name + ".page", page)
+
+    today_str = today.strftime("%Y-%m-%d")
+    daily_stats = DailyStats()
+    bench("stats.build", lambda: daily_stats.build(score_data["daily"], today))
+    today_stats = score_data["daily"][today_str]
+
+    def record_answer():
+        today_stats["dogru"] += 1
+        daily_stats.observe(today_str, today_stats)
+    bench("stats.observe", record_answer)
+
+    search_index = SearchIndex()
+    bench("index_build.search", lambda: search_index.build(kelimeler), repeat=min(repeat, 3))
+    for arama in SEARCH_QUERIES:
+        bench(f"search.{arama}", lambda a=arama: search_index.search(a))
+    bench("search.fuzzy", lambda: search_index.fuzzy_search(kelimeler[len(kelimeler) // 2]["en"] + "x"))
+    bench("word_query.Tümü/Alfabetik/ar.indexed", lambda: word_query.query(
+        kelimeler, next(revisions), "Tümü", "Alfabetik", "ar", today, wrong_index, 0, 20, search_index=search_index))
+
+    json_storage = JsonStorage(*(os.path.join(workdir, name) for name in (
+        "kelimeler.json", "puan.json", "kelimeler_backup.json", "puan_backup.json", "veri_journal.jsonl")))
+    bench("safe_save_data.json", lambda: json_storage.save_all(kelimeler, score_data), repeat=min(repeat, 3))
+    sqlite_storage = SqliteStorage(os.path.join(workdir, "akademi.db"))
+    bench("safe_save_data.sqlite", lambda: sqlite_storage.save_all(kelimeler, score_data), repeat=min(repeat, 3))
+
+    record = answer_record(kelimeler[0], score_data, today_str, False, test_type="en_tr", is_correct=True,
+                           points=1, answered_at=f"{today_str}T12:00:00")
+    json_storage.journal.max_bytes = float("inf")
+    bench("safe_save_record.json", lambda: json_storage.save_record(record, kelimeler, score_data))
+    bench("safe_save_record.sqlite", lambda: sqlite_storage.save_record(record, kelimeler, score_data))
+    sqlite_storage.conn.close()
+
+    def backup_zip():
+        with open(os.path.join(workdir, "yedek.zip"), "wb") as f:
+            write_backup_zip(f, backup_entries(kelimeler, score_data, {"total_words": len(kelimeler)}))
+    bench("backup_zip", backup_zip, repeat=min(repeat, 3))
+
+    def backup_import():
+        with zipfile.ZipFile(os.path.join(workdir, "yedek.zip")) as zip_file, zip_file.open("kelimeler.json") as f:
+            import_words(iter_json_items(f), [], compile_word_validator(word_defaults(today_str)), ImportReport())
+    bench("backup_import", backup_import, repeat=min(repeat, 3))
+    return results
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(sizes, seed=1234, repeat=5, today=None, log=print, word_store="dict"):
+    """Tüm boyutlar için ölçüm raporu"""
+    today = today or date.today()
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": seed,
+            "word_store": word_store,
+            "today": today.isoformat(),
+        },
+        "results": {},
+    }
+    for size in sizes:
+        log(f"{size} kelime")
+        with tempfile.TemporaryDirectory() as workdir:
+            report["results"][str(size)] = run_size(size, today, seed, repeat, workdir, log, word_store)
+    return report
+
+
+def compare(old_report, new_report, log=print):
+    """İki raporu karşılaştır (oran < 1 → yeni sürüm daha hızlı)"""
+    log(f"{old_report['meta'].get('commit')} → {new_report['meta'].get('commit')}")
+    for size, new_results in new_report["results"].items():
+        old_results = old_report["results"].get(size, {})
+        log(f"{size} kelime")
+        for name, new in new_results.items():
+            old = old_results.get(name)
+            if old is None:
+                log(f"  {name:<40} {'-':>12} {new['median_s'] * 1e6:>12.2f} µs")
+                continue
+            ratio = new["median_s"] / old["median_s"] if old["median_s"] else float("inf")
+            log(f"  {name:<40} {old['median_s'] * 1e6:>12.2f} {new['median_s'] * 1e6:>12.2f} µs  x{ratio:.2f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Akademi sıcak yol ölçümleri")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help="virgülle ayrılmış kelime sayıları")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("-o", "--output", default="benchmark.json")
+    parser.add_argument("--word-store", choices=("dict", "columnar"), default="dict",
+                        help="kelimelerin bellekte tutulma biçimi")
+    parser.add_argument("--compare", nargs=2, metavar=("ESKI", "YENI"), help="iki raporu karşılaştır")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        reports = []
+        for path in args.compare:
+            with open(path, "r", encoding="utf-8") as f:
+                reports.append(json.load(f))
+        compare(*reports)
+        return 0
+
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+    report = run(sizes, seed=args.seed, repeat=args.repeat, word_store=args.word_store)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"Rapor yazıldı: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+import threading
+import time
+from datetime import datetime, timedelta
+
+WORLD_TIME_URL = "http://worldtimeapi.org/api/timezone/Europe/Istanbul"
+DEFAULT_OFFSET_TTL = 6 * 60 * 60
+DEFAULT_RETRY_AFTER = 5 * 60
+
+
+def world_time_source(url=WORLD_TIME_URL, timeout=5):
+    """worldtimeapi.org'dan güncel zamanı döndüren kaynak fonksiyonu üret"""
+    def fetch():
+        import requests
+        response = requests.get(url, timeout=timeout)
+        response.raise_for_status()
+        data = response.json()
+        return datetime.fromisoformat(data['datetime'].replace('Z', '+00:00')).replace(tzinfo=None)
+    return fetch
+
+
+class ClockService:
+    """Sistem saati + önbellekteki internet saati farkı; ağ isteği hiçbir zaman beklenmez
+
+    source() uzak zamanı datetime olarak döndürür (testlerde sahte kaynak verilebilir).
+    Fark arka plan iş parçacığında alınır ve ttl saniye geçerlidir; başarısız denemeler
+    retry_after saniye sonra tekrarlanır. Fark bilinmezken sistem saati kullanılır.
+    """
+
+    def __init__(self, source, ttl=DEFAULT_OFFSET_TTL, retry_after=DEFAULT_RETRY_AFTER,
+                 system_now=datetime.now, monotonic=time.monotonic, background=True):
+        self.source = source
+        self.ttl = ttl
+        self.retry_after = retry_after
+        self.system_now = system_now
+        self.monotonic = monotonic
+        self.background = background
+        self.offset = None
+        self.next_refresh = 0.0
+        self.fetching = False
+        self.lock = threading.Lock()
+
+    def now(self):
+        """Anında dönen güncel zaman"""
+        self._maybe_refresh()
+        offset = self.offset
+        return self.system_now() + (offset if offset is not None else timedelta(0))
+
+    def _maybe_refresh(self):
+        with self.lock:
+            if self.fetching or self.monotonic() < self.next_refresh:
+                return
+            self.fetching = True
+        if self.background:
+            threading.Thread(target=self.refresh, daemon=True).start()
+        else:
+            self.refresh()
+
+    def refresh(self):
+        """Uzak zamanı al ve farkı güncelle (istek süresinin yarısı kadar düzeltilir)"""
+        try:
+            started = self.system_now()
+            remote = self.source()
+            finished = self.system_now()
+            self.offset = remote - (started + (finished - started) / 2)
+            self.next_refresh = self.monotonic() + self.ttl
+        except Exception:
+            self.next_refresh = self.monotonic() + self.retry_after
+        finally:
+            with self.lock:
+                self.fetching = False
@@ -0,0 +1,137 @@
+import copy
+import os
+import re
+from datetime import datetime
+
+from storage import JsonStorage, SqliteStorage, migrate_json_to_sqlite
+from word_store import ColumnarWordStore
+
+# Streamlit uygulaması (app.py) ve API sunucusu (api_server.py) aynı dosyaları,
+# aynı ortam değişkenlerini ve aynı yükleme adımlarını buradan kullanır.
+
+DATA_FILE = "kelimeler.json"
+SCORE_FILE = "puan.json"
+BACKUP_DATA_FILE = "kelimeler_backup.json"
+BACKUP_SCORE_FILE = "puan_backup.json"
+JOURNAL_FILE = "veri_journal.jsonl"
+JOURNAL_MAX_BYTES = 256 * 1024
+# "json" (varsayılan) veya "sqlite"; AKADEMI_STORAGE ortam değişkeniyle seçilir
+STORAGE_BACKEND = os.environ.get("AKADEMI_STORAGE", "json")
+SQLITE_FILE = "akademi.db"
+SHEETS_STATE_FILE = "sheets_sync_state.json"
+SHEETS_DIRTY_FILE = "sheets_sync_dirty.json"
+# "dict" (varsayılan) veya "columnar"; AKADEMI_WORD_STORE ile seçilir
+WORD_STORE = os.environ.get("AKADEMI_WORD_STORE", "dict")
+# Verilirse çok kullanıcılı mod: her kullanıcının dosyaları AKADEMI_USERS_DIR/<kullanıcı>/ altında tutulur.
+# Kullanıcı kimliği bir kimlik doğrulama değildir; kimliği bilen herkes o kullanıcının verisine erişir.
+USERS_DIR = os.environ.get("AKADEMI_USERS_DIR")
+BASE_VOCABULARY_FILE = os.environ.get("AKADEMI_BASE_VOCABULARY", "temel_kelimeler.json")
+MAX_ACTIVE_USERS = int(os.environ.get("AKADEMI_MAX_ACTIVE_USERS", "50"))
+USER_ID_PATTERN = re.compile(r"[A-Za-z0-9_-][A-Za-z0-9_.-]{0,63}")
+# Verilirse soru üreteci bu tohumla başlar (tekrarlanabilir yük testleri için)
+QUIZ_SEED = os.environ.get("AKADEMI_QUIZ_SEED")
+
+SCORE_TEMPLATE = {
+    "score": 0, "daily": {}, "last_check_date": None, "answered_today": 0,
+    "correct_streak": 0, "wrong_streak": 0, "combo_multiplier": 1.0,
+    "en_tr_answered": 0, "tr_en_answered": 0, "tekrar_answered": 0, "wrong_words_list": []
+}
+
+
+def user_directory(user_id):
+    """Kullanıcının veri dizini (tek kullanıcılı modda çalışma dizini)"""
+    return "" if user_id is None else os.path.join(USERS_DIR, user_id)
+
+
+def open_storage(directory, base=None):
+    """Dizindeki (json_storage, storage) çifti; SQLite seçiliyse storage SQLite deposudur
+
+    json_storage her zaman döndürülür (SQLite'a ilk geçişte kaynak olarak kullanılır).
+    """
+    path = lambda name: os.path.join(directory, name)
+    json_storage = JsonStorage(path(DATA_FILE), path(SCORE_FILE), path(BACKUP_DATA_FILE), path(BACKUP_SCORE_FILE),
+                               path(JOURNAL_FILE), JOURNAL_MAX_BYTES, base=base)
+    if STORAGE_BACKEND == "sqlite":
+        return json_storage, SqliteStorage(path(SQLITE_FILE), base=base)
+    return json_storage, json_storage
+
+
+def load_data(storage, json_storage=None, base=None, today_str=None, defaults=None, report=None):
+    """Verileri güvenli bir şekilde yükle; (kelimeler, score_data) döndür
+
+    Gerekirse JSON dosyaları SQLite'a aktarılır, son snapshot'tan sonraki günlük
+    uygulanır ve eksik alanlar tamamlanır. Yeni kullanıcı (base verilmiş ve dosya
+    yok) temel kelime listesiyle başlar ve hemen kaydedilir. defaults() varsayılan
+    (kelimeler, score_data) döndürür: verilirse boş kelime dosyasında, tek
+    kullanıcılı modda puan dosyası yokken ve okuma hatasında kullanılır; verilmezse
+    okuma hatası yükseltilir. report(seviye, mesaj) ile arayüze bilgi verilir
+    (seviye: "info", "warning" veya "error"). today_str verilmezse sistem tarihi
+    kullanılır (yeni kelimelerin eklenme tarihi).
+    """
+    report = report or (lambda level, message: None)
+    today_str = today_str or datetime.now().strftime("%Y-%m-%d")
+    new_user = False
+    kelimeler = []
+    score_data = copy.deepcopy(SCORE_TEMPLATE)
+
+    try:
+        if STORAGE_BACKEND == "sqlite" and json_storage is not None and json_storage is not storage \
+                and not storage.initialized and os.path.exists(json_storage.data_file):
+            migrated = migrate_json_to_sqlite(json_storage, storage)
+            report("info", f"🗄️ {migrated} kelime JSON dosyalarından SQLite veritabanına aktarıldı.")
+        loaded_words, loaded_score = storage.load()
+        if loaded_words is not None:
+            kelimeler = loaded_words
+            if not kelimeler and defaults is not None:
+                report("warning", "⚠️ Kelimeler dosyası boş, varsayılan veriler yükleniyor...")
+                kelimeler, _ = defaults()
+        elif base:
+            # Yeni kullanıcı: temel kelime listesine referanslarla başlar
+            kelimeler = base.new_user_words(today_str)
+            new_user = True
+        else:
+            report("info", "📝 Henüz eklenmiş kelime yok.")
+
+        if isinstance(loaded_score, dict):
+            score_data.update({key: loaded_score[key] for key in SCORE_TEMPLATE if key in loaded_score})
+        elif loaded_score is None and base is None and defaults is not None:
+            _, score_data = defaults()
+    except Exception as e:
+        if defaults is None:
+            raise
+        report("error", f"Hata: {e}")
+        kelimeler, score_data = defaults()
+
+    # Ek güvenlik kontrolleri
+    if not isinstance(kelimeler, list):
+        kelimeler = []
+    if not isinstance(score_data, dict):
+        score_data = copy.deepcopy(SCORE_TEMPLATE)
+
+    # Son snapshot'tan sonraki değişiklikleri günlükten uygula
+    try:
+        storage.replay(kelimeler, score_data)
+    except Exception as e:
+        if defaults is None:
+            raise
+        report("error", f"Günlük uygulanırken hata: {e}")
+
+    # Eksik anahtarları ve her kelimenin eksik alanlarını tamamla
+    for key, value in SCORE_TEMPLATE.items():
+        if key not in score_data:
+            score_data[key] = copy.deepcopy(value)
+    for kelime in kelimeler:
+        kelime.setdefault("wrong_test_count", 0)
+        kelime.setdefault("added_date", today_str)
+
+    if WORD_STORE == "columnar":
+        kelimeler = ColumnarWordStore(kelimeler)
+    if new_user:
+        # Eklenme tarihleri ilk günün tarihiyle hemen yazılır (sonraki yüklemelerde değişmesin)
+        try:
+            storage.save_all(kelimeler, score_data)
+        except Exception as e:
+            if defaults is None:
+                raise
+            report("error", f"Veri kaydedilirken hata: {e}")
+    return kelimeler, score_data
@@ -0,0 +1,125 @@
+import random
+
+DISTRACTOR_FIELDS = ("en", "tr")
+SMALL_POOL_SIZE = 16
+
+
+class RandomSet:
+    """O(1) ekleme, silme ve rastgele seçim destekleyen küme"""
+
+    def __init__(self):
+        self.items = []
+        self.positions = {}
+
+    def __len__(self):
+        return len(self.items)
+
+    def __contains__(self, item):
+        return item in self.positions
+
+    def add(self, item):
+        if item not in self.positions:
+            self.positions[item] = len(self.items)
+            self.items.append(item)
+
+    def remove(self, item):
+        index = self.positions.pop(item, None)
+        if index is None:
+            return
+        last = self.items.pop()
+        if index < len(self.items):
+            self.items[index] = last
+            self.positions[last] = index
+
+    def choice(self, rng=random):
+        return self.items[rng.randrange(len(self.items))]
+
+
+def prefix_key(form):
+    """Zor seçenekler için ön ek anahtarı"""
+    return form[:2].casefold()
+
+
+class DistractorSampler:
+    """Kopyalama yapmadan, reddetmeli örnekleme ile yanlış seçenek üreten motor"""
+
+    def __init__(self):
+        self.forms = {field: RandomSet() for field in DISTRACTOR_FIELDS}
+        self.refcounts = {field: {} for field in DISTRACTOR_FIELDS}
+        self.by_prefix = {field: {} for field in DISTRACTOR_FIELDS}
+        self.by_length = {field: {} for field in DISTRACTOR_FIELDS}
+
+    def build(self, kelimeler):
+        """Tüm kelimelerden tekilleştirilmiş seçenek dizilerini kur"""
+        self.__init__()
+        for word in kelimeler:
+            self.add(word)
+
+    def add(self, word):
+        """Kelimenin EN/TR biçimlerini ekle (aynı biçim referans sayılır)"""
+        for field in DISTRACTOR_FIELDS:
+            form = word.get(field)
+            if not form:
+                continue
+            counts = self.refcounts[field]
+            counts[form] = counts.get(form, 0) + 1
+            if counts[form] == 1:
+                self.forms[field].add(form)
+                self.by_prefix[field].setdefault(prefix_key(form), RandomSet()).add(form)
+                self.by_length[field].setdefault(len(form), RandomSet()).add(form)
+
+    def remove(self, word):
+        """Kelimenin biçimlerini çıkar; başka kelime kullanmıyorsa diziden silinir"""
+        for field in DISTRACTOR_FIELDS:
+            form = word.get(field)
+            counts = self.refcounts[field]
+            if not form or form not in counts:
+                continue
+            counts[form] -= 1
+            if counts[form] == 0:
+                del counts[form]
+                self.forms[field].remove(form)
+                self._discard(self.by_prefix[field], prefix_key(form), form)
+                self._discard(self.by_length[field], len(form), form)
+
+    @staticmethod
+    def _discard(buckets, key, form):
+        bucket = buckets.get(key)
+        if bucket is not None:
+            bucket.remove(form)
+            if not bucket:
+                del buckets[key]
+
+    def sample(self, field, answer, k=3, rng=random, hard=False):
+        """Cevap dışındaki k farklı seçeneği döndür"""
+        pool = self.forms[field]
+        available = len(pool) - (1 if answer in pool else 0)
+        k = min(k, available)
+        chosen = []
+        if k <= 0:
+            return chosen
+        if hard:
+            buckets = [self.by_prefix[field].get(prefix_key(answer))]
+            buckets += [self.by_length[field].get(len(answer) + d) for d in (0, -1, 1)]
+            for bucket in buckets:
+                if bucket:
+                    self._draw(bucket, answer, k, chosen, rng, attempts=4 * k)
+                if len(chosen) >= k:
+                    return chosen
+        self._draw(pool, answer, k, chosen, rng)
+        return chosen
+
+    @staticmethod
+    def _draw(pool, answer, k, chosen, rng, attempts=None):
+        """chosen listesini pool'dan k elemana tamamla"""
+        if len(pool) <= SMALL_POOL_SIZE:
+            candidates = [form for form in pool.items if form != answer and form not in chosen]
+            rng.shuffle(candidates)
+            chosen.extend(candidates[:k - len(chosen)])
+            return
+        while len(chosen) < k and (attempts is None or attempts > 0):
+            form = pool.choice(rng)
+            if form != answer and form not in chosen:
+                chosen.append(form)
+            if attempts is not None:
+                attempts -= 1
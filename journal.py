@@ -0,0 +1,296 @@
+import json
+import os
+import threading
+from collections.abc import Mapping
+
+try:
+    import fcntl
+except ImportError:
+    # Windows
+    fcntl = None
+    import msvcrt
+
+# Her değişiklik tek satırlık, durum tabanlı (idempotent) bir kayıt olarak
+# yazılır; aynı kayıt iki kez uygulansa bile sonuç değişmez. Bu sayede yarıda
+# kalan bir sıkıştırmadan sonra günlüğü tekrar oynatmak güvenlidir.
+
+SCORE_SCALAR_KEYS = (
+    "score", "last_check_date", "answered_today", "correct_streak", "wrong_streak",
+    "combo_multiplier", "en_tr_answered", "tr_en_answered", "tekrar_answered"
+)
+ANSWER_WORD_KEYS = ("wrong_count", "wrong_test_count", "last_wrong_date", "interval", "ease", "reps", "due_date")
+
+
+class FileLock:
+    """Süreçler arası kilit: süreç içinde RLock, süreçler arasında kilit dosyası üzerinde flock
+
+    Aynı iş parçacığı iç içe alabilir; dosya kilidi yalnızca en dıştaki alışta
+    alınır. Süreç çökerse işletim sistemi kilidi bırakır.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.thread_lock = threading.RLock()
+        self.depth = 0
+        self.file = None
+
+    def acquire(self):
+        self.thread_lock.acquire()
+        if self.depth == 0:
+            try:
+                self.file = open(self.path, "a+b")
+                if fcntl is not None:
+                    fcntl.flock(self.file.fileno(), fcntl.LOCK_EX)
+                else:
+                    self.file.seek(0)
+                    msvcrt.locking(self.file.fileno(), msvcrt.LK_LOCK, 1)
+            except BaseException:
+                if self.file is not None:
+                    self.file.close()
+                    self.file = None
+                self.thread_lock.release()
+                raise
+        self.depth += 1
+        return True
+
+    def release(self):
+        self.depth -= 1
+        if self.depth == 0:
+            try:
+                if fcntl is not None:
+                    fcntl.flock(self.file.fileno(), fcntl.LOCK_UN)
+                else:
+                    self.file.seek(0)
+                    msvcrt.locking(self.file.fileno(), msvcrt.LK_UNLCK, 1)
+            finally:
+                self.file.close()
+                self.file = None
+        self.thread_lock.release()
+
+    def __enter__(self):
+        return self.acquire()
+
+    def __exit__(self, *exc):
+        self.release()
+
+
+class DataJournal:
+    """kelimeler.json / puan.json için yalnızca ekleme yapılan değişiklik günlüğü
+
+    lock süreçler arasıdır: aynı dizine yazan ikinci bir süreç (ör. Streamlit
+    yanında api_server.py) ekleme, döndürme ve sıkıştırmayla iç içe geçemez.
+    """
+
+    def __init__(self, path, max_bytes=256 * 1024):
+        self.path = path
+        self.rotated_path = path + ".old"
+        self.max_bytes = max_bytes
+        self.lock = FileLock(path + ".lock")
+        self.compacting = False
+        # Her clear() (tam kayıt) ile artar; arka planda hazırlanan eski snapshot'ı ayırt eder
+        self.generation = 0
+
+    def append(self, record):
+        """Kaydı günlüğe ekle, eşik aşıldıysa True döndür"""
+        line = json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+        with self.lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+            return self.size() >= self.max_bytes
+
+    def size(self):
+        """Aktif günlük dosyasının bayt cinsinden boyutu"""
+        try:
+            return os.path.getsize(self.path)
+        except OSError:
+            return 0
+
+    def records(self):
+        """Önce döndürülmüş, sonra aktif günlükteki kayıtları sırayla üret"""
+        for path in (self.rotated_path, self.path):
+            if not os.path.exists(path):
+                continue
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        # Yarım yazılmış son satır (çökme) atlanır
+                        continue
+
+    def rotate(self):
+        """Aktif günlüğü sıkıştırma için kenara al, yeni kayıtlar boş dosyaya yazılsın"""
+        with self.lock:
+            if not os.path.exists(self.path):
+                return
+            if os.path.exists(self.rotated_path):
+                # Önceki sıkıştırma tamamlanmamış: kayıtları sırayı bozmadan birleştir
+                with open(self.path, "r", encoding="utf-8") as src, \
+                        open(self.rotated_path, "a", encoding="utf-8") as dst:
+                    dst.write(src.read())
+                os.remove(self.path)
+            else:
+                os.replace(self.path, self.rotated_path)
+
+    def _rotated_state(self):
+        try:
+            stat = os.stat(self.rotated_path)
+            return stat.st_mtime_ns, stat.st_size
+        except OSError:
+            return None
+
+    def compact(self, prepare, publish, background=False, on_done=None, on_rotated=None):
+        """Günlüğü snapshot dosyalarına işle
+
+        prepare() snapshot'ı geçici dosyalara kilit dışında yazar (başarıda True).
+        publish(current) kilit altında çağrılır: current True ise geçici dosyaları
+        yerine koyar ve başarıda True döndürür; arada tam kayıt (clear) yapıldıysa
+        ya da başka bir süreç döndürülmüş günlüğe dokunduysa current False olur ve
+        hazırlanan eski snapshot atılmalıdır.
+        on_rotated() döndürmeden hemen sonra kilit altında çağrılır; False
+        döndürürse (bellekteki veri diskteki günlüğü içermiyor) sıkıştırma yapılmaz,
+        kayıtlar döndürülmüş günlükte kalır ve yüklemede oynatılır.
+        on_done kilit dışında ve compacting hâlâ True iken çağrılır; böylece
+        aradaki dosya değişiklikleri başka bir değişiklik sanılmaz.
+        """
+        with self.lock:
+            if self.compacting:
+                return False
+            self.compacting = True
+            generation = self.generation
+            try:
+                self.rotate()
+                rotated = self._rotated_state()
+                if on_rotated is not None and not on_rotated():
+                    self.compacting = False
+                    return False
+            except OSError:
+                self.compacting = False
+                raise
+
+        def run():
+            try:
+                prepared = prepare()
+                with self.lock:
+                    current = self.generation == generation and self._rotated_state() == rotated
+                    if prepared and publish(current) and current:
+                        self.discard_rotated()
+                if on_done is not None:
+                    on_done()
+            finally:
+                self.compacting = False
+
+        if background:
+            threading.Thread(target=run, daemon=True).start()
+        else:
+            run()
+        return True
+
+    def discard_rotated(self):
+        """Snapshot'a işlenmiş eski günlüğü sil"""
+        with self.lock:
+            if os.path.exists(self.rotated_path):
+                os.remove(self.rotated_path)
+
+    def clear(self):
+        """Tüm günlüğü temizle (tam kayıt sonrası)"""
+        with self.lock:
+            self.generation += 1
+            for path in (self.rotated_path, self.path):
+                if os.path.exists(path):
+                    os.remove(path)
+
+
+def score_patch(score_data, dates):
+    """Puan verisinin skaler alanlarını ve verilen günlerin kayıtlarını içeren yama"""
+    patch = {"s": {key: score_data[key] for key in SCORE_SCALAR_KEYS if key in score_data}}
+    daily = score_data.get("daily", {})
+    patch["d"] = {date_str: daily[date_str] for date_str in dates if date_str in daily}
+    return patch
+
+
+def answer_record(word, score_data, today_str, in_wrong_list=None, test_type=None, is_correct=None,
+                  points=None, answered_at=None):
+    """Cevaplanan kelime için günlük kaydı (t/ok/p/at alanları yalnızca cevap geçmişi içindir)"""
+    record = {"op": "answer", "en": word["en"], "w": {key: word[key] for key in ANSWER_WORD_KEYS if key in word}}
+    record.update(score_patch(score_data, [today_str]))
+    if in_wrong_list is None:
+        in_wrong_list = word["en"] in score_data.get("wrong_words_list", [])
+    record["wl"] = in_wrong_list
+    for key, value in (("t", test_type), ("ok", is_correct), ("p", points), ("at", answered_at)):
+        if value is not None:
+            record[key] = value
+    return record
+
+
+def word_record(op, word, score_data=None, dates=(), old_en=None):
+    """Kelime ekleme / düzenleme / silme kaydı"""
+    if op == "delete":
+        record = {"op": op, "en": word["en"]}
+    elif op == "edit":
+        record = {"op": op, "en": old_en if old_en is not None else word["en"], "w": dict(word)}
+    else:
+        record = {"op": op, "w": dict(word)}
+    if score_data is not None:
+        record.update(score_patch(score_data, dates))
+    return record
+
+
+def replay(kelimeler, score_data, records):
+    """Günlük kayıtlarını yüklenmiş snapshot üzerine uygula, uygulanan kayıt sayısını döndür"""
+    by_en = {k["en"]: k for k in kelimeler if isinstance(k, Mapping) and "en" in k}
+    wrong_list = score_data.setdefault("wrong_words_list", [])
+    daily = score_data.setdefault("daily", {})
+    count = 0
+    for record in records:
+        op = record.get("op")
+        word_id = record.get("en")
+        if op == "add":
+            word = record["w"]
+            word_id = word["en"]
+            if word_id not in by_en:
+                kelimeler.append(word)
+                by_en[word_id] = word
+        elif op in ("edit", "answer"):
+            word = by_en.get(word_id)
+            new_id = record["w"].get("en", word_id)
+            existing = by_en.get(new_id)
+            if word is not None and existing is not None and existing is not word:
+                # Yeniden adlandırma snapshot'ta zaten var: tekrar eklenen kopyayı at
+                kelimeler.remove(word)
+                by_en.pop(word_id)
+                word = existing
+            elif word is None:
+                word = existing
+            if word is not None:
+                word.update(record["w"])
+                if new_id != word_id:
+                    by_en.pop(word_id, None)
+                    by_en[new_id] = word
+                    if word_id in wrong_list:
+                        if new_id in wrong_list:
+                            wrong_list.remove(word_id)
+                        else:
+                            wrong_list[wrong_list.index(word_id)] = new_id
+                    word_id = new_id
+        elif op == "delete":
+            word = by_en.pop(word_id, None)
+            if word is not None:
+                kelimeler.remove(word)
+            if word_id in wrong_list:
+                wrong_list.remove(word_id)
+        score_data.update(record.get("s", {}))
+        for date_str, day_data in record.get("d", {}).items():
+            daily[date_str] = day_data
+        if "wl" in record:
+            if record["wl"] and word_id not in wrong_list:
+                wrong_list.append(word_id)
+            elif not record["wl"] and word_id in wrong_list:
+                wrong_list.remove(word_id)
+        count += 1
+    return count
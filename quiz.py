@@ -0,0 +1,169 @@
+import random
+import threading
+from collections import deque
+
+EN_TR_TEXT = "🇺🇸 **{en}** ne demek?"
+TR_EN_TEXT = "🇹🇷 **{tr}** kelimesinin İngilizcesi nedir?"
+PREFETCH_SIZE = 2
+
+
+def select_word(kelimeler, age_index, today, test_type, rng=random):
+    """Test türüne göre kelime seç (gün değiştiyse yaş indeksi yenilenir)"""
+    if not kelimeler:
+        return None
+    age_index.ensure_day(kelimeler, today)
+    return age_index.select(test_type, rng)
+
+
+def build_options(sampler, field, dogru, hard=False, rng=random):
+    """Doğru cevap ve 3 yanlış seçenekten karışık seçenek listesi oluştur"""
+    secenekler = sampler.sample(field, dogru, 3, rng=rng, hard=hard) + [dogru]
+    rng.shuffle(secenekler)
+    return secenekler
+
+
+def generate_question(test_type, kelimeler, age_index, sampler, wrong_index, today, hard=False, rng=random,
+                      scheduler=None, select=select_word):
+    """Test türüne göre (soru, doğru cevap, seçenekler, soru metni) üret
+
+    Genel Tekrar'da zamanlayıcı verilmişse önce tekrar günü en çok gecikmiş kelime
+    sorulur; tekrarı gelen kelime yoksa select (varsayılan: yaş kategorileri) ile seçilir.
+    """
+    if test_type == "yanlis":
+        wrong_words = wrong_index.wrong_words()
+        if not wrong_words:
+            return None, None, None, None
+        soru = rng.choice(wrong_words)
+        direction = "en_tr"
+    else:
+        soru = None
+        if test_type == "tekrar" and scheduler is not None:
+            soru = scheduler.next_due(today)
+        if soru is None:
+            soru = select(kelimeler, age_index, today, test_type, rng)
+        if soru is None:
+            return None, None, None, None
+        if test_type == "tekrar":
+            direction = "en_tr" if rng.choice([True, False]) else "tr_en"
+        else:
+            direction = test_type
+    if direction == "en_tr":
+        dogru = soru["tr"]
+        secenekler = build_options(sampler, "tr", dogru, hard, rng)
+        question_text = EN_TR_TEXT.format(en=soru["en"])
+    else:
+        dogru = soru["en"]
+        secenekler = build_options(sampler, "en", dogru, hard, rng)
+        question_text = TR_EN_TEXT.format(tr=soru["tr"])
+    return soru, dogru, secenekler, question_text
+
+
+class QuestionGenerator:
+    """Tohumlanabilir soru üreteci: rastgelelik kaynağı ve kelime seçim stratejisi
+
+    Aynı tohum, aynı strateji ve aynı veriyle aynı soru akışı üretilir; tohum
+    verilmezse rastgele seçilir ve kayıt için seed niteliğinde saklanır.
+    """
+
+    def __init__(self, seed=None, select=select_word):
+        self.seed = random.randrange(2 ** 32) if seed is None else seed
+        self.rng = random.Random(self.seed)
+        self.select = select
+
+    @property
+    def strategy(self):
+        return getattr(self.select, "__name__", repr(self.select))
+
+    def generate(self, test_type, kelimeler, age_index, sampler, wrong_index, today, hard=False, scheduler=None):
+        return generate_question(test_type, kelimeler, age_index, sampler, wrong_index, today, hard=hard,
+                                 rng=self.rng, scheduler=scheduler, select=self.select)
+
+
+class QuestionQueue:
+    """Oturum başına önceden üretilmiş soru kuyruğu
+
+    Sorular (generate_question çıktısı) bir anahtarla (test türü, seçenek
+    zorluğu, gün, kelime revizyonu) üretilir; anahtar değişince kuyruk boşaltılır.
+    refill() eksik soruları arka planda üretir, böylece sıradaki soru seçim ve
+    seçenek üretimini beklemeden gösterilir. revision her discard() ve clear()
+    ile artar; üretimi sırasında revizyon değişen soru kuyruğa eklenmez.
+    """
+
+    def __init__(self, size=PREFETCH_SIZE):
+        self.size = size
+        self.lock = threading.Lock()
+        self.key = None
+        self.questions = deque()
+        self.revision = 0
+        self.refilling = False
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.questions)
+
+    def _use_key(self, key):
+        if key != self.key:
+            self.questions.clear()
+            self.key = key
+
+    def pop(self, key, is_valid=None):
+        """Anahtara uyan ve is_valid(soru) ile hâlâ geçerli ilk soru; yoksa None"""
+        with self.lock:
+            self._use_key(key)
+            while self.questions:
+                question = self.questions.popleft()
+                if is_valid is None or is_valid(question):
+                    self.hits += 1
+                    return question
+            self.misses += 1
+            return None
+
+    def discard(self, word):
+        """Bu kelimeyi soran soruları at (cevaplanan kelimenin durumu değişti)"""
+        with self.lock:
+            self.questions = deque(question for question in self.questions if question[0] is not word)
+            self.revision += 1
+
+    def clear(self):
+        with self.lock:
+            self.questions.clear()
+            self.key = None
+            self.revision += 1
+
+    def refill(self, key, generate, background=True):
+        """Kuyruğu generate() ile size soruya tamamla (aynı anda tek doldurma çalışır)"""
+        with self.lock:
+            self._use_key(key)
+            if self.refilling or len(self.questions) >= self.size:
+                return
+            self.refilling = True
+
+        def run():
+            try:
+                while True:
+                    with self.lock:
+                        if self.key != key or len(self.questions) >= self.size:
+                            return
+                        revision = self.revision
+                    question = generate()
+                    if question[0] is None:
+                        return
+                    with self.lock:
+                        if self.key != key:
+                            return
+                        if self.revision != revision:
+                            # Üretim sırasında bir kelime cevaplandı: soru eski durumla üretilmiş olabilir
+                            continue
+                        if any(queued[0] is question[0] for queued in self.questions):
+                            # Aynı kelime yeniden seçildi (ör. tekrarı gelen kelime): kuyruk bu kadarıyla kalır
+                            return
+                        self.questions.append(question)
+            finally:
+                with self.lock:
+                    self.refilling = False
+
+        if background:
+            threading.Thread(target=run, daemon=True).start()
+        else:
+            run()
@@ -0,0 +1,155 @@
+import threading
+
+from distractors import DistractorSampler
+from journal import answer_record, score_patch, word_record
+from quiz import QuestionGenerator
+from scheduler import WRONG_LIST_STEPS, ReviewScheduler
+from scoring import DAILY_FIELDS, GOAL_TEST_TYPES, apply_answer, roll_over_day
+from word_index import AgeBucketIndex, WrongWordsIndex
+
+
+def build_indexes(kelimeler, score_data, today):
+    """(yaş indeksi, seçenek örnekleyici, yanlış listesi indeksi, zamanlayıcı) kur"""
+    age_index = AgeBucketIndex()
+    sampler = DistractorSampler()
+    wrong_index = WrongWordsIndex()
+    scheduler = ReviewScheduler(wrong_index)
+    age_index.build(kelimeler, today)
+    sampler.build(kelimeler)
+    wrong_index.build(kelimeler, score_data.setdefault("wrong_words_list", []))
+    scheduler.build(kelimeler)
+    return age_index, sampler, wrong_index, scheduler
+
+
+def make_question(test_type, generated):
+    """generate_question çıktısını soru sözlüğüne çevir (kelime yoksa None)"""
+    soru, dogru, secenekler, question_text = generated
+    if soru is None:
+        return None
+    return {"test_type": test_type, "soru": soru, "dogru": dogru, "secenekler": secenekler,
+            "question_text": question_text}
+
+
+def answer_message(question, result):
+    """Cevap sonucunun kullanıcıya gösterilecek metni"""
+    test_type, final_points = question["test_type"], result["points"]
+    if result["correct"]:
+        if test_type == "yanlis":
+            if result["review"] == "graduated":
+                if final_points > 0:
+                    return f"🎉 Harika! Bu kelime artık yanlış listesinde değil! (+{final_points} puan)"
+                return "🎉 Harika! Bu kelime artık yanlış listesinde değil!"
+            remaining = WRONG_LIST_STEPS - question["soru"]["wrong_test_count"]
+            if final_points > 0:
+                return f"✅ Doğru! ({remaining} doğru daha gerekli) (+{final_points} puan)"
+            return f"✅ Doğru! ({remaining} doğru daha gerekli)"
+        if final_points > 0:
+            return f"✅ Doğru! (+{final_points} puan)"
+        return "✅ Doğru! (Hedef tamamlanınca puan alacaksınız)"
+    penalty_msg = f"({final_points} puan)" if final_points != 0 else ""
+    combo_msg = f" | Seri ceza: {result['combo_penalty']}" if result["combo_penalty"] < 0 else ""
+    message = f"❌ Yanlış! Doğru cevap: **{question['dogru']}** {penalty_msg}{combo_msg}"
+    if test_type in GOAL_TEST_TYPES:
+        message += " (Yanlış listesine eklendi)"
+    return message
+
+
+class QuizEngine:
+    """Streamlit'ten bağımsız soru üretme ve cevap işleme
+
+    Kelime ve puan verisini, indeksleri ve soru üretecini bir arada tutar.
+    Her değişiklik bir günlük kaydı üretir ve save(record) ile kaydedilir
+    (ör. storage.save_record'u kelimeler ve puan verisiyle çağıran bir fonksiyon).
+    Veriyi değiştiren çağrılar lock altında çalışır; Streamlit uygulaması
+    burada paylaşılan veri kilidini verir.
+    """
+
+    def __init__(self, kelimeler, score_data, today, indexes=None, generator=None, lock=None, save=None, now=None):
+        self.kelimeler = kelimeler
+        self.score_data = score_data
+        self.today = today
+        if indexes is None:
+            indexes = build_indexes(kelimeler, score_data, today)
+        self.age_index, self.sampler, self.wrong_index, self.scheduler = indexes
+        self.generator = generator or QuestionGenerator()
+        self.lock = lock or threading.RLock()
+        self.save = save
+        self.now = now
+
+    @property
+    def today_str(self):
+        return self.today.strftime("%Y-%m-%d")
+
+    def _save(self, record):
+        if self.save is not None:
+            self.save(record)
+
+    def start_day(self, today):
+        """Günü değiştir: günlük sayaçları sıfırla, gerekirse dünün cezasını kes; cezayı döndür"""
+        with self.lock:
+            self.today = today
+            self.age_index.ensure_day(self.kelimeler, today)
+            changed_dates, penalty, _ = roll_over_day(self.score_data, self.today_str)
+            if changed_dates:
+                self._save({"op": "score", **score_patch(self.score_data, changed_dates)})
+            return penalty
+
+    def age_days(self, word):
+        """Kelimenin yaşı (gün); yaşlar gün başında topluca hesaplanır"""
+        self.age_index.ensure_day(self.kelimeler, self.today)
+        return self.age_index.age_of(word)
+
+    def add_word(self, en, tr):
+        """Yeni kelime ekle (+1 puan); kelime zaten varsa None döndür
+
+        Metinler küçük harfe çevrilip boşlukları kırpılır.
+        """
+        en, tr = en.strip().lower(), tr.strip().lower()
+        with self.lock:
+            # İçe aktarılan / Sheets'ten gelen kelimeler büyük harfli olabilir
+            if any(k["en"].lower() == en for k in self.kelimeler):
+                return None
+            today_str = self.today_str
+            daily = self.score_data["daily"].setdefault(today_str, dict.fromkeys(DAILY_FIELDS, 0))
+            self.kelimeler.append({"en": en, "tr": tr, "wrong_count": 0, "wrong_test_count": 0,
+                                   "added_date": today_str, "last_wrong_date": None})
+            word = self.kelimeler[-1]
+            self.age_index.add(word)
+            self.wrong_index.add_word(word)
+            self.sampler.add(word)
+            self.scheduler.push(word)
+            daily["yeni_kelime"] += 1
+            self.score_data["score"] += 1
+            daily["puan"] += 1
+            self._save(word_record("add", word, self.score_data, [today_str]))
+            return word
+
+    def next_question(self, test_type, hard=False):
+        """Yeni soru sözlüğü; sorulacak kelime yoksa None"""
+        with self.lock:
+            generated = self.generator.generate(test_type, self.kelimeler, self.age_index, self.sampler,
+                                                self.wrong_index, self.today, hard=hard, scheduler=self.scheduler)
+        return make_question(test_type, generated)
+
+    def answer(self, question, choice, can_get_points=None):
+        """Cevabı işle ve kaydet; sonuç sözlüğünü döndür
+
+        Sonuç: correct, dogru, points (toplam puan değişimi), combo_penalty,
+        review (zamanlayıcı sonucu), message ve kaydedilen günlük kaydı (record).
+        """
+        soru, test_type = question["soru"], question["test_type"]
+        is_correct = choice == question["dogru"]
+        with self.lock:
+            self.score_data["daily"].setdefault(self.today_str, dict.fromkeys(DAILY_FIELDS, 0))
+            points, combo_penalty, review_result = apply_answer(
+                self.score_data, soru, test_type, is_correct, self.age_days(soru), self.today, self.scheduler,
+                can_get_points)
+            answered_at = self.now().isoformat(timespec="seconds") if self.now is not None else None
+            record = answer_record(soru, self.score_data, self.today_str, self.wrong_index.contains(soru["en"]),
+                                   test_type=test_type, is_correct=is_correct, points=points,
+                                   answered_at=answered_at)
+            self._save(record)
+        result = {"correct": is_correct, "dogru": question["dogru"], "points": points,
+                  "combo_penalty": combo_penalty, "review": review_result, "record": record}
+        result["message"] = answer_message(question, result)
+        return result
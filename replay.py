@@ -0,0 +1,212 @@
+"""Soru akışı kaydı, tekrar oynatma ve çevrimdışı simülasyon (Streamlit olmadan)
+
+    python replay.py simulate --seed 7 -n 1000 -o kayit.jsonl
+    python replay.py replay kayit.jsonl
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from datetime import date, datetime
+
+from backup_archive import SCORE_DEFAULTS
+from quiz import QuestionGenerator
+from quiz_engine import QuizEngine
+
+# Kayıt dosyası JSONL'dir: ilk satır başlık (tohum, strateji), ardından gösterilen
+# her soru için bir "question", cevaplanan her soru için bir "answer" olayı.
+# Uygulamada soru kuyruğu önceden üretip attığı sorular için de rastgele sayı
+# tükettiğinden oturum tohumdan yeniden üretilemez; tekrar oynatma kaydedilen
+# soruları kullanır. simulate() ise aynı tohumla her zaman aynı akışı üretir.
+
+TEST_TYPES = ("en_tr", "tr_en", "tekrar", "yanlis")
+
+
+class QuestionRecorder:
+    """Soru ve cevap olaylarını JSONL dosyasına ekleyen kaydedici"""
+
+    def __init__(self, path, seed=None, strategy=None):
+        self.path = path
+        self.lock = threading.Lock()
+        self.events = 0
+        self._write({"type": "header", "seed": seed, "strategy": strategy,
+                     "started": datetime.now().isoformat(timespec="seconds")})
+
+    def _write(self, event):
+        line = json.dumps(event, ensure_ascii=False, separators=(",", ":")) + "\n"
+        with self.lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+            self.events += 1
+
+    def question(self, day_str, question):
+        """Gösterilen soru (QuizEngine / make_question soru sözlüğü)"""
+        self._write({"type": "question", "date": day_str, "test": question["test_type"], "en": question["soru"]["en"],
+                     "dogru": question["dogru"], "secenekler": list(question["secenekler"]),
+                     "text": question["question_text"]})
+
+    def answer(self, day_str, test_type, soru, choice, is_correct, points):
+        self._write({"type": "answer", "date": day_str, "test": test_type, "en": soru["en"],
+                     "cevap": choice, "correct": is_correct, "points": points})
+
+
+def load_recording(path):
+    """Kaydı (başlık, olaylar) olarak oku; yarım kalan son satır atlanır"""
+    header, events = {}, []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                event = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if event.get("type") == "header":
+                header = event
+            else:
+                events.append(event)
+    return header, events
+
+
+def new_engine(kelimeler, score_data, today, generator=None):
+    """Eksik puan alanlarını tamamlayıp kaydetmeyen bir QuizEngine kur"""
+    for field, default_value in SCORE_DEFAULTS.items():
+        score_data.setdefault(field, default_value.copy() if isinstance(default_value, (dict, list)) else default_value)
+    return QuizEngine(kelimeler, score_data, today, generator=generator)
+
+
+class ReplayResult:
+    """Tekrar oynatma özeti: cevap sayısı, kayıttan farklı çıkan sonuçlar, süre"""
+
+    def __init__(self):
+        self.answers = 0
+        self.points = 0
+        self.mismatches = []
+        self.elapsed = 0.0
+
+    def as_dict(self):
+        return {"answers": self.answers, "points": self.points, "mismatches": len(self.mismatches),
+                "elapsed_s": round(self.elapsed, 6),
+                "answers_per_s": round(self.answers / self.elapsed) if self.elapsed else None}
+
+
+def replay(events, kelimeler, score_data):
+    """Kaydedilen cevapları puanlama mantığından geçir ve kayıttaki sonuçlarla karşılaştır
+
+    Veri, kaydın başladığı andaki durumda olmalıdır; kelimeler "en" ile bulunur.
+    """
+    result = ReplayResult()
+    engine = None
+    words = {word["en"]: word for word in kelimeler}
+    questions = {}
+    started = time.perf_counter()
+    for number, event in enumerate(events, 1):
+        day = date.fromisoformat(event["date"])
+        if engine is None:
+            engine = new_engine(kelimeler, score_data, day)
+        if day != engine.today or score_data.get("last_check_date") != event["date"]:
+            # Uygulamadaki gibi yeni günün ilk olayından önce günlük sayaçlar sıfırlanır
+            # ve dünkü kelime hedefi eksikse ceza kesilir
+            engine.start_day(day)
+        if event["type"] == "question":
+            questions[event["en"]] = event
+            continue
+        soru = words.get(event["en"])
+        if soru is None:
+            result.mismatches.append(f"Olay {number}: '{event['en']}' kelimesi yok")
+            continue
+        recorded = questions.get(event["en"])
+        if recorded is not None:
+            dogru = recorded["dogru"]
+        else:
+            dogru = event["cevap"] if event["correct"] else None
+        answer = engine.answer({"test_type": event["test"], "soru": soru, "dogru": dogru}, event["cevap"])
+        result.answers += 1
+        result.points += answer["points"]
+        if answer["correct"] != event["correct"] or answer["points"] != event["points"]:
+            result.mismatches.append(f"Olay {number}: '{event['en']}' kayıtta {event['correct']}/{event['points']}, "
+                                     f"tekrar oynatmada {answer['correct']}/{answer['points']}")
+    result.elapsed = time.perf_counter() - started
+    return result
+
+
+def simulate(kelimeler, score_data, today, generator, count, test_types=TEST_TYPES, accuracy=0.8,
+             recorder=None, hard=False):
+    """Üreteçten count soru sor, her birini accuracy olasılıkla doğru cevapla
+
+    Cevaplar üretecin tohumundan türetilen ayrı bir rastgele kaynakla seçilir;
+    böylece aynı tohum ve strateji aynı soru ve cevap akışını verir.
+    """
+    engine = new_engine(kelimeler, score_data, today, generator)
+    engine.start_day(today)
+    answer_rng = random.Random(generator.seed + 1)
+    day_str = today.strftime("%Y-%m-%d")
+    result = ReplayResult()
+    started = time.perf_counter()
+    for number in range(count):
+        test_type = test_types[number % len(test_types)]
+        question = engine.next_question(test_type, hard)
+        if question is None:
+            continue
+        dogru = question["dogru"]
+        if answer_rng.random() < accuracy:
+            choice = dogru
+        else:
+            choice = answer_rng.choice([option for option in question["secenekler"] if option != dogru] or [dogru])
+        if recorder is not None:
+            recorder.question(day_str, question)
+        answer = engine.answer(question, choice)
+        if recorder is not None:
+            recorder.answer(day_str, test_type, question["soru"], choice, answer["correct"], answer["points"])
+        result.answers += 1
+        result.points += answer["points"]
+    result.elapsed = time.perf_counter() - started
+    return result
+
+
+def load_data(words_path, score_path):
+    with open(words_path, "r", encoding="utf-8") as f:
+        kelimeler = json.load(f)
+    try:
+        with open(score_path, "r", encoding="utf-8") as f:
+            score_data = json.load(f)
+    except FileNotFoundError:
+        score_data = {}
+    return kelimeler, score_data
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Soru akışı simülasyonu ve tekrar oynatma")
+    parser.add_argument("command", choices=("simulate", "replay"))
+    parser.add_argument("recording", nargs="?", help="replay için kayıt dosyası")
+    parser.add_argument("--words", default="kelimeler.json")
+    parser.add_argument("--score", default="puan.json")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("-n", "--count", type=int, default=1000)
+    parser.add_argument("--accuracy", type=float, default=0.8)
+    parser.add_argument("--date", default=None, help="simülasyon günü (YYYY-AA-GG), varsayılan bugün")
+    parser.add_argument("-o", "--output", default=None, help="simülasyonun kaydedileceği dosya")
+    args = parser.parse_args(argv)
+
+    kelimeler, score_data = load_data(args.words, args.score)
+    if args.command == "replay":
+        if not args.recording:
+            parser.error("replay için kayıt dosyası gerekli")
+        header, events = load_recording(args.recording)
+        result = replay(events, kelimeler, score_data)
+        for message in result.mismatches[:20]:
+            print(message)
+    else:
+        today = date.fromisoformat(args.date) if args.date else date.today()
+        generator = QuestionGenerator(args.seed)
+        recorder = QuestionRecorder(args.output, generator.seed, generator.strategy) if args.output else None
+        result = simulate(kelimeler, score_data, today, generator, args.count, accuracy=args.accuracy,
+                          recorder=recorder)
+    print(json.dumps(result.as_dict(), ensure_ascii=False))
+    return 1 if result.mismatches else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
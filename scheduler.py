@@ -0,0 +1,137 @@
+import heapq
+from datetime import timedelta
+from itertools import count
+
+from word_index import parse_day_ordinal
+
+# SM-2 tabanlı aralıklı tekrar. Her kelimede şu alanlar tutulur:
+#   interval  → son başarılı tekrardan sonraki aralık (gün)
+#   ease      → aralık çarpanı (en az MIN_EASE)
+#   reps      → art arda başarılı tekrar sayısı
+#   due_date  → bir sonraki tekrar günü ("YYYY-MM-DD")
+# Hiç tekrar edilmemiş (due_date'i olmayan) kelime kuyruğa girmez; Genel
+# Tekrar onları yaş kategorilerine göre (%50 eski, %30 orta, %20 yeni, bugün
+# eklenenler hariç) seçer ve ilk doğru cevapla planlanırlar.
+#
+# Yanlış listesi zamanlayıcının "yeniden öğrenme" adımıdır: yanlış cevaplanan
+# kelime listeye girer ve Yanlış Kelimeler testinde art arda WRONG_LIST_STEPS
+# doğru cevap verilene kadar tekrar kuyruğuna alınmaz; listeden çıkınca ertesi
+# gün tekrar edilecek şekilde yeniden planlanır.
+
+SCHEDULE_KEYS = ("interval", "ease", "reps", "due_date")
+DEFAULT_EASE = 2.5
+MIN_EASE = 1.3
+WRONG_LIST_STEPS = 3
+CORRECT_QUALITY = 4
+WRONG_QUALITY = 1
+
+
+def next_ease(ease, quality):
+    """SM-2 kolaylık katsayısı güncellemesi"""
+    ease += 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02)
+    return max(MIN_EASE, round(ease, 2))
+
+
+def due_ordinal(word):
+    """Kelimenin tekrar günü (gün numarası); hiç planlanmamışsa None"""
+    return parse_day_ordinal(word.get("due_date"))
+
+
+class ReviewScheduler:
+    """Tekrar zamanı gelen kelimeler için yığın (heap) + yanlış listesi adımları
+
+    Yığın girdileri (tekrar günü, sıra, kelime) biçimindedir; güncellenen veya
+    silinen kelimenin eski girdisi yerinde bırakılır ve tepeye çıktığında atılır.
+    """
+
+    def __init__(self, wrong_index):
+        self.wrong_index = wrong_index
+        self.heap = []
+        self.entries = {}
+        self.counter = count()
+
+    def build(self, kelimeler):
+        """Yığını sıfırdan kur (O(N) heapify)"""
+        self.heap = []
+        self.entries = {}
+        for word in kelimeler:
+            due = due_ordinal(word)
+            if due is not None and not self.wrong_index.contains(word["en"]):
+                entry = (due, next(self.counter), word)
+                self.entries[id(word)] = entry
+                self.heap.append(entry)
+        heapq.heapify(self.heap)
+
+    def push(self, word):
+        """Kelimeyi (yeniden) kuyruğa al; varsa eski girdisi geçersiz olur, planlanmamışsa çıkarılır"""
+        due = due_ordinal(word)
+        if due is None:
+            self.remove(word)
+            return
+        entry = (due, next(self.counter), word)
+        self.entries[id(word)] = entry
+        heapq.heappush(self.heap, entry)
+
+    def remove(self, word):
+        """Kelimeyi kuyruktan çıkar"""
+        self.entries.pop(id(word), None)
+
+    def _top(self):
+        heap = self.heap
+        while heap and self.entries.get(id(heap[0][2])) is not heap[0]:
+            heapq.heappop(heap)
+        return heap[0] if heap else None
+
+    def next_due(self, today):
+        """Tekrar günü gelmiş en gecikmiş kelime (yoksa None), O(log N)"""
+        entry = self._top()
+        if entry is None or entry[0] > today.toordinal():
+            return None
+        return entry[2]
+
+    def review(self, word, is_correct, test_type, today):
+        """Cevabı işle, kelimeyi yeniden planla; sonucu döndür
+
+        "lapsed"    → yanlış cevap, kelime yanlış listesine girdi (veya adımları sıfırlandı)
+        "step"      → yanlış listesinde bir adım ilerledi
+        "graduated" → yanlış listesinden çıktı, ertesi güne planlandı
+        "learning"  → yanlış listesindeki kelime başka testte doğru bilindi (plan değişmez)
+        "reviewed"  → normal tekrar, yeni aralık planlandı
+        """
+        in_wrong_list = self.wrong_index.contains(word["en"])
+        if not is_correct:
+            word["reps"] = 0
+            word["interval"] = 0
+            word["ease"] = next_ease(word.get("ease", DEFAULT_EASE), WRONG_QUALITY)
+            word["due_date"] = today.strftime("%Y-%m-%d")
+            word["wrong_test_count"] = 0
+            self.wrong_index.add(word["en"])
+            self.remove(word)
+            return "lapsed"
+        if in_wrong_list:
+            if test_type != "yanlis":
+                return "learning"
+            word["wrong_test_count"] = word.get("wrong_test_count", 0) + 1
+            if word["wrong_test_count"] < WRONG_LIST_STEPS:
+                return "step"
+            self.wrong_index.discard(word["en"])
+            word["wrong_test_count"] = 0
+            self._schedule(word, 1, today)
+            return "graduated"
+        reps = word.get("reps", 0) + 1
+        interval = word.get("interval", 0)
+        if reps == 1:
+            interval = 1
+        elif reps == 2:
+            interval = 6
+        else:
+            interval = max(interval + 1, round(interval * word.get("ease", DEFAULT_EASE)))
+        word["reps"] = reps
+        word["ease"] = next_ease(word.get("ease", DEFAULT_EASE), CORRECT_QUALITY)
+        self._schedule(word, interval, today)
+        return "reviewed"
+
+    def _schedule(self, word, interval, today):
+        word["interval"] = interval
+        word["due_date"] = (today + timedelta(days=interval)).strftime("%Y-%m-%d")
+        self.push(word)
@@ -0,0 +1,127 @@
+DAILY_TEST_GOAL = 30
+DAILY_WORD_GOAL = 10
+MISSED_WORD_GOAL_PENALTY = -20
+GOAL_TEST_TYPES = ("en_tr", "tr_en", "tekrar")
+DAILY_FIELDS = ("puan", "yeni_kelime", "dogru", "yanlis", "en_tr_answered", "tr_en_answered", "tekrar_answered")
+
+
+def word_points(age_days, is_correct):
+    """Kelime yaşına göre puan (yanlışta -2)"""
+    if is_correct:
+        if age_days >= 30:
+            return 3
+        elif age_days >= 7:
+            return 2
+        else:
+            return 1
+    else:
+        return -2
+
+
+def update_combo(score_data, is_correct):
+    """Doğru/yanlış serisini ve combo çarpanını güncelle; yanlış serisi cezasını döndür"""
+    if is_correct:
+        score_data["correct_streak"] += 1
+        score_data["wrong_streak"] = 0
+        if score_data["correct_streak"] >= 10:
+            score_data["combo_multiplier"] = 3.0
+        elif score_data["correct_streak"] >= 5:
+            score_data["combo_multiplier"] = 2.0
+        else:
+            score_data["combo_multiplier"] = 1.0
+    else:
+        score_data["wrong_streak"] += 1
+        score_data["correct_streak"] = 0
+        score_data["combo_multiplier"] = 1.0
+        if score_data["wrong_streak"] >= 10:
+            return -10
+        elif score_data["wrong_streak"] >= 5:
+            return -5
+        else:
+            return 0
+    return 0
+
+
+def is_daily_test_goal_complete(score_data):
+    """Üç testin günlük hedefi de tamamlandı mı"""
+    return all(score_data.get(f"{test_type}_answered", 0) >= DAILY_TEST_GOAL for test_type in GOAL_TEST_TYPES)
+
+
+def can_earn_points(score_data, test_type):
+    """Bu test türünde puan kazanılabilir mi (Yanlış Kelimeler testinde her zaman)"""
+    if test_type == "yanlis":
+        return True
+    return is_daily_test_goal_complete(score_data)
+
+
+def apply_answer(score_data, word, test_type, is_correct, age_days, today, scheduler, can_get_points=None):
+    """Cevabı puan verisine, günlük istatistiklere ve kelimeye işle
+
+    (kazanılan puan, seri cezası, zamanlayıcı sonucu) döndürür. can_get_points
+    verilmezse cevaptan önceki duruma göre hesaplanır.
+    """
+    today_str = today.strftime("%Y-%m-%d")
+    daily = score_data["daily"][today_str]
+    if can_get_points is None:
+        can_get_points = can_earn_points(score_data, test_type)
+    score_data["answered_today"] += 1
+    if test_type in GOAL_TEST_TYPES:
+        score_data[f"{test_type}_answered"] += 1
+        daily[f"{test_type}_answered"] += 1
+
+    points = word_points(age_days, is_correct)
+    combo_penalty = update_combo(score_data, is_correct)
+    if is_correct:
+        final_points = int(points * score_data.get("combo_multiplier", 1.0)) if can_get_points else 0
+    else:
+        final_points = points
+    final_points += combo_penalty
+    if final_points != 0:
+        score_data["score"] += final_points
+        daily["puan"] += final_points
+
+    review_result = scheduler.review(word, is_correct, test_type, today)
+    if is_correct:
+        daily["dogru"] += 1
+    else:
+        daily["yanlis"] += 1
+        word["wrong_count"] = word.get("wrong_count", 0) + 1
+        word["last_wrong_date"] = today_str
+    return final_points, combo_penalty, review_result
+
+
+def roll_over_day(score_data, today_str):
+    """Gün değiştiyse günlük sayaçları sıfırla, dünkü kelime hedefi eksikse ceza kes
+
+    (değişen günler, kesilen ceza, dün eksik kalan kelime sayısı) döndürür;
+    değişen günler günlüğe yazılmalıdır.
+    """
+    daily = score_data.setdefault("daily", {})
+    changed_dates = []
+    penalty = 0
+    missing_words = 0
+    if score_data.get("last_check_date") != today_str:
+        changed_dates.append(today_str)
+        yesterday_str = score_data.get("last_check_date")
+        if yesterday_str is not None and yesterday_str in daily:
+            changed_dates.append(yesterday_str)
+            yesterday_words = daily[yesterday_str]["yeni_kelime"]
+            if yesterday_words < DAILY_WORD_GOAL:
+                penalty = MISSED_WORD_GOAL_PENALTY
+                missing_words = DAILY_WORD_GOAL - yesterday_words
+                score_data["score"] += penalty
+                daily[yesterday_str]["puan"] += penalty
+
+        score_data["answered_today"] = 0
+        score_data["last_check_date"] = today_str
+        score_data["correct_streak"] = 0
+        score_data["wrong_streak"] = 0
+        score_data["combo_multiplier"] = 1.0
+        for test_type in GOAL_TEST_TYPES:
+            score_data[f"{test_type}_answered"] = 0
+
+    if today_str not in daily:
+        daily[today_str] = dict.fromkeys(DAILY_FIELDS, 0)
+        if today_str not in changed_dates:
+            changed_dates.append(today_str)
+    return changed_dates, penalty, missing_words
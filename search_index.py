@@ -0,0 +1,141 @@
+TURKISH_FOLD = str.maketrans({"İ": "i", "I": "i", "ı": "i"})
+MIN_GRAM = 2
+MAX_GRAM = 3
+DEFAULT_MAX_DISTANCE = 1
+
+
+def fold(text):
+    """Türkçe duyarlı büyük/küçük harf katlama (İ/I/ı/i aynı harf sayılır)"""
+    return (text or "").translate(TURKISH_FOLD).casefold()
+
+
+def grams(text, size):
+    """Metnin verilen uzunluktaki tüm alt dizileri (tekrarsız)"""
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+def form_keys(form):
+    """Tam biçim sözlüğü anahtarları: biçimin kendisi ve boşlukla ayrılmış parçaları"""
+    keys = set(form.split())
+    keys.add(form)
+    return keys
+
+
+class SearchIndex:
+    """EN/TR biçimleri üzerinde 2-3 harflik n-gram indeksi + tam biçim sözlüğü
+
+    Sonuçlar kelime kimliği (en) kümesi olarak döner ve salt okunurdur. 3'ten uzun
+    aramalarda aramadaki 3-gram'ların listeleri küçükten büyüğe kesiştirilir, sonra
+    alt dizi kontrolü yapılır; 2-3 harflik aramalar doğrudan n-gram listesinden,
+    tek harflik aramalar (zaten neredeyse her kelimeyi içerir) taramayla yanıtlanır.
+    """
+
+    def __init__(self):
+        self.forms = {}
+        self.postings = {}
+        self.by_form = {}
+        self.alphabet = set()
+        self.revision = None
+
+    def __len__(self):
+        return len(self.forms)
+
+    def build(self, kelimeler):
+        """İndeksi sıfırdan kur"""
+        self.forms = {}
+        self.postings = {}
+        self.by_form = {}
+        self.alphabet = set()
+        for word in kelimeler:
+            self.add(word)
+
+    def add(self, word):
+        """Kelimeyi indeksle (aynı kimlik varsa önce eskisi çıkarılır)"""
+        word_id = word["en"]
+        if word_id in self.forms:
+            self.remove(word_id)
+        forms = (fold(word.get("en")), fold(word.get("tr")))
+        self.forms[word_id] = forms
+        postings = self.postings
+        for gram in self._word_grams(forms):
+            posting = postings.get(gram)
+            if posting is None:
+                postings[gram] = posting = set()
+            posting.add(word_id)
+        for form in forms:
+            for key in form_keys(form):
+                self.by_form.setdefault(key, set()).add(word_id)
+            self.alphabet.update(form)
+
+    def remove(self, word_id):
+        """Kimliği verilen kelimeyi indeksten çıkar"""
+        forms = self.forms.pop(word_id, None)
+        if forms is None:
+            return
+        for gram in self._word_grams(forms):
+            self._discard(self.postings, gram, word_id)
+        for form in forms:
+            for key in form_keys(form):
+                self._discard(self.by_form, key, word_id)
+
+    @staticmethod
+    def _discard(mapping, key, word_id):
+        ids = mapping.get(key)
+        if ids is not None:
+            ids.discard(word_id)
+            if not ids:
+                del mapping[key]
+
+    @staticmethod
+    def _word_grams(forms):
+        return {form[i:i + size] for form in forms for size in range(MIN_GRAM, MAX_GRAM + 1)
+                for i in range(len(form) - size + 1)}
+
+    def search(self, query):
+        """Aramayı EN veya TR biçiminde alt dizi olarak içeren kelime kimlikleri"""
+        query = fold(query).strip()
+        if not query:
+            return self.forms.keys()
+        if len(query) < MIN_GRAM:
+            return {word_id for word_id, forms in self.forms.items() if query in forms[0] or query in forms[1]}
+        if len(query) <= MAX_GRAM:
+            return self.postings.get(query, set())
+        postings = sorted((self.postings.get(gram, ()) for gram in grams(query, MAX_GRAM)), key=len)
+        if not postings[0]:
+            return set()
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates &= posting
+            if not candidates:
+                return candidates
+        return {word_id for word_id in candidates if any(query in form for form in self.forms[word_id])}
+
+    def fuzzy_search(self, query, max_distance=DEFAULT_MAX_DISTANCE):
+        """EN/TR biçimi (veya biçimin bir parçası) aramaya en fazla max_distance düzenleme uzaklığında olan kimlikler
+
+        Aramanın tüm 1 düzenlemelik komşuları (silme, değiştirme, ekleme, yer
+        değiştirme) indeksteki harflerle üretilip tam biçim sözlüğünde aranır;
+        max_distance kadar tekrarlanır. Tarama yapılmadığı için kelime sayısından
+        bağımsızdır.
+        """
+        query = fold(query).strip()
+        if not query:
+            return set()
+        result = set(self.by_form.get(query, ()))
+        seen = {query}
+        frontier = {query}
+        for _ in range(max_distance):
+            frontier = {edit for text in frontier for edit in self._edits(text)} - seen
+            seen |= frontier
+            for text in frontier:
+                result.update(self.by_form.get(text, ()))
+        return result
+
+    def _edits(self, text):
+        """Metnin 1 düzenleme uzaklığındaki tüm biçimleri"""
+        splits = [(text[:i], text[i:]) for i in range(len(text) + 1)]
+        edits = {left + right[1:] for left, right in splits if right}
+        edits |= {left + right[1] + right[0] + right[2:] for left, right in splits if len(right) > 1}
+        edits |= {left + char + right[1:] for left, right in splits if right for char in self.alphabet}
+        edits |= {left + char + right for left, right in splits for char in self.alphabet}
+        return edits
@@ -0,0 +1,136 @@
+import itertools
+import threading
+import weakref
+from collections import OrderedDict
+
+# Süreç genelinde tekil revizyonlar: atılıp yeniden açılan bir kullanıcının
+# revizyonları eski oturum önbellekleriyle çakışmaz
+_revisions = itertools.count(1)
+
+
+class SharedDataCache:
+    """Tüm oturumların paylaştığı tek bellek kopyası (kelimeler, score_data)
+
+    Veri bir kez yüklenir; sonraki her erişimde deponun dosya imzası (mtime,
+    boyut) son yükleme/yazmadaki imzayla karşılaştırılır ve yalnızca başka bir
+    süreç dosyaları değiştirdiyse yeniden yüklenir. Depo kendi yazdıklarını
+    on_written ile bildirir, böylece bu sürecin yazmaları yükleme tetiklemez.
+    Veriyi değiştiren oturumlar lock ile sıralanır. revision her yüklemede ve
+    her değişiklikte artar; oturum önbellekleri (arama, istatistik) buna bağlıdır.
+    word_revision yalnızca yüklemede ve kelimeler düzenlenip silindiğinde artar
+    (önceden üretilmiş sorular buna bağlıdır). load_revision yalnızca yüklemede
+    artar; eski yüklemeye ait kelime nesnelerini tutan oturum durumu (gösterilen
+    soru) buna bakarak atılır.
+    """
+
+    def __init__(self, storage):
+        self.storage = storage
+        self.lock = threading.RLock()
+        self.kelimeler = None
+        self.score_data = None
+        self.signature = None
+        self.revision = 0
+        self.word_revision = 0
+        self.load_revision = 0
+        self.loads = 0
+        storage.on_written = self.mark_written
+
+    def get(self, loader):
+        """(kelimeler, score_data, yeniden yüklendi mi); gerekirse loader() ile yüklenir"""
+        with self.lock:
+            signature = self.storage.signature()
+            # Bu sürecin arka plandaki sıkıştırması dosyaları değiştirir ama veri aynıdır
+            if self.kelimeler is not None and (signature == self.signature or self.storage.compacting):
+                return self.kelimeler, self.score_data, False
+            # İmza yüklemeden önce alınır: yükleme sırasında gelen dış değişiklik bir sonraki erişimde görülür.
+            # Yükleyici kendisi yazdıysa (mark_written) yazmadan sonraki imza korunur.
+            self.signature = None
+            self.kelimeler, self.score_data = loader()
+            if self.signature is None:
+                self.signature = signature
+            self.revision = self.word_revision = self.load_revision = next(_revisions)
+            self.loads += 1
+            return self.kelimeler, self.score_data, True
+
+    def mark_written(self, before=None, after=None):
+        """Bu süreç diske yazdı: imzayı güncelle, bellekteki veri diskle aynıysa True döndür
+
+        before/after depo tarafından yazmadan önce ve sonra (günlük kilidi altında)
+        alınan imzalardır. Yazmadan önceki imza son görülenden farklıysa başka bir
+        süreç de yazmıştır: imza güncellenmez ve veri bir sonraki erişimde yeniden yüklenir.
+        """
+        with self.lock:
+            # Yükleme sürerken (signature None) yapılan yazma yükleyicinin kendisinindir
+            if before is not None and self.signature is not None and before != self.signature:
+                return False
+            self.signature = after if after is not None else self.storage.signature()
+            return True
+
+    def bump(self):
+        """Bellekteki veri değişti; yeni revizyonu döndür"""
+        with self.lock:
+            self.revision = next(_revisions)
+            return self.revision
+
+    def words_changed(self):
+        """Kelimeler düzenlendi, silindi veya toplu değişti"""
+        with self.lock:
+            self.word_revision = next(_revisions)
+            return self.word_revision
+
+    def invalidate(self):
+        """Bir sonraki erişimde diskten yeniden yüklenmesini sağla"""
+        with self.lock:
+            self.kelimeler = None
+            self.score_data = None
+
+
+class UserDataRegistry:
+    """Kullanıcı kimliği → bellekteki kullanıcı verisi (en uzun süre kullanılmayanlar atılır)
+
+    Girdiler factory(user_id) ile tembel olarak oluşturulur ve shared_data
+    niteliğinde bir SharedDataCache taşır. Tüm değişiklikler anında diske
+    yazıldığı için atılan kullanıcı bir sonraki erişimde diskten yüklenir; o
+    anda verisine yazılan (kilidi tutulan) kullanıcı atılmaz.
+
+    Atılan girdiye yalnızca zayıf referans kalır: bir oturum (ör. Streamlit
+    session_state) onu hâlâ tutuyorsa sonraki erişimde aynı girdi geri döner,
+    böylece aynı dosyalara kendi kilidiyle yazan ikinci bir depo açılmaz.
+    Girdiler zayıf referansı desteklemelidir.
+    """
+
+    def __init__(self, max_users):
+        self.max_users = max_users
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()
+        self.evicted = weakref.WeakValueDictionary()
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, user_id, factory):
+        """Kullanıcının verisi; yoksa oluşturulur ve en yeni kullanılan olarak işaretlenir"""
+        with self.lock:
+            entry = self.entries.get(user_id)
+            if entry is None:
+                entry = self.evicted.pop(user_id, None)
+                if entry is None:
+                    entry = factory(user_id)
+                self.entries[user_id] = entry
+            self.entries.move_to_end(user_id)
+            self._evict()
+            return entry
+
+    def _evict(self):
+        for user_id in list(self.entries)[:-1]:
+            if len(self.entries) <= self.max_users:
+                return
+            lock = self.entries[user_id].shared_data.lock
+            if not lock.acquire(blocking=False):
+                continue
+            try:
+                self.evicted[user_id] = self.entries.pop(user_id)
+                self.evictions += 1
+            finally:
+                lock.release()
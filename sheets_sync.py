@@ -0,0 +1,353 @@
+import hashlib
+import json
+import os
+import threading
+import time
+
+SHEET_HEADER = ["en", "tr", "wrong_count", "added_date", "rev"]
+DEFAULT_CHUNK_SIZE = 500
+DEFAULT_RETRIES = 5
+DEFAULT_BASE_DELAY = 1.0
+DEFAULT_TOKEN_TTL = 45 * 60
+DEFAULT_RETRY_AFTER = 60
+
+
+def column_letter(index):
+    """1 tabanlı sütun numarasını harfe çevir (1 → A, 27 → AA)"""
+    letters = ""
+    while index > 0:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+def row_revision(en, tr, wrong_count, added_date):
+    """Satır içeriğinin kısa özeti (rev sütunu)"""
+    payload = "\x1f".join(str(value) for value in (en, tr, wrong_count, added_date))
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:12]
+
+
+def sheet_row_revision(row):
+    """Sheets satırının içerikten hesaplanan özeti (rev sütununa bakılmaz)
+
+    Sheets arayüzünde yapılan düzenlemeler rev sütununu güncellemez; bu yüzden
+    değişiklikler her zaman en/tr/wrong_count/added_date hücrelerinden bulunur.
+    """
+    cells = (list(row) + ["", "", "", ""])[:4]
+    return row_revision(*cells)
+
+
+def word_to_row(word, default_date):
+    """Kelimeyi Sheets satırına çevir (son sütun satırın revizyonu)"""
+    values = [word["en"], word["tr"], word.get("wrong_count", 0), word.get("added_date", default_date)]
+    return values + [row_revision(*values)]
+
+
+def row_to_word(row, default_date):
+    """Sheets satırını kelimeye çevir, geçersiz satırda None döndür"""
+    if len(row) < 2 or not row[0] or not row[1]:
+        return None
+    return {
+        "en": row[0], "tr": row[1],
+        "wrong_count": int(row[2]) if len(row) > 2 and str(row[2]).isdigit() else 0,
+        "wrong_test_count": 0,
+        "added_date": row[3] if len(row) > 3 and row[3] else default_date
+    }
+
+
+def sheet_row_map(all_values):
+    """get_all_values çıktısından en → [satır no, içerik özeti] haritası (başlık atlanır)"""
+    rows = {}
+    for offset, row in enumerate(all_values[1:]):
+        if len(row) >= 2 and row[0] and row[1]:
+            rows[row[0]] = [offset + 2, sheet_row_revision(row)]
+    return rows
+
+
+def is_quota_error(exc):
+    """Sheets API kota / hız sınırı hatası mı"""
+    response = getattr(exc, "response", None)
+    if getattr(response, "status_code", None) == 429:
+        return True
+    message = str(exc)
+    return "429" in message or "Quota exceeded" in message or "RESOURCE_EXHAUSTED" in message
+
+
+def with_backoff(func, retries=DEFAULT_RETRIES, base_delay=DEFAULT_BASE_DELAY, sleep=time.sleep):
+    """Kota hatalarında üstel bekleme ile tekrar dene"""
+    for attempt in range(retries + 1):
+        try:
+            return func()
+        except Exception as e:
+            if attempt == retries or not is_quota_error(e):
+                raise
+            sleep(base_delay * (2 ** attempt))
+
+
+def bulk_sync_words(sheet, kelimeler, default_date, chunk_size=DEFAULT_CHUNK_SIZE, progress=None,
+                    retries=DEFAULT_RETRIES, base_delay=DEFAULT_BASE_DELAY, sleep=time.sleep, tracker=None):
+    """Tüm tabloyu parça parça toplu değer güncellemeleriyle yaz, yazılan kelime sayısını döndür"""
+    rows = [SHEET_HEADER] + [word_to_row(word, default_date) for word in kelimeler]
+    last_column = column_letter(len(SHEET_HEADER))
+    if sheet.row_count != len(rows):
+        # Fazla satırlar tek çağrıda silinir, eksikler eklenir
+        with_backoff(lambda: sheet.resize(rows=len(rows)), retries, base_delay, sleep)
+    total = len(rows)
+    for start in range(0, total, chunk_size):
+        chunk = rows[start:start + chunk_size]
+        data = [{"range": f"A{start + 1}:{last_column}{start + len(chunk)}", "values": chunk}]
+        with_backoff(lambda: sheet.batch_update(data, value_input_option="RAW"), retries, base_delay, sleep)
+        if progress is not None:
+            progress(start + len(chunk), total)
+    if tracker is not None:
+        tracker.reset({row[0]: [number + 1, row[-1]] for number, row in enumerate(rows) if number > 0})
+    return len(kelimeler)
+
+
+class SheetChangeTracker:
+    """Son senkronizasyondan beri değişen kelimeleri (en anahtarıyla) ve Sheets satır numaralarını tutar"""
+
+    def __init__(self, state_path, dirty_path):
+        self.state_path = state_path
+        self.dirty_path = dirty_path
+        self._rows = None
+        self.dirty = set()
+        self.synced = False
+        # Küçük kirli liste her rerun'da okunur, satır haritası yalnızca gerektiğinde
+        if os.path.exists(dirty_path):
+            try:
+                with open(dirty_path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                self.dirty = set(data.get("dirty", []))
+                self.synced = bool(data.get("synced", False))
+            except (OSError, ValueError):
+                self.synced = False
+
+    @property
+    def rows(self):
+        """en → [Sheets satır no, rev] haritası (tembel yüklenir)"""
+        if self._rows is None:
+            self._rows = {}
+            if self.synced and os.path.exists(self.state_path):
+                try:
+                    with open(self.state_path, "r", encoding="utf-8") as f:
+                        self._rows = json.load(f)
+                except (OSError, ValueError):
+                    self.synced = False
+        return self._rows
+
+    def save(self, with_rows=False):
+        """Kirli listeyi (ve istenirse satır haritasını) diske yaz"""
+        if with_rows:
+            with open(self.state_path, "w", encoding="utf-8") as f:
+                json.dump(self.rows, f, ensure_ascii=False, separators=(",", ":"))
+        with open(self.dirty_path, "w", encoding="utf-8") as f:
+            json.dump({"synced": self.synced, "dirty": sorted(self.dirty)}, f, ensure_ascii=False)
+
+    def refresh(self):
+        """Başka bir sürecin (ör. api_server.py) işaretlediği kirli kelimeleri diskten ekle"""
+        try:
+            with open(self.dirty_path, "r", encoding="utf-8") as f:
+                self.dirty.update(json.load(f).get("dirty", []))
+        except (OSError, ValueError):
+            pass
+
+    def mark(self, *word_ids):
+        """Kelimeleri bir sonraki senkronizasyon için kirli işaretle"""
+        new_ids = [word_id for word_id in word_ids if word_id and word_id not in self.dirty]
+        if new_ids:
+            self.refresh()
+            self.dirty.update(new_ids)
+            self.save()
+
+    def mark_changed_by_hash(self, kelimeler, default_date):
+        """Toplu değişikliklerden sonra satır özetlerini karşılaştırarak kirli kelimeleri bul"""
+        if not self.synced:
+            return
+        current = set()
+        for word in kelimeler:
+            current.add(word["en"])
+            known = self.rows.get(word["en"])
+            if known is None or known[1] != word_to_row(word, default_date)[-1]:
+                self.dirty.add(word["en"])
+        self.dirty.update(word_id for word_id in self.rows if word_id not in current)
+        self.save()
+
+    def reset(self, rows):
+        """Sheets ile tam eşitlenmiş durumu kaydet"""
+        self._rows = rows
+        self.dirty = set()
+        self.synced = True
+        self.save(with_rows=True)
+
+    def update_rows(self, rows):
+        """Sheets'ten çekilen satır haritasını kaydet; henüz gönderilmemiş yerel değişiklikler kirli kalır"""
+        self._rows = rows
+        self.save(with_rows=True)
+
+
+def incremental_sync_words(sheet, kelimeler, tracker, default_date, words_by_id=None, chunk_size=DEFAULT_CHUNK_SIZE,
+                           retries=DEFAULT_RETRIES, base_delay=DEFAULT_BASE_DELAY, sleep=time.sleep):
+    """Yalnızca kirli satırları gönder; (eklenen, güncellenen, silinen) sayılarını döndür
+
+    Silinen satırların yerine önce yeni kelimeler, sonra tablonun son satırları taşınır;
+    böylece diğer satırların numaraları değişmez ve tablo tek resize ile küçülür.
+    """
+    if not tracker.synced:
+        bulk_sync_words(sheet, kelimeler, default_date, chunk_size, None, retries, base_delay, sleep, tracker)
+        return len(kelimeler), 0, 0
+    tracker.refresh()
+    if words_by_id is None:
+        words_by_id = {}
+        for word in kelimeler:
+            words_by_id.setdefault(word["en"], word)
+    if not tracker.dirty:
+        return 0, 0, 0
+    rows = dict(tracker.rows)
+    last_row = max((row_number for row_number, _ in rows.values()), default=1)
+    writes = {}
+    holes = set()
+    inserts = []
+    updated = deleted = 0
+    for word_id in sorted(tracker.dirty):
+        word = words_by_id.get(word_id)
+        if word is None:
+            if word_id in rows:
+                holes.add(rows.pop(word_id)[0])
+                deleted += 1
+            continue
+        values = word_to_row(word, default_date)
+        if word_id in rows:
+            if rows[word_id][1] != values[-1]:
+                writes[rows[word_id][0]] = values
+                rows[word_id] = [rows[word_id][0], values[-1]]
+                updated += 1
+        else:
+            inserts.append((word_id, values))
+    for word_id, values in inserts:
+        if holes:
+            row_number = min(holes)
+            holes.discard(row_number)
+        else:
+            last_row += 1
+            row_number = last_row
+        writes[row_number] = values
+        rows[word_id] = [row_number, values[-1]]
+    if holes:
+        row_owner = {row_number: word_id for word_id, (row_number, _) in rows.items()}
+        while holes:
+            if last_row in holes:
+                holes.discard(last_row)
+                last_row -= 1
+                continue
+            word_id = row_owner.pop(last_row, None)
+            if word_id is None or (last_row not in writes and word_id not in words_by_id):
+                # Sahipsiz ya da artık var olmayan son satır doğrudan düşürülür
+                rows.pop(word_id, None)
+                last_row -= 1
+                continue
+            hole = min(holes)
+            holes.discard(hole)
+            values = writes.pop(last_row, None) or word_to_row(words_by_id[word_id], default_date)
+            writes[hole] = values
+            rows[word_id] = [hole, values[-1]]
+            row_owner[hole] = word_id
+            last_row -= 1
+    if last_row > sheet.row_count:
+        with_backoff(lambda: sheet.resize(rows=last_row), retries, base_delay, sleep)
+    last_column = column_letter(len(SHEET_HEADER))
+    data = [{"range": f"A{row_number}:{last_column}{row_number}", "values": [writes[row_number]]}
+            for row_number in sorted(writes)]
+    for start in range(0, len(data), chunk_size):
+        chunk = data[start:start + chunk_size]
+        with_backoff(lambda: sheet.batch_update(chunk, value_input_option="RAW"), retries, base_delay, sleep)
+    if last_row < sheet.row_count:
+        with_backoff(lambda: sheet.resize(rows=last_row), retries, base_delay, sleep)
+    tracker.reset(rows)
+    return len(inserts), updated, deleted
+
+
+def pull_changed_words(sheet, tracker, default_date, retries=DEFAULT_RETRIES, base_delay=DEFAULT_BASE_DELAY,
+                       sleep=time.sleep):
+    """İçerik özetlerini son senkronizasyondakilerle karşılaştırarak değişen satırları bul
+
+    Kelime sütunları tek batch_get ile okunur. (değişen kelimeler, Sheets'ten silinen
+    kelime kimlikleri, yeni satır haritası) döndürür.
+    """
+    last_column = column_letter(len(SHEET_HEADER) - 1)
+    content, = with_backoff(lambda: sheet.batch_get([f"A2:{last_column}"]), retries, base_delay, sleep)
+    known = tracker.rows
+    present = {}
+    changed_words = []
+    for offset, row in enumerate(content):
+        if not row or not row[0]:
+            continue
+        rev = sheet_row_revision(row)
+        present[row[0]] = [offset + 2, rev]
+        if row[0] not in known or known[row[0]][1] != rev:
+            word = row_to_word(row, default_date)
+            if word is not None:
+                changed_words.append(word)
+    removed = [word_id for word_id in known if word_id not in present]
+    return changed_words, removed, present
+
+
+class SheetConnection:
+    """Süreç genelinde paylaşılan, ilk kullanımda bağlanan Sheets istemcisi ve çalışma sayfası
+
+    connect() → (client, worksheet) döndürür. token_ttl dolduğunda önce refresh(client)
+    denenir, başarısız olursa yeniden bağlanılır. Başarısız bağlantı retry_after saniye
+    boyunca tekrar denenmez, böylece her etkileşim zaman aşımı beklemez.
+    """
+
+    def __init__(self, connect, refresh=None, token_ttl=DEFAULT_TOKEN_TTL, retry_after=DEFAULT_RETRY_AFTER,
+                 clock=time.monotonic):
+        self._connect = connect
+        self._refresh = refresh
+        self.token_ttl = token_ttl
+        self.retry_after = retry_after
+        self.clock = clock
+        self.client = None
+        self.worksheet = None
+        self.connected_at = None
+        self.failed_at = None
+        self.last_error = None
+        self.lock = threading.Lock()
+
+    @property
+    def connected(self):
+        return self.worksheet is not None
+
+    def get(self):
+        """Çalışma sayfasını döndür; gerekirse bağlan veya token'ı yenile"""
+        with self.lock:
+            now = self.clock()
+            if self.worksheet is not None:
+                if now - self.connected_at < self.token_ttl:
+                    return self.worksheet
+                if self._refresh is not None:
+                    try:
+                        if self._refresh(self.client):
+                            self.connected_at = now
+                            return self.worksheet
+                    except Exception:
+                        pass
+            elif self.failed_at is not None and now - self.failed_at < self.retry_after:
+                return None
+            try:
+                self.client, self.worksheet = self._connect()
+                self.connected_at = now
+                self.failed_at = None
+                self.last_error = None
+            except Exception as e:
+                self.client = self.worksheet = None
+                self.failed_at = now
+                self.last_error = e
+            return self.worksheet
+
+    def reset(self):
+        """Bağlantıyı unut; bir sonraki get() yeniden bağlanır"""
+        with self.lock:
+            self.client = self.worksheet = None
+            self.connected_at = self.failed_at = self.last_error = None
+
@@ -0,0 +1,87 @@
+from word_index import parse_day_ordinal
+
+STAT_FIELDS = ("puan", "yeni_kelime", "dogru", "yanlis", "en_tr_answered", "tr_en_answered", "tekrar_answered")
+ROLLING_WINDOWS = (7, 30)
+
+
+def is_active(day_data):
+    """O gün en az bir soru cevaplanmış mı"""
+    return day_data.get("dogru", 0) + day_data.get("yanlis", 0) > 0
+
+
+class DailyStats:
+    """score_data["daily"] üzerinden sürekli güncel tutulan toplamlar
+
+    build() geçmişi bir kez tarar; sonrasında her değişen gün için observe()
+    yalnızca o günün eski ve yeni değerleri arasındaki farkı uygular (O(1)).
+    Kayan pencereler bugünle biter; gün değişince build() yeniden çağrılmalıdır.
+    """
+
+    def __init__(self):
+        self.today = None
+        self.first_ordinal = None
+        self.days = {}
+        self.totals = dict.fromkeys(STAT_FIELDS, 0)
+        self.windows = {window: dict.fromkeys(STAT_FIELDS, 0) for window in ROLLING_WINDOWS}
+        self.active_days = 0
+        self.revision = None
+        self._frame = None
+
+    def build(self, daily, today):
+        """Toplamları sıfırdan hesapla"""
+        self.__init__()
+        self.today = today
+        for date_str, day_data in daily.items():
+            self.observe(date_str, day_data)
+
+    def observe(self, date_str, day_data):
+        """Bir günün güncel değerlerini işle (önceki değerlerle farkı uygulanır)"""
+        ordinal = parse_day_ordinal(date_str)
+        previous = self.days.get(date_str)
+        current = {field: day_data.get(field, 0) for field in STAT_FIELDS}
+        if previous == current:
+            return
+        self.days[date_str] = current
+        self._frame = None
+        if ordinal is not None and (self.first_ordinal is None or ordinal < self.first_ordinal):
+            self.first_ordinal = ordinal
+        age = None if ordinal is None or self.today is None else self.today.toordinal() - ordinal
+        for field in STAT_FIELDS:
+            delta = current[field] - (previous[field] if previous else 0)
+            if delta:
+                self.totals[field] += delta
+                for window, sums in self.windows.items():
+                    if age is not None and 0 <= age < window:
+                        sums[field] += delta
+        self.active_days += is_active(current) - (is_active(previous) if previous else 0)
+
+    def day_count(self):
+        return len(self.days)
+
+    def daily_mean(self, field="puan"):
+        """Kayıtlı günler üzerinden günlük ortalama"""
+        return self.totals[field] / len(self.days) if self.days else 0.0
+
+    def rolling_mean(self, window, field="puan"):
+        """Bugünle biten window günlük ortalama (kayıtsız günler 0 sayılır)
+
+        İlk kayıttan bu yana window günden az geçtiyse yalnızca geçen günlere bölünür.
+        """
+        if self.first_ordinal is None or self.today is None:
+            return 0.0
+        span = min(window, max(1, self.today.toordinal() - self.first_ordinal + 1))
+        return self.windows[window][field] / span
+
+    def accuracy(self):
+        """Tüm zamanların doğru cevap yüzdesi"""
+        answered = self.totals["dogru"] + self.totals["yanlis"]
+        return self.totals["dogru"] / answered * 100 if answered else 0.0
+
+    def frame(self):
+        """Grafik ve tablo için tarih sıralı DataFrame (değişiklik olana kadar önbellekte)"""
+        if self._frame is None:
+            import pandas as pd
+            frame = pd.DataFrame.from_dict(self.days, orient="index")
+            frame.index = pd.to_datetime(frame.index)
+            self._frame = frame.sort_index()
+        return self._frame
@@ -0,0 +1,438 @@
+import json
+import os
+import shutil
+import sqlite3
+import sys
+import threading
+
+from journal import DataJournal, replay
+from word_store import plain_words
+
+WORD_COLUMNS = ("en", "tr", "wrong_count", "wrong_test_count", "added_date", "last_wrong_date")
+DAILY_COLUMNS = ("puan", "yeni_kelime", "dogru", "yanlis", "en_tr_answered", "tr_en_answered", "tekrar_answered")
+
+
+def file_signature(paths):
+    """Dosyaların (yol, mtime_ns, boyut) imzası; olmayan dosya için (yol, None, None)"""
+    signature = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            signature.append((path, stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            signature.append((path, None, None))
+    return tuple(signature)
+
+
+class JsonStorage:
+    """kelimeler.json / puan.json snapshot'ları + değişiklik günlüğü"""
+
+    def __init__(self, data_file, score_file, backup_data_file, backup_score_file, journal_file,
+                 journal_max_bytes=256 * 1024, base=None):
+        self.data_file = data_file
+        self.score_file = score_file
+        self.backup_data_file = backup_data_file
+        self.backup_score_file = backup_score_file
+        self.journal = DataJournal(journal_file, max_bytes=journal_max_bytes)
+        # Temel kelime listesi (BaseVocabulary): temel kelimeler dosyada yalnızca referansla tutulur
+        self.base = base
+        # Bu nesne diske yazdıktan sonra on_written(önceki imza, sonraki imza) ile çağrılır; paylaşılan
+        # veri önbelleği kendi yazmasını ayırt eder ve bellekteki veri diskle aynıysa True döndürür
+        self.on_written = None
+        # load() ile aynı kilit altında okunan günlük kayıtları (replay() kullanır)
+        self.loaded_records = None
+
+    def signature(self):
+        """Snapshot ve günlük dosyalarının imzası; başka bir süreç yazınca değişir"""
+        return file_signature((self.data_file, self.score_file, self.journal.path, self.journal.rotated_path))
+
+    def _written(self, before=None, after=None):
+        if self.on_written is None:
+            return True
+        return self.on_written(before, after)
+
+    @property
+    def compacting(self):
+        """Bu süreçte sıkıştırma sürüyor mu (dosyalar değişiyor ama veri aynı)"""
+        return self.journal.compacting
+
+    def load(self):
+        """Snapshot'ları oku; olmayan dosya için None döndür
+
+        Günlük de aynı kilit altında okunur: arada başka bir sürecin sıkıştırması
+        snapshot'ı değiştirip günlüğü silemez.
+        """
+        kelimeler = score_data = None
+        with self.journal.lock:
+            if os.path.exists(self.data_file):
+                with open(self.data_file, "r", encoding="utf-8") as f:
+                    kelimeler = json.load(f)
+            if os.path.exists(self.score_file):
+                with open(self.score_file, "r", encoding="utf-8") as f:
+                    score_data = json.load(f)
+            self.loaded_records = list(self.journal.records())
+        if self.base is not None and isinstance(kelimeler, list):
+            kelimeler = [self.base.expand(word) for word in kelimeler]
+        return kelimeler, score_data
+
+    def replay(self, kelimeler, score_data):
+        """Son snapshot'tan sonraki değişiklikleri günlükten uygula"""
+        records, self.loaded_records = self.loaded_records, None
+        return replay(kelimeler, score_data, self.journal.records() if records is None else records)
+
+    def create_backup(self):
+        """Veri dosyalarının backup'ını oluştur"""
+        if os.path.exists(self.data_file):
+            shutil.copy2(self.data_file, self.backup_data_file)
+        if os.path.exists(self.score_file):
+            shutil.copy2(self.score_file, self.backup_score_file)
+
+    def has_backup(self):
+        return os.path.exists(self.backup_data_file) and os.path.exists(self.backup_score_file)
+
+    def restore_from_backup(self):
+        """Backup dosyalarını geri yükle; backup'tan sonraki günlük kayıtları atılır"""
+        with self.journal.lock:
+            if os.path.exists(self.backup_data_file):
+                shutil.copy2(self.backup_data_file, self.data_file)
+            if os.path.exists(self.backup_score_file):
+                shutil.copy2(self.backup_score_file, self.score_file)
+            self.journal.clear()
+
+    def save_all(self, kelimeler, score_data):
+        """Tam snapshot yaz ve günlüğü sıfırla"""
+        with self.journal.lock:
+            self.create_backup()
+            if kelimeler is not None:
+                with open(self.data_file, "w", encoding="utf-8") as f:
+                    json.dump(self._words_to_save(kelimeler), f, ensure_ascii=False, indent=2)
+            if score_data is not None:
+                with open(self.score_file, "w", encoding="utf-8") as f:
+                    json.dump(score_data, f, ensure_ascii=False, indent=2)
+            self.journal.clear()
+            self._written()
+
+    def _words_to_save(self, kelimeler):
+        words = plain_words(kelimeler)
+        return words if self.base is None else [self.base.strip(word) for word in words]
+
+    def save_record(self, record, kelimeler, score_data):
+        """Tek değişikliği günlüğe ekle; boyut eşiği aşılırsa arka planda sıkıştır
+
+        Başka bir süreç de yazdıysa bellekteki veri onun kayıtlarını içermez:
+        sıkıştırma yapılmaz (kayıtları silerdi) ve veri bir sonraki erişimde yeniden yüklenir.
+        """
+        with self.journal.lock:
+            before = self.signature()
+            compact = self.journal.append(record)
+            if self._written(before, self.signature()) and compact:
+                self.compact(kelimeler, score_data, background=True)
+
+    def compact(self, kelimeler, score_data, background=True):
+        """Günlüğü snapshot'lara işle
+
+        JSON metni veri kilidi altında, çağıran iş parçacığında üretilir; bu yüzden
+        günlükteki gibi boşluksuz yazılır. Dosyaya yazma background=True ile arka planda yapılır.
+        """
+        kelimeler_json = json.dumps(self._words_to_save(kelimeler), ensure_ascii=False, separators=(",", ":"))
+        score_json = json.dumps(score_data, ensure_ascii=False, separators=(",", ":"))
+        published = []
+
+        def publish(current):
+            before = self.signature()
+            result = self._publish_snapshot(current)
+            if result and current:
+                self.journal.discard_rotated()
+            published.append((before, self.signature()))
+            return result
+
+        def on_done():
+            if published:
+                self._written(*published[0])
+
+        with self.journal.lock:
+            before = self.signature()
+            return self.journal.compact(lambda: self._prepare_snapshot(kelimeler_json, score_json), publish,
+                                        background, on_done=on_done,
+                                        on_rotated=lambda: self._written(before, self.signature()))
+
+    def _snapshot_files(self):
+        return [(self.data_file + ".tmp", self.data_file), (self.score_file + ".tmp", self.score_file)]
+
+    def _prepare_snapshot(self, kelimeler_json, score_json):
+        """Hazır JSON metinlerini geçici dosyalara yaz (arka planda, kilit dışında çalışabilir)"""
+        try:
+            for (tmp_path, _), content in zip(self._snapshot_files(), (kelimeler_json, score_json)):
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    f.write(content)
+            return True
+        except Exception:
+            # Günlük silinmediği için bir sonraki yüklemede tekrar oynatılır
+            return False
+
+    def _publish_snapshot(self, current):
+        """Geçici dosyaları atomik olarak yerine koy (günlük kilidi altında çağrılır)
+
+        Arada save_all daha yeni veriyi yazdıysa (current False) eski snapshot atılır.
+        """
+        try:
+            if not current:
+                for tmp_path, _ in self._snapshot_files():
+                    if os.path.exists(tmp_path):
+                        os.remove(tmp_path)
+                return False
+            self.create_backup()
+            for tmp_path, path in self._snapshot_files():
+                os.replace(tmp_path, path)
+            return True
+        except Exception:
+            return False
+
+    def files(self):
+        """Ayarlar sayfasındaki dosya durumu için (etiket, yol) listesi"""
+        return [("📄 Kelime dosyası", self.data_file), ("📊 Puan dosyası", self.score_file),
+                ("💾 Kelime backup", self.backup_data_file), ("💾 Puan backup", self.backup_score_file)]
+
+
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS words (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    en TEXT NOT NULL,
+    tr TEXT NOT NULL,
+    wrong_count INTEGER NOT NULL DEFAULT 0,
+    wrong_test_count INTEGER NOT NULL DEFAULT 0,
+    added_date TEXT,
+    last_wrong_date TEXT,
+    extra TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_words_en ON words(en);
+CREATE INDEX IF NOT EXISTS idx_words_added_date ON words(added_date);
+CREATE INDEX IF NOT EXISTS idx_words_wrong_count ON words(wrong_count);
+CREATE TABLE IF NOT EXISTS daily_stats (
+    date TEXT PRIMARY KEY,
+    puan INTEGER NOT NULL DEFAULT 0,
+    yeni_kelime INTEGER NOT NULL DEFAULT 0,
+    dogru INTEGER NOT NULL DEFAULT 0,
+    yanlis INTEGER NOT NULL DEFAULT 0,
+    en_tr_answered INTEGER NOT NULL DEFAULT 0,
+    tr_en_answered INTEGER NOT NULL DEFAULT 0,
+    tekrar_answered INTEGER NOT NULL DEFAULT 0,
+    extra TEXT
+);
+CREATE TABLE IF NOT EXISTS answers (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    answered_at TEXT,
+    date TEXT,
+    en TEXT NOT NULL,
+    test_type TEXT,
+    is_correct INTEGER,
+    points INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_answers_en ON answers(en);
+CREATE TABLE IF NOT EXISTS wrong_words (
+    en TEXT PRIMARY KEY,
+    seq INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+WORD_ID_SQL = "SELECT id FROM words WHERE en = ? ORDER BY id LIMIT 1"
+
+
+def split_extra(data, columns):
+    """Sabit sütunlara karşılık gelen değerler ve geri kalan alanların JSON'u"""
+    values = [data.get(column) for column in columns]
+    extra = {key: value for key, value in data.items() if key not in columns}
+    return values, json.dumps(extra, ensure_ascii=False) if extra else None
+
+
+class SqliteStorage:
+    """Kelime, günlük istatistik ve cevapları SQLite'ta tek satırlık işlemlerle tutan depo"""
+
+    # Günlük sıkıştırması yok (JsonStorage.compacting ile aynı arayüz)
+    compacting = False
+
+    def __init__(self, db_file, backup_file=None, base=None):
+        self.db_file = db_file
+        self.backup_file = backup_file or db_file + ".bak"
+        self.lock = threading.RLock()
+        self.conn = sqlite3.connect(db_file, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SQLITE_SCHEMA)
+        # en/tr sütunları zorunlu olduğu için satırlar tam tutulur; temel liste yalnızca yüklemede tamamlar
+        self.base = base
+        self.on_written = None
+
+    def signature(self):
+        """Veritabanı ve WAL dosyasının imzası; başka bir süreç yazınca değişir"""
+        return file_signature((self.db_file, self.db_file + "-wal"))
+
+    def _written(self):
+        if self.on_written is not None:
+            self.on_written()
+
+    @property
+    def initialized(self):
+        """Depoya en az bir kez tam kayıt yapıldı mı"""
+        return self.conn.execute("PRAGMA user_version").fetchone()[0] > 0
+
+    def load(self):
+        """Tüm veriyi kelime listesi ve puan sözlüğü olarak oku"""
+        if not self.initialized:
+            return None, None
+        with self.lock:
+            kelimeler = []
+            for row in self.conn.execute(f"SELECT {', '.join(WORD_COLUMNS)}, extra FROM words ORDER BY id"):
+                word = {column: value for column, value in zip(WORD_COLUMNS, row) if value is not None}
+                if row[-1]:
+                    word.update(json.loads(row[-1]))
+                kelimeler.append(word if self.base is None else self.base.expand(word))
+            score_data = {key: json.loads(value) for key, value in self.conn.execute("SELECT key, value FROM meta")}
+            score_data["daily"] = {}
+            for row in self.conn.execute(f"SELECT date, {', '.join(DAILY_COLUMNS)}, extra FROM daily_stats ORDER BY date"):
+                day_data = dict(zip(DAILY_COLUMNS, row[1:-1]))
+                if row[-1]:
+                    day_data.update(json.loads(row[-1]))
+                score_data["daily"][row[0]] = day_data
+            score_data["wrong_words_list"] = [en for (en,) in self.conn.execute("SELECT en FROM wrong_words ORDER BY seq")]
+        return kelimeler, score_data
+
+    def replay(self, kelimeler, score_data):
+        """SQLite'ta her değişiklik anında işlendiği için oynatılacak günlük yok"""
+        return 0
+
+    def create_backup(self):
+        """Veritabanının tutarlı bir kopyasını al"""
+        with self.lock:
+            backup = sqlite3.connect(self.backup_file)
+            try:
+                self.conn.backup(backup)
+            finally:
+                backup.close()
+
+    def has_backup(self):
+        return os.path.exists(self.backup_file)
+
+    def restore_from_backup(self):
+        """Backup veritabanını ana veritabanına geri yükle"""
+        with self.lock:
+            backup = sqlite3.connect(self.backup_file)
+            try:
+                backup.backup(self.conn)
+            finally:
+                backup.close()
+
+    @staticmethod
+    def _word_values(word):
+        values, extra = split_extra(word, WORD_COLUMNS)
+        values[2] = values[2] or 0
+        values[3] = values[3] or 0
+        return values + [extra]
+
+    def _insert_word(self, word):
+        self.conn.execute(f"INSERT INTO words ({', '.join(WORD_COLUMNS)}, extra) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                          self._word_values(word))
+
+    def _put_daily(self, date_str, day_data):
+        values, extra = split_extra(day_data, DAILY_COLUMNS)
+        self.conn.execute(f"INSERT OR REPLACE INTO daily_stats (date, {', '.join(DAILY_COLUMNS)}, extra) "
+                          f"VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", [date_str] + [v or 0 for v in values] + [extra])
+
+    def _put_meta(self, score_data):
+        self.conn.executemany("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                              [(key, json.dumps(value, ensure_ascii=False)) for key, value in score_data.items()
+                               if key not in ("daily", "wrong_words_list")])
+
+    def save_all(self, kelimeler, score_data):
+        """Tüm veriyi tek işlemde değiştir (toplu içe aktarma / sıfırlama)"""
+        with self.lock, self.conn:
+            if kelimeler is not None:
+                self.conn.execute("DELETE FROM words")
+                for word in kelimeler:
+                    self._insert_word(word)
+            if score_data is not None:
+                self.conn.execute("DELETE FROM meta")
+                self.conn.execute("DELETE FROM daily_stats")
+                self.conn.execute("DELETE FROM wrong_words")
+                self._put_meta(score_data)
+                for date_str, day_data in score_data.get("daily", {}).items():
+                    self._put_daily(date_str, day_data)
+                self.conn.executemany("INSERT OR IGNORE INTO wrong_words (en, seq) VALUES (?, ?)",
+                                      [(en, seq) for seq, en in enumerate(score_data.get("wrong_words_list", []))])
+            self.conn.execute("PRAGMA user_version = 1")
+        self._written()
+
+    def save_record(self, record, kelimeler=None, score_data=None):
+        """Günlük kaydını tek işlemde, yalnızca etkilenen satırları güncelleyerek uygula"""
+        with self.lock, self.conn:
+            op = record.get("op")
+            word_id = record.get("en")
+            if op == "add":
+                word_id = record["w"]["en"]
+                if self.conn.execute(WORD_ID_SQL, (word_id,)).fetchone() is None:
+                    self._insert_word(record["w"])
+            elif op == "edit":
+                self.conn.execute(f"UPDATE words SET {', '.join(c + ' = ?' for c in WORD_COLUMNS)}, extra = ? "
+                                  f"WHERE id = ({WORD_ID_SQL})", self._word_values(record["w"]) + [word_id])
+                new_id = record["w"]["en"]
+                if new_id != word_id:
+                    if self.conn.execute("SELECT 1 FROM wrong_words WHERE en = ?", (new_id,)).fetchone():
+                        self.conn.execute("DELETE FROM wrong_words WHERE en = ?", (word_id,))
+                    else:
+                        self.conn.execute("UPDATE wrong_words SET en = ? WHERE en = ?", (new_id, word_id))
+                    word_id = new_id
+            elif op == "answer":
+                fields = {key: value for key, value in record["w"].items() if key in WORD_COLUMNS}
+                extra_fields = {key: value for key, value in record["w"].items() if key not in WORD_COLUMNS}
+                if extra_fields:
+                    row = self.conn.execute(f"SELECT extra FROM words WHERE id = ({WORD_ID_SQL})", (word_id,)).fetchone()
+                    extra = json.loads(row[0]) if row and row[0] else {}
+                    extra.update(extra_fields)
+                    fields["extra"] = json.dumps(extra, ensure_ascii=False)
+                if fields:
+                    self.conn.execute(f"UPDATE words SET {', '.join(c + ' = ?' for c in fields)} "
+                                      f"WHERE id = ({WORD_ID_SQL})", list(fields.values()) + [word_id])
+                self.conn.execute("INSERT INTO answers (answered_at, date, en, test_type, is_correct, points) "
+                                  "VALUES (?, ?, ?, ?, ?, ?)",
+                                  (record.get("at"), next(iter(record.get("d", {})), None), word_id,
+                                   record.get("t"), record.get("ok"), record.get("p")))
+            elif op == "delete":
+                self.conn.execute(f"DELETE FROM words WHERE id = ({WORD_ID_SQL})", (word_id,))
+                self.conn.execute("DELETE FROM wrong_words WHERE en = ?", (word_id,))
+            if record.get("s"):
+                self._put_meta(record["s"])
+            for date_str, day_data in record.get("d", {}).items():
+                self._put_daily(date_str, day_data)
+            if "wl" in record:
+                if record["wl"]:
+                    self.conn.execute("INSERT OR IGNORE INTO wrong_words (en, seq) "
+                                      "SELECT ?, COALESCE(MAX(seq), -1) + 1 FROM wrong_words", (word_id,))
+                else:
+                    self.conn.execute("DELETE FROM wrong_words WHERE en = ?", (word_id,))
+        self._written()
+
+    def files(self):
+        """Ayarlar sayfasındaki dosya durumu için (etiket, yol) listesi"""
+        return [("🗄️ Veritabanı", self.db_file), ("💾 Veritabanı backup", self.backup_file)]
+
+
+def migrate_json_to_sqlite(json_storage, sqlite_storage):
+    """JSON dosyalarındaki (günlük dahil) veriyi SQLite deposuna tek seferde aktar"""
+    kelimeler, score_data = json_storage.load()
+    kelimeler = kelimeler if isinstance(kelimeler, list) else []
+    score_data = score_data if isinstance(score_data, dict) else {}
+    json_storage.replay(kelimeler, score_data)
+    sqlite_storage.save_all(kelimeler, score_data)
+    return len(kelimeler)
+
+
+if __name__ == "__main__":
+    # Kullanım: python storage.py [kelimeler.json] [puan.json] [akademi.db]
+    args = sys.argv[1:] + ["kelimeler.json", "puan.json", "akademi.db"][len(sys.argv) - 1:]
+    source = JsonStorage(args[0], args[1], args[0] + ".bak", args[1] + ".bak", "veri_journal.jsonl")
+    count = migrate_json_to_sqlite(source, SqliteStorage(args[2]))
+    print(f"{count} kelime {args[2]} dosyasına aktarıldı")
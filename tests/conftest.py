@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Uygulama modülleri depo kökünde düz dosyalar olarak durur (paket değil)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
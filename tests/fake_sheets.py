@@ -0,0 +1,87 @@
+class FakeQuotaResponse:
+    status_code = 429
+
+
+class FakeQuotaError(Exception):
+    """FakeWorksheet'in ürettiği kota hatası"""
+
+    def __init__(self):
+        super().__init__("Quota exceeded (429)")
+        self.response = FakeQuotaResponse()
+
+
+class FakeWorksheet:
+    """Testler için bellekte çalışan gspread Worksheet taklidi"""
+
+    def __init__(self, rows=None, fail_times=0):
+        self.rows = [list(row) for row in (rows or [])]
+        self.row_count = max(len(self.rows), 1000)
+        self.calls = []
+        self.fail_times = fail_times
+
+    def _call(self, name):
+        self.calls.append(name)
+        if self.fail_times > 0:
+            self.fail_times -= 1
+            raise FakeQuotaError()
+
+    def _parse_range(self, cell_range):
+        start, end = cell_range.split(":")
+        return int(start.lstrip("ABCDEFGHIJKLMNOPQRSTUVWXYZ")), int(end.lstrip("ABCDEFGHIJKLMNOPQRSTUVWXYZ"))
+
+    def get_all_values(self):
+        self._call("get_all_values")
+        return [[str(value) for value in row] for row in self.rows]
+
+    def row_values(self, index):
+        self._call("row_values")
+        return [str(value) for value in self.rows[index - 1]] if index <= len(self.rows) else []
+
+    def insert_row(self, values, index=1):
+        self._call("insert_row")
+        self.rows.insert(index - 1, list(values))
+        self.row_count += 1
+
+    def append_row(self, values, **kwargs):
+        self._call("append_row")
+        self.rows.append(list(values))
+        self.row_count = max(self.row_count, len(self.rows))
+
+    def delete_rows(self, start_index, end_index=None):
+        self._call("delete_rows")
+        end_index = end_index or start_index
+        del self.rows[start_index - 1:end_index]
+        self.row_count -= min(end_index, self.row_count) - start_index + 1
+
+    def resize(self, rows=None, cols=None):
+        self._call("resize")
+        if rows is not None:
+            self.row_count = rows
+            del self.rows[rows:]
+
+    def batch_get(self, ranges, **kwargs):
+        self._call("batch_get")
+        result = []
+        for cell_range in ranges:
+            start, end = cell_range.split(":")
+            first_col = ord(start[0]) - 65
+            last_col = ord(end[0]) - 65
+            first_row = int(start[1:])
+            last_row = int(end[1:]) if end[1:] else len(self.rows)
+            values = []
+            for row in self.rows[first_row - 1:last_row]:
+                values.append([str(value) for value in row[first_col:last_col + 1]])
+            while values and not values[-1]:
+                values.pop()
+            result.append(values)
+        return result
+
+    def batch_update(self, data, **kwargs):
+        self._call("batch_update")
+        for item in data:
+            start, end = self._parse_range(item["range"])
+            while len(self.rows) < end:
+                self.rows.append([])
+            for offset, values in enumerate(item["values"]):
+                self.rows[start - 1 + offset] = list(values)
+        self.row_count = max(self.row_count, len(self.rows))
@@ -0,0 +1,98 @@
+import asyncio
+import http.client
+import json
+import threading
+from datetime import datetime
+
+import pytest
+
+import api_server
+from api_server import ApiServer, is_loopback
+
+TOKEN = "gizli"
+WORDS = {"Orange": "portakal", "apple": "elma", "pear": "armut", "plum": "erik"}
+
+
+class FixedClock:
+    def now(self):
+        return datetime(2026, 1, 10, 12, 0, 0)
+
+
+@pytest.fixture
+def api(tmp_path):
+    """Geçici veri dizini üzerinde 127.0.0.1'in rastgele bir portunda çalışan sunucu"""
+    words = [{"en": en, "tr": tr, "wrong_count": 0, "wrong_test_count": 0, "added_date": "2026-01-01"}
+             for en, tr in WORDS.items()]
+    (tmp_path / "kelimeler.json").write_text(json.dumps(words), encoding="utf-8")
+    server = ApiServer(data_dir=str(tmp_path), clock=FixedClock(), token=TOKEN)
+    started, running = threading.Event(), {}
+
+    async def serve():
+        listener = await asyncio.start_server(server.handle, "127.0.0.1", 0)
+        running.update(loop=asyncio.get_running_loop(), stop=asyncio.Event(),
+                       port=listener.sockets[0].getsockname()[1])
+        started.set()
+        async with listener:
+            await running["stop"].wait()
+    thread = threading.Thread(target=asyncio.run, args=(serve(),), daemon=True)
+    thread.start()
+    assert started.wait(5)
+    connection = http.client.HTTPConnection("127.0.0.1", running["port"], timeout=10)
+
+    def request(method, path, body=None, token=TOKEN):
+        headers = {"Authorization": f"Bearer {token}"} if token else {}
+        if body is not None:
+            headers["Content-Type"] = "application/json"
+            body = json.dumps(body)
+        connection.request(method, path, body, headers)
+        response = connection.getresponse()
+        return response.status, json.loads(response.read())
+    yield request, tmp_path
+    connection.close()
+    running["loop"].call_soon_threadsafe(running["stop"].set)
+    thread.join(5)
+
+
+def test_question_and_wrong_answer(api):
+    request, data_dir = api
+    status, question = request("GET", "/question?test=en_tr")
+    assert status == 200 and question["test_type"] == "en_tr"
+    assert len(question["secenekler"]) == len(set(question["secenekler"])) >= 2
+    en = next(en for en in WORDS if f"**{en}**" in question["question_text"])
+    wrong = next(option for option in question["secenekler"] if option != WORDS[en])
+    status, result = request("POST", "/answer", {"id": question["id"], "choice": wrong})
+    assert status == 200 and not result["correct"] and result["dogru"] == WORDS[en] and result["points"] < 0
+    assert request("POST", "/answer", {"id": question["id"], "choice": wrong})[0] == 404
+    # Yanlış cevaplanan kelime bir sonraki Sheets senkronizasyonu için işaretlenir
+    dirty = json.loads((data_dir / "sheets_sync_dirty.json").read_text(encoding="utf-8"))["dirty"]
+    assert dirty == [en]
+
+
+def test_add_word(api):
+    request, data_dir = api
+    status, payload = request("POST", "/words", {"en": " Fig ", "tr": "İncir"})
+    assert status == 201 and payload["word"]["en"] == "fig" and payload["word"]["tr"] == "İncir".lower()
+    assert payload["yeni_kelime"] == 1 and payload["score"] == 1
+    # Büyük/küçük harf farkı olan kelimeler (dosyadaki "Orange" dahil) tekrar eklenmez
+    assert request("POST", "/words", {"en": "FIG", "tr": "incir"})[0] == 409
+    assert request("POST", "/words", {"en": "orange", "tr": "portakal"})[0] == 409
+    dirty = json.loads((data_dir / "sheets_sync_dirty.json").read_text(encoding="utf-8"))["dirty"]
+    assert dirty == ["fig"]
+    status, stats = request("GET", "/stats")
+    assert status == 200 and stats["words"] == 5
+
+
+def test_requests_without_the_token_are_rejected(api):
+    request, _ = api
+    assert request("GET", "/stats", token=None)[0] == 401
+    assert request("GET", "/stats", token="yanlis")[0] == 401
+    assert request("GET", "/nowhere")[0] == 404
+    assert request("POST", "/words", {"en": "", "tr": "x"})[0] == 400
+
+
+def test_non_loopback_host_requires_a_token(monkeypatch):
+    monkeypatch.delenv("AKADEMI_API_TOKEN", raising=False)
+    assert is_loopback("127.0.0.1") and is_loopback("::1") and is_loopback("localhost")
+    assert not is_loopback("0.0.0.0") and not is_loopback("example.org")
+    with pytest.raises(SystemExit):
+        api_server.main(["--host", "0.0.0.0", "--system-time"])
@@ -0,0 +1,67 @@
+import io
+import json
+
+import pytest
+
+from backup_archive import ImportReport, compile_word_validator, import_words, iter_json_items, word_defaults
+
+
+class SmallReads(io.BytesIO):
+    """Her okumada en fazla birkaç bayt döndüren akış (okuma sınırlarını zorlar)"""
+
+    def read(self, size=-1):
+        return super().read(3)
+
+
+WORDS = [{"en": "a \"quoted\" word", "tr": "tırnaklı \\ kelime", "wrong_count": 1.5e3},
+         {"en": "ünicode", "tr": "çğıöşü İ", "note": ["x", {"y": None}]},
+         {"en": "[,]", "tr": "{}", "added_date": "2026-01-01"}]
+
+
+def encode(items, **kwargs):
+    return json.dumps(items, **kwargs).encode("utf-8")
+
+
+@pytest.mark.parametrize("read_bytes", [1, 2, 7, 64 * 1024])
+def test_items_split_across_read_boundaries(read_bytes):
+    data = encode(WORDS, ensure_ascii=False, indent=2)
+    assert list(iter_json_items(io.BytesIO(data), read_bytes=read_bytes)) == WORDS
+
+
+def test_escaped_strings_and_bom_in_short_reads():
+    data = b"\xef\xbb\xbf" + encode(WORDS)
+    assert list(iter_json_items(SmallReads(data))) == WORDS
+    assert list(iter_json_items(io.BytesIO(b" [ ] "))) == []
+
+
+@pytest.mark.parametrize("data", [b"", b"[", b'[{"en": "a", "tr": "b"}', b'[{"en": "a", "tr": "b"},', b'[{"en": "a'])
+def test_truncated_file_raises(data):
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_items(io.BytesIO(data), read_bytes=4))
+
+
+def test_not_a_list_raises():
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_items(io.BytesIO(b'{"en": "a"}')))
+
+
+def test_validator_rejections_are_reported_and_nothing_is_kept():
+    items = [{"en": "a", "tr": "x"}, "metin", {"en": "b"}] + [{"tr": "y"}] * 12
+    target, report = [], ImportReport()
+    import_words(iter(items), target, compile_word_validator(word_defaults("2026-01-10")), report, batch_size=1)
+    assert target == [{"en": "a", "tr": "x", "wrong_count": 0, "added_date": "2026-01-10", "wrong_test_count": 0}]
+    assert report.error_count == 14 and len(report.errors) == 10
+    assert report.errors[0] == "Kelime 2: Dict formatında değil"
+    assert report.errors[1] == "Kelime 3: 'en' veya 'tr' alanı eksik"
+    assert report.error_text().endswith("; ... ve 4 hata daha")
+
+
+def test_missing_fields_are_filled_and_counted():
+    items = iter_json_items(io.BytesIO(encode([{"en": "a", "tr": "x", "added_date": "2026-01-01"},
+                                               {"en": "b", "tr": "y"}])))
+    target, report = [], ImportReport()
+    import_words(items, target, compile_word_validator(word_defaults("2026-01-10")), report)
+    assert report.error_count == 0 and report.words == 2
+    assert report.fixed == {"wrong_count": 2, "wrong_test_count": 2, "added_date": 1}
+    assert report.word_dates == {"2026-01-01": 1, "2026-01-10": 1}
+    assert [word["added_date"] for word in target] == ["2026-01-01", "2026-01-10"]
@@ -0,0 +1,89 @@
+import io
+import os
+import zipfile
+from datetime import datetime, timedelta
+
+from backup_archive import ImportReport, compile_word_validator, import_words, iter_json_items, word_defaults, \
+    write_backup_zip
+from backup_store import ChunkedBackupStore
+
+NOW = datetime(2026, 1, 10, 12, 0, 0)
+
+
+def make_data(count=2000):
+    kelimeler = [{"en": f"w{i}", "tr": f"t{i}", "wrong_count": i % 3, "wrong_test_count": 0,
+                  "added_date": "2026-01-01"} for i in range(count)]
+    score_data = {"score": 42, "wrong_words_list": ["w1"],
+                  "daily": {"2025-12-31": {"puan": 1}, "2026-01-01": {"puan": 2}}}
+    return kelimeler, score_data
+
+
+def manifest_chunks(manifest):
+    return set(manifest["words"]) | {manifest["score"]} | set(manifest["daily"].values())
+
+
+def chunk_files(store):
+    return {name for prefix in os.listdir(store.chunk_dir) for name in os.listdir(os.path.join(store.chunk_dir, prefix))}
+
+
+def test_unchanged_data_writes_no_new_chunks(tmp_path):
+    store = ChunkedBackupStore(str(tmp_path))
+    kelimeler, score_data = make_data()
+    first, stats = store.backup(kelimeler, score_data, now=NOW)
+    assert stats["new_chunks"] == len(first["words"]) + 1 + len(first["daily"]) > 3
+    second, stats = store.backup(kelimeler, score_data, now=NOW + timedelta(seconds=1))
+    assert stats["new_chunks"] == 0 and stats["new_bytes"] == 0
+    assert second["words"] == first["words"]
+    assert [manifest["id"] for manifest in store.snapshots()] == [second["id"], first["id"]]
+
+    # Tek kelime değişince yalnızca onun parçası yeniden yazılır
+    kelimeler[5]["wrong_count"] = 9
+    _, stats = store.backup(kelimeler, score_data, now=NOW + timedelta(seconds=2))
+    assert stats["new_chunks"] == 1
+
+
+def test_prune_keeps_chunks_of_remaining_backups(tmp_path):
+    store = ChunkedBackupStore(str(tmp_path))
+    kelimeler, score_data = make_data()
+    old, _ = store.backup(kelimeler, score_data, now=NOW)
+    kelimeler[5]["wrong_count"] = 9
+    score_data["daily"]["2026-01-10"] = {"puan": 3}
+    new, _ = store.backup(kelimeler, score_data, now=NOW + timedelta(seconds=1))
+
+    removed = store.prune(1)
+    assert removed == len(manifest_chunks(old) - manifest_chunks(new)) == 2
+    assert [manifest["id"] for manifest in store.snapshots()] == [new["id"]]
+    assert chunk_files(store) == manifest_chunks(new)
+    assert list(store.iter_words(new["id"])) == kelimeler
+    assert store.load_score(new["id"]) == score_data
+
+
+def test_corrupted_chunk_is_rewritten(tmp_path):
+    store = ChunkedBackupStore(str(tmp_path))
+    kelimeler, score_data = make_data(10)
+    manifest, _ = store.backup(kelimeler, score_data, now=NOW)
+    digest = manifest["words"][0]
+    with open(store._chunk_path(digest), "wb") as f:
+        f.write(b"yarim")
+
+    _, stats = store.backup(kelimeler, score_data, now=NOW + timedelta(seconds=1))
+    assert stats["new_chunks"] == 1
+    assert list(store.iter_words(manifest["id"])) == kelimeler
+
+
+def test_entries_make_a_zip_that_imports_back(tmp_path):
+    store = ChunkedBackupStore(str(tmp_path))
+    kelimeler, score_data = make_data()
+    manifest, _ = store.backup(kelimeler, score_data, now=NOW)
+
+    buffer = io.BytesIO()
+    size = write_backup_zip(buffer, store.entries(manifest["id"]))
+    assert size == len(buffer.getvalue())
+    with zipfile.ZipFile(buffer) as archive:
+        assert sorted(archive.namelist()) == ["backup_info.json", "kelimeler.json", "puan.json"]
+        imported, report = [], ImportReport()
+        with archive.open("kelimeler.json") as f:
+            import_words(iter_json_items(f, read_bytes=1000), imported,
+                         compile_word_validator(word_defaults("2026-01-10")), report)
+    assert report.error_count == 0 and report.words == len(kelimeler)
+    assert imported == kelimeler
@@ -0,0 +1,81 @@
+from datetime import datetime, timedelta
+
+from clock import ClockService
+
+
+class FakeTime:
+    """Elle ilerletilen sistem saati ve monotonic saat"""
+
+    def __init__(self):
+        self.wall = datetime(2026, 1, 1, 12, 0, 0)
+        self.mono = 1000.0
+
+    def now(self):
+        return self.wall
+
+    def monotonic(self):
+        return self.mono
+
+    def advance(self, seconds):
+        self.wall += timedelta(seconds=seconds)
+        self.mono += seconds
+
+
+def make_clock(fake, source, **kwargs):
+    return ClockService(source, system_now=fake.now, monotonic=fake.monotonic, background=False, **kwargs)
+
+
+def test_offset_from_source_is_applied():
+    fake = FakeTime()
+    clock = make_clock(fake, lambda: fake.wall + timedelta(minutes=5))
+    assert clock.now() == fake.wall + timedelta(minutes=5)
+    fake.advance(60)
+    assert clock.now() == fake.wall + timedelta(minutes=5)
+
+
+def test_source_is_called_once_per_ttl():
+    fake = FakeTime()
+    calls = []
+
+    def source():
+        calls.append(fake.mono)
+        return fake.wall
+    clock = make_clock(fake, source, ttl=100)
+    for _ in range(10):
+        clock.now()
+        fake.advance(5)
+    assert len(calls) == 1
+    fake.advance(100)
+    clock.now()
+    assert len(calls) == 2
+
+
+def test_failing_source_falls_back_to_system_time_and_retries_later():
+    fake = FakeTime()
+    calls = []
+
+    def source():
+        calls.append(fake.mono)
+        raise OSError("ağ yok")
+    clock = make_clock(fake, source, ttl=100, retry_after=30)
+    assert clock.now() == fake.wall
+    fake.advance(10)
+    assert clock.now() == fake.wall
+    assert len(calls) == 1
+    fake.advance(30)
+    clock.now()
+    assert len(calls) == 2
+
+
+def test_last_offset_is_kept_when_refresh_fails():
+    fake = FakeTime()
+    responses = [lambda: fake.wall + timedelta(hours=1)]
+
+    def source():
+        if responses:
+            return responses.pop()()
+        raise OSError("ağ yok")
+    clock = make_clock(fake, source, ttl=10)
+    assert clock.now() == fake.wall + timedelta(hours=1)
+    fake.advance(20)
+    assert clock.now() == fake.wall + timedelta(hours=1)
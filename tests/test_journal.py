@@ -0,0 +1,137 @@
+import json
+import threading
+import time
+
+import pytest
+
+from journal import DataJournal, answer_record, replay, score_patch, word_record
+from storage import JsonStorage
+
+
+def new_score():
+    return {"score": 0, "daily": {}, "last_check_date": None, "answered_today": 0, "correct_streak": 0,
+            "wrong_streak": 0, "combo_multiplier": 1.0, "en_tr_answered": 0, "tr_en_answered": 0,
+            "tekrar_answered": 0, "wrong_words_list": []}
+
+
+@pytest.fixture
+def storage(tmp_path):
+    path = lambda name: str(tmp_path / name)
+    return JsonStorage(path("kelimeler.json"), path("puan.json"), path("kelimeler_backup.json"),
+                       path("puan_backup.json"), path("veri_journal.jsonl"), journal_max_bytes=10 ** 9)
+
+
+def load(storage):
+    kelimeler, score_data = storage.load()
+    storage.replay(kelimeler, score_data)
+    return kelimeler, score_data
+
+
+def test_append_and_replay_restore_changes(storage):
+    kelimeler = [{"en": "apple", "tr": "elma", "wrong_count": 0}]
+    score_data = new_score()
+    storage.save_all(kelimeler, score_data)
+
+    word = {"en": "pear", "tr": "armut", "wrong_count": 0}
+    kelimeler.append(word)
+    score_data["score"] += 1
+    storage.save_record(word_record("add", word, score_data), kelimeler, score_data)
+    word["wrong_count"] = 1
+    score_data["wrong_words_list"].append("pear")
+    score_data["daily"]["2026-01-01"] = {"puan": -2}
+    storage.save_record(answer_record(word, score_data, "2026-01-01"), kelimeler, score_data)
+    kelimeler[0]["en"] = "apples"
+    storage.save_record(word_record("edit", kelimeler[0], old_en="apple"), kelimeler, score_data)
+
+    assert load(storage) == (kelimeler, score_data)
+
+
+def test_replay_is_idempotent():
+    kelimeler = [{"en": "a", "tr": "x"}]
+    score_data = new_score()
+    records = [word_record("add", {"en": "b", "tr": "y"}), word_record("delete", {"en": "a"}),
+               {"op": "score", **score_patch({"score": 5, "daily": {}}, [])}]
+    replay(kelimeler, score_data, records)
+    once = json.dumps([kelimeler, score_data])
+    replay(kelimeler, score_data, records)
+    assert json.dumps([kelimeler, score_data]) == once
+    assert kelimeler == [{"en": "b", "tr": "y"}] and score_data["score"] == 5
+
+
+def test_partial_last_line_is_skipped(tmp_path):
+    journal = DataJournal(str(tmp_path / "j.jsonl"))
+    journal.append({"op": "delete", "en": "a"})
+    with open(journal.path, "a", encoding="utf-8") as f:
+        f.write('{"op": "del')
+    assert list(journal.records()) == [{"op": "delete", "en": "a"}]
+
+
+def test_compaction_writes_snapshot_and_clears_journal(storage):
+    kelimeler = [{"en": "a", "tr": "x"}]
+    score_data = new_score()
+    storage.save_all(kelimeler, score_data)
+    kelimeler.append({"en": "b", "tr": "y"})
+    storage.save_record(word_record("add", kelimeler[-1]), kelimeler, score_data)
+
+    assert storage.compact(kelimeler, score_data, background=False)
+    assert storage.journal.size() == 0 and list(storage.journal.records()) == []
+    assert storage.load()[0] == kelimeler
+
+
+def test_background_compaction_never_overwrites_a_newer_save(storage):
+    kelimeler = [{"en": "a", "tr": "x"}]
+    score_data = new_score()
+    storage.save_all(kelimeler, score_data)
+    kelimeler.append({"en": "b", "tr": "y"})
+    storage.save_record(word_record("add", kelimeler[-1]), kelimeler, score_data)
+
+    # Arka plandaki sıkıştırma snapshot'ı hazırlarken bekletilir
+    prepared, release = threading.Event(), threading.Event()
+    prepare = storage._prepare_snapshot
+
+    def slow_prepare(*args):
+        result = prepare(*args)
+        prepared.set()
+        release.wait(5)
+        return result
+    storage._prepare_snapshot = slow_prepare
+    assert storage.compact(kelimeler, score_data, background=True)
+    assert prepared.wait(5)
+
+    newer = kelimeler + [{"en": "c", "tr": "z"}]
+    storage.save_all(newer, dict(score_data, score=3))
+    release.set()
+    for _ in range(500):
+        if not storage.compacting:
+            break
+        time.sleep(0.01)
+
+    kelimeler, score_data = load(storage)
+    assert [word["en"] for word in kelimeler] == ["a", "b", "c"]
+    assert score_data["score"] == 3
+
+
+def test_second_writer_is_not_hidden_or_compacted_away(tmp_path):
+    from shared_data import SharedDataCache
+
+    path = lambda name: str(tmp_path / name)
+
+    def open_cache(journal_max_bytes):
+        storage = JsonStorage(path("kelimeler.json"), path("puan.json"), path("kelimeler_backup.json"),
+                              path("puan_backup.json"), path("veri_journal.jsonl"), journal_max_bytes=journal_max_bytes)
+        return SharedDataCache(storage)
+    first, second = open_cache(1), open_cache(10 ** 9)
+    first.storage.save_all([{"en": "a", "tr": "x"}], new_score())
+    kelimeler_a, score_a, _ = first.get(lambda: load(first.storage))
+    kelimeler_b, score_b, _ = second.get(lambda: load(second.storage))
+
+    # İkinci süreç bir kelime ekler; birincinin sonraki kaydı eşiği aşsa da sıkıştırma yapılmaz
+    kelimeler_b.append({"en": "b", "tr": "y"})
+    second.storage.save_record(word_record("add", kelimeler_b[-1]), kelimeler_b, score_b)
+    kelimeler_a.append({"en": "c", "tr": "z"})
+    first.storage.save_record(word_record("add", kelimeler_a[-1]), kelimeler_a, score_a)
+    assert not first.storage.compacting and first.storage.journal.size() > 0
+
+    kelimeler, _, reloaded = first.get(lambda: load(first.storage))
+    assert reloaded
+    assert [word["en"] for word in kelimeler] == ["a", "b", "c"]
@@ -0,0 +1,46 @@
+import threading
+import time
+
+from quiz import QuestionQueue
+
+
+def question(word):
+    return word, word["tr"], [word["tr"]], word["en"]
+
+
+def test_refill_drops_a_question_built_before_discard():
+    word, other = {"en": "a", "tr": "x"}, {"en": "b", "tr": "y"}
+    queue = QuestionQueue(size=1)
+    started, release = threading.Event(), threading.Event()
+    produced = [word, other]
+
+    def generate():
+        started.set()
+        release.wait(5)
+        return question(produced.pop(0))
+    queue.refill("k", generate)
+    assert started.wait(5)
+    # Kelime üretim sürerken cevaplandı: eski soru kuyruğa girmemeli
+    queue.discard(word)
+    release.set()
+    for _ in range(500):
+        if not queue.refilling:
+            break
+        time.sleep(0.01)
+    assert [item[0] for item in queue.questions] == [other]
+
+
+def test_refill_does_not_queue_the_same_word_twice():
+    word = {"en": "a", "tr": "x"}
+    queue = QuestionQueue(size=3)
+    queue.refill("k", lambda: question(word), background=False)
+    assert len(queue) == 1
+
+
+def test_pop_with_a_new_key_empties_the_queue():
+    words = iter([{"en": "a", "tr": "x"}, {"en": "b", "tr": "y"}])
+    queue = QuestionQueue(size=2)
+    queue.refill("k1", lambda: question(next(words)), background=False)
+    assert len(queue) == 2
+    assert queue.pop("k2") is None
+    assert len(queue) == 0 and queue.misses == 1
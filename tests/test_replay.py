@@ -0,0 +1,60 @@
+from datetime import date
+
+from quiz import QuestionGenerator
+from replay import QuestionRecorder, load_recording, replay, simulate
+
+DAYS = (date(2026, 1, 5), date(2026, 1, 6), date(2026, 1, 8))
+
+
+def make_words(count=120):
+    return [{"en": f"w{i}", "tr": f"t{i}", "wrong_count": 0, "wrong_test_count": 0,
+             "added_date": f"2025-12-{i % 28 + 1:02d}"} for i in range(count)]
+
+
+def run(seed, count=300, recorder=None, days=DAYS[:1]):
+    kelimeler, score_data = make_words(), {}
+    results = [simulate(kelimeler, score_data, day, QuestionGenerator(seed + offset), count, recorder=recorder)
+               for offset, day in enumerate(days)]
+    return kelimeler, score_data, results
+
+
+def test_simulate_is_deterministic_for_a_seed(tmp_path):
+    first = tmp_path / "first.jsonl"
+    second = tmp_path / "second.jsonl"
+    kelimeler_a, score_a, results_a = run(7, recorder=QuestionRecorder(str(first), 7))
+    kelimeler_b, score_b, results_b = run(7, recorder=QuestionRecorder(str(second), 7))
+    assert kelimeler_a == kelimeler_b
+    assert score_a == score_b
+    assert [result.points for result in results_a] == [result.points for result in results_b]
+    assert load_recording(str(first))[1] == load_recording(str(second))[1]
+
+
+def test_different_seeds_give_different_streams(tmp_path):
+    first = tmp_path / "first.jsonl"
+    second = tmp_path / "second.jsonl"
+    run(7, recorder=QuestionRecorder(str(first), 7))
+    run(8, recorder=QuestionRecorder(str(second), 8))
+    assert load_recording(str(first))[1] != load_recording(str(second))[1]
+
+
+def test_replay_of_a_multi_day_recording_matches(tmp_path):
+    path = tmp_path / "kayit.jsonl"
+    kelimeler, score_data, results = run(11, count=200, recorder=QuestionRecorder(str(path), 11), days=DAYS)
+    header, events = load_recording(str(path))
+    assert header["seed"] == 11
+    assert {event["date"] for event in events} == {day.isoformat() for day in DAYS}
+
+    replayed_words, replayed_score = make_words(), {}
+    result = replay(events, replayed_words, replayed_score)
+    assert result.mismatches == []
+    assert result.answers == sum(item.answers for item in results)
+    assert replayed_words == kelimeler
+    assert replayed_score == score_data
+
+
+def test_replay_reports_changed_results():
+    events = [{"type": "question", "date": "2026-01-05", "test": "en_tr", "en": "w1", "dogru": "t1"},
+              {"type": "answer", "date": "2026-01-05", "test": "en_tr", "en": "w1", "cevap": "t1",
+               "correct": False, "points": -2}]
+    result = replay(events, make_words(), {})
+    assert len(result.mismatches) == 1
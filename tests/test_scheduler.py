@@ -0,0 +1,75 @@
+from datetime import date
+
+import pytest
+
+from scheduler import DEFAULT_EASE, MIN_EASE, WRONG_LIST_STEPS, ReviewScheduler, next_ease
+from word_index import WrongWordsIndex
+
+TODAY = date(2026, 1, 10)
+
+
+def make_scheduler(kelimeler, wrong_list=()):
+    wrong_index = WrongWordsIndex()
+    wrong_index.build(kelimeler, list(wrong_list))
+    scheduler = ReviewScheduler(wrong_index)
+    scheduler.build(kelimeler)
+    return scheduler, wrong_index
+
+
+def test_ease_follows_sm2_and_has_a_floor():
+    assert next_ease(DEFAULT_EASE, 5) == 2.6
+    assert next_ease(DEFAULT_EASE, 4) == 2.5
+    assert next_ease(DEFAULT_EASE, 1) == pytest.approx(1.96)
+    assert next_ease(MIN_EASE, 0) == MIN_EASE
+
+
+def test_correct_reviews_grow_the_interval():
+    word = {"en": "a", "tr": "x", "added_date": "2026-01-01"}
+    scheduler, _ = make_scheduler([word])
+    intervals = []
+    for _ in range(4):
+        assert scheduler.review(word, True, "tekrar", TODAY) == "reviewed"
+        intervals.append(word["interval"])
+    assert intervals == [1, 6, 15, 38]
+    assert word["reps"] == 4
+    assert word["due_date"] == "2026-02-17"
+
+
+def test_wrong_answer_lapses_into_the_wrong_list_and_graduates():
+    word = {"en": "a", "tr": "x", "added_date": "2026-01-01", "reps": 3, "interval": 15, "ease": 2.5}
+    scheduler, wrong_index = make_scheduler([word])
+    assert scheduler.review(word, False, "en_tr", TODAY) == "lapsed"
+    assert wrong_index.contains("a") and word["reps"] == 0 and word["ease"] < 2.5
+    assert scheduler.next_due(TODAY) is None
+    # Başka testte doğru bilmek yanlış listesi adımını ilerletmez
+    assert scheduler.review(word, True, "tekrar", TODAY) == "learning"
+    for _ in range(WRONG_LIST_STEPS - 1):
+        assert scheduler.review(word, True, "yanlis", TODAY) == "step"
+    assert scheduler.review(word, True, "yanlis", TODAY) == "graduated"
+    assert not wrong_index.contains("a")
+    assert word["due_date"] == "2026-01-11"
+    assert scheduler.next_due(date(2026, 1, 11)) is word
+
+
+def test_next_due_returns_the_most_overdue_word():
+    kelimeler = [{"en": "recent", "tr": "x", "added_date": "2026-01-01", "due_date": "2026-01-09"},
+                 {"en": "old", "tr": "y", "added_date": "2026-01-01", "due_date": "2026-01-05"},
+                 {"en": "later", "tr": "z", "added_date": "2026-01-01", "due_date": "2026-02-01"},
+                 {"en": "wrong", "tr": "w", "added_date": "2025-12-01", "due_date": "2026-01-01"}]
+    scheduler, _ = make_scheduler(kelimeler, wrong_list=["wrong"])
+    assert scheduler.next_due(TODAY)["en"] == "old"
+    scheduler.review(kelimeler[1], True, "tekrar", TODAY)
+    assert scheduler.next_due(TODAY)["en"] == "recent"
+    scheduler.remove(kelimeler[0])
+    assert scheduler.next_due(TODAY) is None
+
+
+def test_unreviewed_words_are_left_to_the_age_buckets():
+    kelimeler = [{"en": "today", "tr": "x", "added_date": "2026-01-10"},
+                 {"en": "old", "tr": "y", "added_date": "2025-06-01"}]
+    scheduler, _ = make_scheduler(kelimeler)
+    assert scheduler.next_due(TODAY) is None
+    scheduler.push(kelimeler[0])
+    assert scheduler.next_due(TODAY) is None
+    scheduler.review(kelimeler[1], True, "tekrar", TODAY)
+    assert scheduler.next_due(date(2026, 1, 11)) is kelimeler[1]
@@ -0,0 +1,50 @@
+import gc
+from types import SimpleNamespace
+
+from base_vocabulary import BaseVocabulary, BaseWord
+from shared_data import SharedDataCache, UserDataRegistry
+
+
+class Entry(SimpleNamespace):
+    pass
+
+
+class FakeStorage:
+    def __init__(self):
+        self.on_written = None
+
+    def signature(self):
+        return ()
+
+
+def open_entry(user_id):
+    return Entry(user_id=user_id, shared_data=SharedDataCache(FakeStorage()))
+
+
+def test_evicted_entry_held_by_a_session_is_reused():
+    registry = UserDataRegistry(1)
+    held = registry.get("a", open_entry)
+    registry.get("b", open_entry)
+    assert list(registry.entries) == ["b"] and registry.evictions == 1
+    # Oturum girdiyi hâlâ tutuyor: ikinci bir depo açılmaz
+    assert registry.get("a", open_entry) is held
+
+    # Oturum kapandı: girdi bırakılır, sonraki erişimde diskten yeniden açılır
+    registry.get("b", open_entry)
+    del held
+    gc.collect()
+    assert "a" not in registry.evicted
+    opened = []
+    registry.get("a", lambda user_id: opened.append(user_id) or open_entry(user_id))
+    assert opened == ["a"]
+
+
+def test_base_words_resolve_on_read_and_save_only_own_fields():
+    base = BaseVocabulary([{"en": "apple", "tr": "elma"}])
+    word = base.expand({"base": "apple", "en": "apple", "wrong_count": 1})
+    assert isinstance(word, BaseWord)
+    assert word.own == {"base": "apple", "wrong_count": 1}
+    assert word["tr"] == "elma" and dict(word) == {"base": "apple", "wrong_count": 1, "en": "apple", "tr": "elma"}
+    word["tr"] = "elma (meyve)"
+    assert base.strip(dict(word)) == {"base": "apple", "wrong_count": 1, "tr": "elma (meyve)"}
+    assert base.words["apple"]["tr"] == "elma"
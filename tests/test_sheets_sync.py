@@ -0,0 +1,113 @@
+import pytest
+
+from fake_sheets import FakeQuotaError, FakeWorksheet
+from sheets_sync import (SHEET_HEADER, SheetChangeTracker, bulk_sync_words, incremental_sync_words,
+                         pull_changed_words, row_to_word, sheet_row_map, with_backoff, word_to_row)
+
+TODAY = "2026-01-01"
+
+
+def make_words(count):
+    return [{"en": f"w{i}", "tr": f"t{i}", "wrong_count": 0, "added_date": TODAY} for i in range(count)]
+
+
+@pytest.fixture
+def tracker(tmp_path):
+    return SheetChangeTracker(str(tmp_path / "state.json"), str(tmp_path / "dirty.json"))
+
+
+def sheet_words(sheet):
+    """Tablodaki kelimeler (başlık hariç), en → tr"""
+    assert sheet.rows[0] == SHEET_HEADER
+    return {row[0]: row[1] for row in sheet.rows[1:]}
+
+
+def test_bulk_sync_writes_chunks_and_resets_tracker(tracker):
+    sheet = FakeWorksheet()
+    words = make_words(12)
+    assert bulk_sync_words(sheet, words, TODAY, chunk_size=5, tracker=tracker) == 12
+    assert sheet.calls.count("batch_update") == 3
+    assert sheet.row_count == 13
+    assert sheet_words(sheet) == {word["en"]: word["tr"] for word in words}
+    assert tracker.synced and not tracker.dirty
+    assert tracker.rows["w0"] == [2, word_to_row(words[0], TODAY)[-1]]
+
+
+def test_backoff_retries_quota_errors():
+    sheet = FakeWorksheet(fail_times=2)
+    delays = []
+    assert with_backoff(sheet.get_all_values, retries=3, base_delay=1, sleep=delays.append) == []
+    assert delays == [1, 2]
+    sheet = FakeWorksheet(fail_times=5)
+    with pytest.raises(FakeQuotaError):
+        with_backoff(sheet.get_all_values, retries=1, base_delay=1, sleep=lambda seconds: None)
+
+
+def test_incremental_push_sends_only_dirty_rows(tracker):
+    sheet = FakeWorksheet()
+    words = make_words(6)
+    bulk_sync_words(sheet, words, TODAY, tracker=tracker)
+    sheet.calls.clear()
+
+    words[1]["tr"] = "yeni"
+    words.append({"en": "w6", "tr": "t6", "wrong_count": 0, "added_date": TODAY})
+    deleted = words.pop(3)
+    tracker.mark("w1", "w6", deleted["en"])
+    assert incremental_sync_words(sheet, words, tracker, TODAY) == (1, 1, 1)
+    assert sheet_words(sheet) == {word["en"]: word["tr"] for word in words}
+    assert sheet.row_count == len(words) + 1
+    assert not tracker.dirty
+    # Satır haritası tablodaki gerçek satırlarla aynı
+    assert tracker.rows == sheet_row_map(sheet.get_all_values())
+    assert incremental_sync_words(sheet, words, tracker, TODAY) == (0, 0, 0)
+
+
+def test_pull_finds_edits_made_in_the_sheets_ui(tracker):
+    sheet = FakeWorksheet()
+    bulk_sync_words(sheet, make_words(4), TODAY, tracker=tracker)
+    assert pull_changed_words(sheet, tracker, TODAY)[:2] == ([], [])
+
+    # Sheets arayüzünden düzenleme: rev sütunu değişmez
+    sheet.rows[2][1] = "elle"
+    del sheet.rows[3]
+    sheet.rows.append(["w9", "t9"])
+    changed, removed, rows = pull_changed_words(sheet, tracker, TODAY)
+    assert [(word["en"], word["tr"]) for word in changed] == [("w1", "elle"), ("w9", "t9")]
+    assert removed == ["w2"]
+    assert rows == sheet_row_map(sheet.get_all_values())
+
+
+def test_pull_then_push_keeps_unpushed_local_edits(tracker):
+    sheet = FakeWorksheet()
+    words = make_words(4)
+    bulk_sync_words(sheet, words, TODAY, tracker=tracker)
+
+    words[0]["tr"] = "yerel"
+    tracker.mark("w0")
+    words.append({"en": "w4", "tr": "t4", "wrong_count": 0, "added_date": TODAY})
+    tracker.mark("w4")
+    sheet.rows[3][1] = "uzak"
+
+    changed, removed, rows = pull_changed_words(sheet, tracker, TODAY)
+    tracker.update_rows(rows)
+    for word in changed:
+        next(local for local in words if local["en"] == word["en"])["tr"] = word["tr"]
+    assert tracker.dirty == {"w0", "w4"}
+
+    assert incremental_sync_words(sheet, words, tracker, TODAY) == (1, 1, 0)
+    assert sheet_words(sheet) == {"w0": "yerel", "w1": "t1", "w2": "uzak", "w3": "t3", "w4": "t4"}
+
+
+def test_tracker_state_survives_reload(tracker):
+    sheet = FakeWorksheet()
+    bulk_sync_words(sheet, make_words(3), TODAY, tracker=tracker)
+    tracker.mark("w1")
+    reloaded = SheetChangeTracker(tracker.state_path, tracker.dirty_path)
+    assert reloaded.synced and reloaded.dirty == {"w1"}
+    assert reloaded.rows == tracker.rows
+
+
+def test_row_to_word_skips_incomplete_rows():
+    assert row_to_word(["en"], TODAY) is None
+    assert row_to_word(["a", "b", "x", ""], TODAY) == {"en": "a", "tr": "b", "wrong_count": 0,
+                                                      "wrong_test_count": 0, "added_date": TODAY}
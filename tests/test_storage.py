@@ -0,0 +1,89 @@
+import pytest
+
+from journal import answer_record, score_patch, word_record
+from storage import JsonStorage, SqliteStorage, migrate_json_to_sqlite
+
+
+def new_score():
+    return {"score": 0, "daily": {}, "last_check_date": None, "answered_today": 0, "correct_streak": 0,
+            "wrong_streak": 0, "combo_multiplier": 1.0, "en_tr_answered": 0, "tr_en_answered": 0,
+            "tekrar_answered": 0, "wrong_words_list": []}
+
+
+def sample_data():
+    kelimeler = [{"en": "apple", "tr": "elma", "wrong_count": 0, "wrong_test_count": 0,
+                  "added_date": "2026-01-01", "last_wrong_date": None},
+                 {"en": "pear", "tr": "armut", "wrong_count": 2, "wrong_test_count": 1,
+                  "added_date": "2026-01-02", "last_wrong_date": "2026-01-03", "ease": 2.36, "due_date": "2026-01-04"}]
+    score_data = new_score()
+    score_data.update(score=7, last_check_date="2026-01-03", wrong_words_list=["pear"])
+    score_data["daily"]["2026-01-03"] = {"puan": 7, "yeni_kelime": 2, "dogru": 3, "yanlis": 1,
+                                         "en_tr_answered": 4, "tr_en_answered": 0, "tekrar_answered": 0}
+    return kelimeler, score_data
+
+
+def without_none(kelimeler):
+    # SQLite boş sütunları (None) alan olarak döndürmez
+    return [{key: value for key, value in word.items() if value is not None} for word in kelimeler]
+
+
+@pytest.fixture
+def sqlite_storage(tmp_path):
+    storage = SqliteStorage(str(tmp_path / "akademi.db"))
+    yield storage
+    storage.conn.close()
+
+
+@pytest.fixture
+def json_storage(tmp_path):
+    path = lambda name: str(tmp_path / name)
+    return JsonStorage(path("kelimeler.json"), path("puan.json"), path("kelimeler_backup.json"),
+                       path("puan_backup.json"), path("veri_journal.jsonl"), journal_max_bytes=10 ** 9)
+
+
+def test_save_all_round_trips(sqlite_storage):
+    assert sqlite_storage.load() == (None, None) and not sqlite_storage.initialized
+    kelimeler, score_data = sample_data()
+    sqlite_storage.save_all(kelimeler, score_data)
+    assert sqlite_storage.initialized
+    assert sqlite_storage.load() == (without_none(kelimeler), score_data)
+
+
+def test_journal_records_update_only_the_affected_rows(sqlite_storage):
+    kelimeler, score_data = sample_data()
+    sqlite_storage.save_all(kelimeler, score_data)
+
+    word = {"en": "plum", "tr": "erik", "wrong_count": 0, "wrong_test_count": 0, "added_date": "2026-01-03"}
+    kelimeler.append(word)
+    score_data["score"] += 1
+    sqlite_storage.save_record(word_record("add", word, score_data))
+    word["wrong_count"] = 1
+    word["interval"] = 0
+    score_data["wrong_words_list"].append("plum")
+    score_data["daily"]["2026-01-03"]["yanlis"] += 1
+    sqlite_storage.save_record(answer_record(word, score_data, "2026-01-03", test_type="en_tr", is_correct=False,
+                                             points=-2, answered_at="2026-01-03T10:00:00"))
+    kelimeler[0]["en"] = "apples"
+    sqlite_storage.save_record(word_record("edit", kelimeler[0], old_en="apple"))
+    sqlite_storage.save_record(word_record("delete", kelimeler[1]))
+    score_data["wrong_words_list"].remove("pear")
+    del kelimeler[1]
+    score_data["score"] = 3
+    sqlite_storage.save_record({"op": "score", **score_patch(score_data, [])})
+
+    assert sqlite_storage.load() == (without_none(kelimeler), score_data)
+    answers = sqlite_storage.conn.execute("SELECT en, test_type, is_correct, points, date FROM answers").fetchall()
+    assert answers == [("plum", "en_tr", 0, -2, "2026-01-03")]
+
+
+def test_migration_from_json_keeps_the_data(json_storage, sqlite_storage):
+    kelimeler, score_data = sample_data()
+    json_storage.save_all(kelimeler, score_data)
+    # Snapshot'tan sonraki günlük kayıtları da aktarılır
+    word = {"en": "plum", "tr": "erik", "wrong_count": 0, "wrong_test_count": 0, "added_date": "2026-01-03"}
+    kelimeler.append(word)
+    score_data["score"] += 1
+    json_storage.save_record(word_record("add", word, score_data), kelimeler, score_data)
+
+    assert migrate_json_to_sqlite(json_storage, sqlite_storage) == 3
+    assert sqlite_storage.load() == (without_none(kelimeler), score_data)
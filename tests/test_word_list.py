@@ -0,0 +1,28 @@
+from datetime import date
+
+from search_index import SearchIndex
+from word_index import WrongWordsIndex
+from word_list import WordQueryEngine
+
+TODAY = date(2026, 1, 10)
+KELIMELER = [{"en": "Istanbul", "tr": "İstanbul", "wrong_count": 0, "added_date": "2026-01-01"},
+             {"en": "ink", "tr": "mürekkep", "wrong_count": 0, "added_date": "2026-01-02"}]
+
+
+def run_query(arama, search_index=None):
+    wrong_index = WrongWordsIndex()
+    wrong_index.build(KELIMELER, [])
+    return WordQueryEngine().query(KELIMELER, 1, "Tümü", "Alfabetik", arama, TODAY, wrong_index,
+                                   search_index=search_index)
+
+
+def test_indexed_search_folds_turkish_capital_i():
+    search_index = SearchIndex()
+    search_index.build(KELIMELER)
+    total, words = run_query("İST", search_index)
+    assert total == 1 and words[0]["en"] == "Istanbul"
+
+
+def test_linear_search_ignores_case():
+    total, words = run_query("  INK ")
+    assert total == 1 and words[0]["en"] == "ink"
@@ -0,0 +1,87 @@
+from datetime import date
+
+import pytest
+
+import word_store
+from word_index import age_category_for_days, word_age_days
+from word_store import ColumnarWordStore, WordView
+
+TODAY = date(2026, 1, 10)
+
+
+@pytest.fixture(params=["numpy", "fallback"])
+def columnar(request, monkeypatch):
+    """Aynı testleri NumPy yolu ve saf Python (array) yolu ile çalıştır"""
+    if request.param == "numpy":
+        monkeypatch.setattr(word_store, "np", pytest.importorskip("numpy"))
+    else:
+        monkeypatch.setattr(word_store, "np", None)
+    return ColumnarWordStore
+
+
+def make_words():
+    return [{"en": "apple", "tr": "elma", "wrong_count": 0, "wrong_test_count": 0, "added_date": "2026-01-10"},
+            {"en": "pear", "tr": "armut", "wrong_count": 3, "added_date": "2026-01-01", "ease": 2.36},
+            {"en": "plum", "tr": "erik", "added_date": "bozuk tarih", "note": {"x": 1}},
+            {"en": "fig", "tr": "incir", "wrong_count": 1, "added_date": "2025-06-01", "due_date": "2026-01-11"}]
+
+
+def test_insert_and_remove_match_a_list_of_dicts(columnar):
+    words, store = make_words(), columnar(make_words())
+    extra = {"en": "kiwi", "tr": "kivi", "wrong_count": 0, "added_date": "2026-01-09", "last_wrong_date": None}
+    words.insert(1, dict(extra))
+    store.insert(1, extra)
+    words.append({"en": "lime", "tr": "misket limonu"})
+    store.append({"en": "lime", "tr": "misket limonu"})
+    assert store.to_words() == words
+
+    removed = store[2]
+    store.remove(removed)
+    words.pop(2)
+    del store[0]
+    words.pop(0)
+    assert store.to_words() == words
+    assert all(view._row == row for row, view in enumerate(store))
+
+
+def test_views_mutate_like_dicts(columnar):
+    words, store = make_words(), columnar(make_words())
+    for word in (words[1], store[1]):
+        word["wrong_count"] += 1
+        word["last_wrong_date"] = "2026-01-10"
+        word["interval"] = 6
+        word["added_date"] = "hatalı"
+        word.update(tr="armut (meyve)", ease=2.5)
+        del word["ease"]
+        word.setdefault("reps", 2)
+    assert isinstance(store[1], WordView)
+    assert dict(store[1]) == words[1]
+    assert store.to_words() == words
+    with pytest.raises(KeyError):
+        del store[1]["ease"]
+
+
+def test_deleted_view_is_detached_and_keeps_working(columnar):
+    store = columnar(make_words())
+    view = store[1]
+    del store[1]
+    assert view["en"] == "pear" and view["wrong_count"] == 3
+    view["wrong_count"] = 4
+    assert dict(view)["wrong_count"] == 4
+    assert [word["en"] for word in store] == ["apple", "plum", "fig"]
+
+    kept = store[0]
+    store.clear()
+    assert len(store) == 0 and kept["tr"] == "elma"
+    store[:] = make_words()
+    assert store.to_words() == make_words()
+
+
+def test_age_columns_match_per_word_ages(columnar):
+    words = make_words()
+    store = columnar(words)
+    ages = [word_age_days(word, TODAY) for word in words]
+    assert [int(age) for age in store.age_days(TODAY)] == ages
+    counts = store.age_category_counts(TODAY)
+    for category in counts:
+        assert counts[category] == sum(age_category_for_days(age) == category for age in ages)
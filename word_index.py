@@ -0,0 +1,243 @@
+import random
+from datetime import datetime
+from functools import lru_cache
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+AGE_CATEGORIES = ("bugun", "yeni", "orta", "eski")
+SELECTION_PROBABILITIES = {
+    "en_tr": (0.4, 0.3, 0.2, 0.1),
+    "tr_en": (0.4, 0.3, 0.2, 0.1),
+    "tekrar": (0.0, 0.2, 0.3, 0.5),
+}
+
+
+@lru_cache(maxsize=8192)
+def parse_day_ordinal(date_str):
+    """'YYYY-MM-DD' metnini gün numarasına çevir (aynı tarih tekrar parse edilmez)"""
+    try:
+        return datetime.strptime(date_str, "%Y-%m-%d").date().toordinal()
+    except (TypeError, ValueError):
+        return None
+
+
+def word_age_days(word, today):
+    """Kelimenin verilen güne göre yaşı (tarih yoksa veya hatalıysa 0)"""
+    ordinal = parse_day_ordinal(word.get("added_date"))
+    if ordinal is None:
+        return 0
+    return today.toordinal() - ordinal
+
+
+def all_age_days(kelimeler, today):
+    """Tüm kelimelerin yaşı tek geçişte (word_age_days ile aynı sonuç)
+
+    Tarihler önbellekli gün numaralarına çevrilir ve bugünden tek seferde
+    çıkarılır; NumPy varsa çıkarma vektöreldir. Sütun tabanlı depo kendi
+    gün numarası sütununu kullanır.
+    """
+    age_days = getattr(kelimeler, "age_days", None)
+    if age_days is not None:
+        return age_days(today)
+    ordinals = [parse_day_ordinal(word.get("added_date")) or 0 for word in kelimeler]
+    today_ordinal = today.toordinal()
+    if np is not None:
+        ordinals = np.array(ordinals, dtype=np.int64)
+        return np.where(ordinals > 0, today_ordinal - ordinals, 0)
+    return [today_ordinal - ordinal if ordinal else 0 for ordinal in ordinals]
+
+
+def age_category_indexes(ages):
+    """Yaş dizisinden AGE_CATEGORIES indeksleri (age_category_for_days ile aynı)"""
+    if np is not None:
+        ages = np.asarray(ages)
+        return np.where(ages == 0, 0, np.searchsorted(np.array([6, 29]), ages, side="left") + 1)
+    return [0 if age == 0 else 1 if age <= 6 else 2 if age <= 29 else 3 for age in ages]
+
+
+def age_category_for_days(age_days):
+    """Gün sayısından yaş kategorisi"""
+    if age_days == 0:
+        return "bugun"
+    elif age_days <= 6:
+        return "yeni"
+    elif age_days <= 29:
+        return "orta"
+    else:
+        return "eski"
+
+
+class AgeBucketIndex:
+    """Kelimeleri yaş kategorilerine göre gruplayan, gün bazlı indeks
+
+    Her kelimenin o günkü yaşı da saklanır; yaş soran yerler (puan, liste,
+    soru bilgisi) tarihi yeniden parse etmez.
+    """
+
+    def __init__(self):
+        self.today = None
+        self.buckets = {category: [] for category in AGE_CATEGORIES}
+        self.positions = {}
+        self.ages = {}
+
+    def build(self, kelimeler, today):
+        """İndeksi sıfırdan kur (veri yüklendiğinde veya gün değiştiğinde)"""
+        self.today = today
+        self.buckets = {category: [] for category in AGE_CATEGORIES}
+        self.positions = {}
+        self.ages = {}
+        ages = all_age_days(kelimeler, today)
+        for word, age, index in zip(kelimeler, ages, age_category_indexes(ages)):
+            category = AGE_CATEGORIES[index]
+            bucket = self.buckets[category]
+            self.positions[id(word)] = (category, len(bucket))
+            self.ages[id(word)] = int(age)
+            bucket.append(word)
+
+    def ensure_day(self, kelimeler, today):
+        """Gün değiştiyse indeksi yeniden kur"""
+        if self.today != today:
+            self.build(kelimeler, today)
+
+    def category_of(self, word):
+        """Kelimenin indeksteki yaş kategorisi"""
+        return age_category_for_days(self.age_of(word))
+
+    def age_of(self, word):
+        """Kelimenin indeks gününe göre yaşı (indekste yoksa tarihten hesaplanır)"""
+        age = self.ages.get(id(word))
+        return word_age_days(word, self.today) if age is None else age
+
+    def add(self, word):
+        """Kelimeyi uygun kategoriye ekle"""
+        age = word_age_days(word, self.today)
+        category = age_category_for_days(age)
+        bucket = self.buckets[category]
+        self.positions[id(word)] = (category, len(bucket))
+        self.ages[id(word)] = age
+        bucket.append(word)
+
+    def remove(self, word):
+        """Kelimeyi indeksten O(1) çıkar (son eleman boşluğa taşınır)"""
+        entry = self.positions.pop(id(word), None)
+        self.ages.pop(id(word), None)
+        if entry is None:
+            return
+        category, index = entry
+        bucket = self.buckets[category]
+        last = bucket.pop()
+        if index < len(bucket):
+            bucket[index] = last
+            self.positions[id(last)] = (category, index)
+
+    def update(self, word):
+        """Eklenme tarihi değişmiş olabilecek kelimeyi yeniden yerleştir"""
+        entry = self.positions.get(id(word))
+        age = word_age_days(word, self.today)
+        if entry is not None and entry[0] == age_category_for_days(age):
+            self.ages[id(word)] = age
+            return
+        self.remove(word)
+        self.add(word)
+
+    def counts(self):
+        """Kategori başına kelime sayısı"""
+        return {category: len(self.buckets[category]) for category in AGE_CATEGORIES}
+
+    def select(self, test_type, rng=random):
+        """Test türünün olasılıklarına göre O(1) kelime seç"""
+        if not self.positions:
+            return None
+        probabilities = SELECTION_PROBABILITIES.get(test_type)
+        if probabilities is None:
+            return self._random_word(rng)
+        categories = [(self.buckets[c], p) for c, p in zip(AGE_CATEGORIES, probabilities)
+                      if self.buckets[c] and p > 0]
+        if not categories:
+            return self._random_word(rng)
+        total_prob = sum(p for _, p in categories)
+        rand_val = rng.random()
+        cumulative_prob = 0
+        for bucket, p in categories:
+            cumulative_prob += p / total_prob
+            if rand_val <= cumulative_prob:
+                return rng.choice(bucket)
+        return rng.choice(categories[-1][0])
+
+    def _random_word(self, rng):
+        """Tüm kelimeler arasından eşit olasılıkla seç"""
+        index = rng.randrange(len(self.positions))
+        for category in AGE_CATEGORIES:
+            bucket = self.buckets[category]
+            if index < len(bucket):
+                return bucket[index]
+            index -= len(bucket)
+
+
+class WrongWordsIndex:
+    """Kelime kimliği (en) → kelime sözlüğü ve küme destekli yanlış listesi"""
+
+    def __init__(self):
+        self.words_by_id = {}
+        self.wrong_list = []
+        self.wrong_set = set()
+
+    def build(self, kelimeler, wrong_list):
+        """İndeksi kur; wrong_list kaydedilen listenin kendisidir ve sırası korunur"""
+        self.words_by_id = {}
+        for word in kelimeler:
+            self.words_by_id.setdefault(word["en"], word)
+        self.wrong_list = wrong_list
+        self.wrong_set = set(wrong_list)
+
+    def add_word(self, word):
+        """Yeni kelimeyi sözlüğe ekle"""
+        self.words_by_id.setdefault(word["en"], word)
+
+    def remove_word(self, word):
+        """Silinen kelimeyi sözlükten ve yanlış listesinden çıkar"""
+        if self.words_by_id.get(word["en"]) is word:
+            del self.words_by_id[word["en"]]
+        self.discard(word["en"])
+
+    def rename_word(self, word, old_en):
+        """Kimliği değişen kelimeyi sözlükte ve yanlış listesinde yeniden adlandır"""
+        if old_en == word["en"]:
+            return
+        if self.words_by_id.get(old_en) is word:
+            del self.words_by_id[old_en]
+        self.words_by_id.setdefault(word["en"], word)
+        if old_en in self.wrong_set:
+            self.wrong_set.discard(old_en)
+            if word["en"] in self.wrong_set:
+                self.wrong_list.remove(old_en)
+            else:
+                self.wrong_list[self.wrong_list.index(old_en)] = word["en"]
+                self.wrong_set.add(word["en"])
+
+    def get(self, word_id):
+        """Kimliğe göre kelime (yoksa None)"""
+        return self.words_by_id.get(word_id)
+
+    def contains(self, word_id):
+        """Kelime yanlış listesinde mi (O(1))"""
+        return word_id in self.wrong_set
+
+    def add(self, word_id):
+        """Yanlış listesinin sonuna ekle"""
+        if word_id not in self.wrong_set:
+            self.wrong_set.add(word_id)
+            self.wrong_list.append(word_id)
+
+    def discard(self, word_id):
+        """Yanlış listesinden çıkar"""
+        if word_id in self.wrong_set:
+            self.wrong_set.discard(word_id)
+            self.wrong_list.remove(word_id)
+
+    def wrong_words(self):
+        """Yanlış listesindeki kelimeler, liste sırasıyla (O(k))"""
+        return [self.words_by_id[word_id] for word_id in self.wrong_list if word_id in self.words_by_id]
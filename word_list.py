@@ -0,0 +1,149 @@
+from datetime import timedelta
+
+WORD_FILTERS = ("Tümü", "Bugün Eklenenler", "Bu Hafta", "Yanlış Olanlar", "Yanlış Listesindekiler")
+WORD_SORTS = ("En Yeni", "En Eski", "Alfabetik", "En Çok Yanlış")
+
+
+def filter_words(kelimeler, filtre, siralama, arama, today, wrong_index):
+    """Kelime Listesi sekmesinin filtre, arama ve sıralama adımları"""
+    today_str = today.strftime("%Y-%m-%d")
+    if filtre == "Bugün Eklenenler":
+        filtered_words = [k for k in kelimeler if k.get("added_date") == today_str]
+    elif filtre == "Bu Hafta":
+        week_ago = (today - timedelta(days=7)).strftime("%Y-%m-%d")
+        filtered_words = [k for k in kelimeler if k.get("added_date", "") >= week_ago]
+    elif filtre == "Yanlış Olanlar":
+        filtered_words = [k for k in kelimeler if k.get("wrong_count", 0) > 0]
+    elif filtre == "Yanlış Listesindekiler":
+        filtered_words = wrong_index.wrong_words()
+    else:
+        filtered_words = list(kelimeler)
+
+    if arama:
+        arama = arama.lower()
+        filtered_words = [k for k in filtered_words if arama in k["en"].lower() or arama in k["tr"].lower()]
+
+    if siralama == "En Yeni":
+        filtered_words.sort(key=lambda x: x.get("added_date", ""), reverse=True)
+    elif siralama == "En Eski":
+        filtered_words.sort(key=lambda x: x.get("added_date", ""))
+    elif siralama == "Alfabetik":
+        filtered_words.sort(key=lambda x: x["en"])
+    elif siralama == "En Çok Yanlış":
+        filtered_words.sort(key=lambda x: x.get("wrong_count", 0), reverse=True)
+    return filtered_words
+
+
+SORT_KEYS = {
+    "En Yeni": (lambda x: x.get("added_date", ""), True),
+    "En Eski": (lambda x: x.get("added_date", ""), False),
+    "Alfabetik": (lambda x: x["en"], False),
+    "En Çok Yanlış": (lambda x: x.get("wrong_count", 0), True),
+}
+DATE_SORTS = ("En Yeni", "En Eski")
+QUERY_CACHE_SIZE = 32
+
+
+def bisect_sorted(keys, value, descending, right=False):
+    """Artan veya azalan sıralı anahtar listesinde bisect_left/bisect_right"""
+    lo, hi = 0, len(keys)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        key = keys[mid]
+        if descending:
+            before = key > value or (right and key == value)
+        else:
+            before = key < value or (right and key == value)
+        if before:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+class WordQueryEngine:
+    """Kelime Listesi için sıralı indeksler + sorgu sonucu önbelleği
+
+    İndeksler ve önbellek veri revizyonuna bağlıdır; revizyon değişince (kelime
+    eklendi/düzenlendi/cevaplandı) hepsi atılır ve ilk sorguda tembel olarak
+    yeniden kurulur. Aynı sorgunun başka sayfası yalnızca dilimlenir.
+    """
+
+    def __init__(self, cache_size=QUERY_CACHE_SIZE):
+        self.cache_size = cache_size
+        self.revision = None
+        self.kelimeler = []
+        self.indexes = {}
+        self.cache = {}
+
+    def sync(self, kelimeler, revision):
+        """Veri revizyonu değiştiyse indeksleri ve önbelleği geçersiz kıl"""
+        if revision != self.revision:
+            self.revision = revision
+            self.kelimeler = kelimeler
+            self.indexes = {}
+            self.cache = {}
+
+    def index(self, siralama):
+        """Sıralama için (kelimeler, anahtarlar, azalan mı) indeksi"""
+        entry = self.indexes.get(siralama)
+        if entry is None:
+            key, descending = SORT_KEYS[siralama]
+            words = sorted(self.kelimeler, key=key, reverse=descending)
+            entry = (words, [key(word) for word in words], descending)
+            self.indexes[siralama] = entry
+        return entry
+
+    def query(self, kelimeler, revision, filtre, siralama, arama, today, wrong_index, offset=0, limit=None,
+              search_index=None, fuzzy=False):
+        """(toplam sonuç sayısı, istenen sayfadaki kelimeler)
+
+        search_index verilirse arama n-gram indeksinden (Türkçe harf katlamalı)
+        yanıtlanır; fuzzy=True iken yakın yazımlı kelimeler de eklenir.
+        """
+        self.sync(kelimeler, revision)
+        # Küçük harfe çevirme indeks dışı aramada yapılır: "İ".lower() birleşik nokta ekler, fold ile eşleşmez
+        arama = (arama or "").strip()
+        cache_key = (today, filtre, siralama, arama, search_index is not None, fuzzy)
+        results = self.cache.pop(cache_key, None)
+        if results is None:
+            results = self._run(filtre, siralama, arama, today, wrong_index, search_index, fuzzy)
+            if len(self.cache) >= self.cache_size:
+                self.cache.pop(next(iter(self.cache)))
+        self.cache[cache_key] = results
+        end = None if limit is None else offset + limit
+        return len(results), results[offset:end]
+
+    def _run(self, filtre, siralama, arama, today, wrong_index, search_index=None, fuzzy=False):
+        if siralama not in SORT_KEYS:
+            return filter_words(self.kelimeler, filtre, siralama, arama, today, wrong_index)
+        words, keys, descending = self.index(siralama)
+        today_str = today.strftime("%Y-%m-%d")
+        week_ago = (today - timedelta(days=7)).strftime("%Y-%m-%d")
+        if filtre == "Yanlış Listesindekiler":
+            words = sorted(wrong_index.wrong_words(), key=SORT_KEYS[siralama][0], reverse=descending)
+        elif filtre in ("Bugün Eklenenler", "Bu Hafta") and siralama in DATE_SORTS:
+            if filtre == "Bu Hafta":
+                bounds = (week_ago, None) if not descending else (None, week_ago)
+            else:
+                bounds = (today_str, today_str)
+            start = 0 if bounds[0] is None else bisect_sorted(keys, bounds[0], descending)
+            end = len(keys) if bounds[1] is None else bisect_sorted(keys, bounds[1], descending, right=True)
+            words = words[start:end]
+        elif filtre == "Yanlış Olanlar" and siralama == "En Çok Yanlış":
+            words = words[:bisect_sorted(keys, 0, descending)]
+        elif filtre == "Bugün Eklenenler":
+            words = [k for k in words if k.get("added_date") == today_str]
+        elif filtre == "Bu Hafta":
+            words = [k for k in words if k.get("added_date", "") >= week_ago]
+        elif filtre == "Yanlış Olanlar":
+            words = [k for k in words if k.get("wrong_count", 0) > 0]
+        if arama and search_index is not None:
+            matched = search_index.search(arama)
+            if fuzzy:
+                matched = set(matched) | search_index.fuzzy_search(arama)
+            words = [k for k in words if k["en"] in matched]
+        elif arama:
+            arama = arama.lower()
+            words = [k for k in words if arama in k["en"].lower() or arama in k["tr"].lower()]
+        return words
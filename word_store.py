@@ -0,0 +1,283 @@
+import math
+import sys
+from array import array
+from collections.abc import MutableMapping, MutableSequence
+from datetime import date
+
+from word_index import AGE_CATEGORIES, age_category_indexes, parse_day_ordinal
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Sütun tipleri: "int" → array('i'), eksik değer -1; "day" → gün numarası
+# (array('i')), eksik değer 0; "float" → array('d'), eksik değer NaN. Sütuna
+# sığmayan değerler (ör. hatalı tarih metni) o satırın ek alanlarında saklanır.
+COLUMN_TYPES = {
+    "wrong_count": "int",
+    "wrong_test_count": "int",
+    "added_date": "day",
+    "last_wrong_date": "day",
+    "due_date": "day",
+    "interval": "int",
+    "reps": "int",
+    "ease": "float",
+}
+TEXT_COLUMNS = ("en", "tr")
+FIELD_ORDER = TEXT_COLUMNS + tuple(COLUMN_TYPES)
+ARRAY_CODES = {"int": "i", "day": "i", "float": "d"}
+INT_LIMIT = 2 ** 31
+MISSING = {"int": -1, "day": 0, "float": math.nan}
+_UNSET = object()
+
+
+def encode(kind, value):
+    """Değeri sütun tipine çevir; sığmıyorsa _UNSET"""
+    if kind == "int":
+        return value if type(value) is int and 0 <= value < INT_LIMIT else _UNSET
+    if kind == "float":
+        return float(value) if type(value) in (int, float) and not math.isnan(value) else _UNSET
+    ordinal = parse_day_ordinal(value) if isinstance(value, str) else None
+    if ordinal is None or date.fromordinal(ordinal).strftime("%Y-%m-%d") != value:
+        return _UNSET
+    return ordinal
+
+
+def decode(kind, value):
+    """Sütun değerini kelime sözlüğündeki biçimine çevir; eksikse _UNSET"""
+    if kind == "float":
+        return _UNSET if math.isnan(value) else value
+    if value == MISSING[kind]:
+        return _UNSET
+    return date.fromordinal(value).strftime("%Y-%m-%d") if kind == "day" else value
+
+
+class WordView(MutableMapping):
+    """Depodaki tek satırın sözlük gibi görünümü (kelime dict'inin yerine geçer)"""
+
+    __slots__ = ("_store", "_row")
+
+    def __init__(self, store, row):
+        self._store = store
+        self._row = row
+
+    def __getitem__(self, key):
+        value = self._store.get_field(self._row, key)
+        if value is _UNSET:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        self._store.set_field(self._row, key, value)
+
+    def __delitem__(self, key):
+        if not self._store.delete_field(self._row, key):
+            raise KeyError(key)
+
+    def __iter__(self):
+        store, row = self._store, self._row
+        extras = store.extras.get(row, {})
+        for key in FIELD_ORDER:
+            if key in extras or store.get_field(row, key) is not _UNSET:
+                yield key
+        for key in extras:
+            if key not in FIELD_ORDER:
+                yield key
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return f"WordView({dict(self)!r})"
+
+
+class ColumnarWordStore(MutableSequence):
+    """Kelime listesinin sütun tabanlı, sıkıştırılmış hali
+
+    en/tr metinleri intern edilmiş listelerde, sayılar ve tarihler tipli
+    dizilerde tutulur. Liste gibi davranır; elemanlar sözlük yerine geçen
+    WordView nesneleridir ve kimlikleri (id) satır silinse bile korunur.
+    """
+
+    def __init__(self, words=()):
+        self.text = {key: [] for key in TEXT_COLUMNS}
+        self.columns = {key: array(ARRAY_CODES[kind]) for key, kind in COLUMN_TYPES.items()}
+        self.extras = {}
+        self.views = []
+        self.extend(words)
+
+    # --- satır erişimi ---
+
+    def get_field(self, row, key):
+        extras = self.extras.get(row)
+        if extras and key in extras:
+            return extras[key]
+        if key in self.text:
+            value = self.text[key][row]
+            return _UNSET if value is None else value
+        kind = COLUMN_TYPES.get(key)
+        if kind is None:
+            return _UNSET
+        return decode(kind, self.columns[key][row])
+
+    def set_field(self, row, key, value):
+        extras = self.extras.get(row)
+        if key in self.text and isinstance(value, str):
+            self.text[key][row] = sys.intern(value)
+        elif key in COLUMN_TYPES and encode(COLUMN_TYPES[key], value) is not _UNSET:
+            self.columns[key][row] = encode(COLUMN_TYPES[key], value)
+        else:
+            self._clear_column(row, key)
+            self.extras.setdefault(row, {})[key] = value
+            return
+        if extras and key in extras:
+            del extras[key]
+            if not extras:
+                del self.extras[row]
+
+    def delete_field(self, row, key):
+        found = self.get_field(row, key) is not _UNSET
+        extras = self.extras.get(row)
+        if extras and key in extras:
+            del extras[key]
+            if not extras:
+                del self.extras[row]
+        self._clear_column(row, key)
+        return found
+
+    def _clear_column(self, row, key):
+        if key in self.text:
+            self.text[key][row] = None
+        elif key in COLUMN_TYPES:
+            self.columns[key][row] = MISSING[COLUMN_TYPES[key]]
+
+    # --- liste arayüzü ---
+
+    def __len__(self):
+        return len(self.views)
+
+    def __getitem__(self, index):
+        return self.views[index]
+
+    def __setitem__(self, index, word):
+        if isinstance(index, slice):
+            if index != slice(None):
+                raise TypeError("Yalnızca tam dilim ([:]) atanabilir")
+            words = [dict(w) for w in word]
+            self.clear()
+            self.extend(words)
+            return
+        view = self.views[index]
+        for key in list(view):
+            self.delete_field(view._row, key)
+        for key, value in dict(word).items():
+            self.set_field(view._row, key, value)
+
+    def insert(self, index, word):
+        index = min(max(index + len(self) if index < 0 else index, 0), len(self))
+        word = dict(word)
+        for key in TEXT_COLUMNS:
+            self.text[key].insert(index, None)
+        for key, kind in COLUMN_TYPES.items():
+            self.columns[key].insert(index, MISSING[kind])
+        if index < len(self.views):
+            self._shift_rows(index, 1)
+        view = WordView(self, index)
+        self.views.insert(index, view)
+        for key, value in word.items():
+            self.set_field(index, key, value)
+
+    def __delitem__(self, index):
+        if isinstance(index, slice):
+            for i in sorted(range(*index.indices(len(self))), reverse=True):
+                del self[i]
+            return
+        row = range(len(self))[index]
+        self._detach(self.views[row])
+        for key in TEXT_COLUMNS:
+            del self.text[key][row]
+        for key in COLUMN_TYPES:
+            del self.columns[key][row]
+        self.extras.pop(row, None)
+        self.views.pop(row)
+        self._shift_rows(row, -1)
+
+    def _shift_rows(self, start, delta):
+        """start'tan itibaren satır numaralarını kaydır (görünümler ve ek alanlar)"""
+        for view in self.views[start:]:
+            view._row += delta
+        if self.extras:
+            self.extras = {row + delta if row >= start else row: extras for row, extras in self.extras.items()}
+
+    def remove(self, word):
+        """Kelimeyi sil; bu depoya ait görünümse satırı doğrudan bulunur"""
+        if isinstance(word, WordView) and word._store is self:
+            del self[word._row]
+        else:
+            super().remove(word)
+
+    @staticmethod
+    def _detach(view):
+        """Silinen satırın görünümünü kendi tek satırlık deposuna taşı (dict gibi kullanılmaya devam eder)"""
+        detached = ColumnarWordStore([dict(view)])
+        detached.views[0] = view
+        view._store, view._row = detached, 0
+
+    def clear(self):
+        """Tüm satırları sil; eski görünümler eski sütunları okumaya devam eder"""
+        old = ColumnarWordStore.__new__(ColumnarWordStore)
+        old.text, old.columns, old.extras, old.views = self.text, self.columns, self.extras, self.views
+        for view in old.views:
+            view._store = old
+        self.__init__()
+
+    def to_words(self):
+        """JSON'a yazılabilir düz sözlük listesi"""
+        return [dict(view) for view in self.views]
+
+    # --- vektörel işlemler ---
+
+    def column(self, key):
+        """Sayısal sütun (NumPy varsa ndarray kopyası, yoksa array)"""
+        values = self.columns[key]
+        if np is not None:
+            # Kopya alınır: dışa açık bir tampon varken array büyütülemez
+            return np.frombuffer(values, dtype=values.typecode).copy() if len(values) else np.zeros(0, values.typecode)
+        return values
+
+    def age_days(self, today):
+        """Tüm kelimelerin yaşı (gün); tarihi olmayan veya hatalı olan 0 (word_age_days ile aynı)"""
+        today_ordinal = today.toordinal()
+        added = self.column("added_date")
+        if np is not None:
+            ages = np.where(added > 0, today_ordinal - added.astype(np.int64), 0)
+        else:
+            ages = [today_ordinal - value if value > 0 else 0 for value in added]
+        for row, extras in self.extras.items():
+            if "added_date" in extras:
+                ordinal = parse_day_ordinal(extras["added_date"])
+                ages[row] = 0 if ordinal is None else today_ordinal - ordinal
+        return ages
+
+    def age_categories(self, today):
+        """Her satırın yaş kategorisi indeksi (AGE_CATEGORIES sırasıyla, age_category_for_days ile aynı)"""
+        return age_category_indexes(self.age_days(today))
+
+    def age_category_counts(self, today):
+        """Yaş kategorisi başına kelime sayısı"""
+        counts = dict.fromkeys(AGE_CATEGORIES, 0)
+        if np is not None:
+            bins = np.bincount(self.age_categories(today), minlength=len(AGE_CATEGORIES))
+            return {category: int(bins[i]) for i, category in enumerate(AGE_CATEGORIES)}
+        for index in self.age_categories(today):
+            counts[AGE_CATEGORIES[index]] += 1
+        return counts
+
+
+def plain_words(kelimeler):
+    """JSON'a yazmak için kelime listesini düz sözlük listesine çevir"""
+    if isinstance(kelimeler, ColumnarWordStore):
+        return kelimeler.to_words()
+    # Temel kelime görünümleri (BaseWord) de sözlüğe çevrilir
+    return [word if isinstance(word, dict) else dict(word) for word in kelimeler]